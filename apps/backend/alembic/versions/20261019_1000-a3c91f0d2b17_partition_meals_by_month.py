@@ -0,0 +1,119 @@
+"""partition meals by month
+
+Revision ID: a3c91f0d2b17
+Revises: 229b9e2a7344
+Create Date: 2026-10-19 10:00:00.000000+00:00
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.partitions import ensure_meal_partitions
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c91f0d2b17'
+down_revision = '229b9e2a7344'
+branch_labels = None
+depends_on = None
+
+
+MEAL_COLUMNS = (
+    "id, user_id, meal_date, meal_time, meal_type, meal_name, description, "
+    "calories, protein_g, carbs_g, fats_g, fiber_g, water_ml, notes, "
+    "created_at, updated_at"
+)
+
+OLD_INDEXES = ("ix_meals_id", "ix_meals_user_id", "ix_meals_meal_date")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Move the existing table out of the way, keeping its id sequence
+    op.execute("ALTER TABLE meals RENAME TO meals_unpartitioned")
+    op.execute("ALTER TABLE meals_unpartitioned RENAME CONSTRAINT meals_pkey TO meals_unpartitioned_pkey")
+    for index_name in OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER TABLE meals_unpartitioned ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE meals_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE meals (
+            id INTEGER NOT NULL DEFAULT nextval('meals_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            meal_date DATE NOT NULL,
+            meal_time TIME WITHOUT TIME ZONE,
+            meal_type VARCHAR(50) NOT NULL,
+            meal_name VARCHAR(200),
+            description TEXT,
+            calories INTEGER,
+            protein_g FLOAT,
+            carbs_g FLOAT,
+            fats_g FLOAT,
+            fiber_g FLOAT,
+            water_ml INTEGER,
+            notes TEXT,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, meal_date)
+        ) PARTITION BY RANGE (meal_date)
+        """
+    )
+    op.execute("ALTER SEQUENCE meals_id_seq OWNED BY meals.id")
+
+    # Indexes on the parent are created on every partition automatically
+    op.create_index("ix_meals_id", "meals", ["id"])
+    op.create_index("ix_meals_user_id", "meals", ["user_id"])
+    op.create_index("ix_meals_meal_date", "meals", ["meal_date"])
+    op.create_index("ix_meals_user_id_meal_date", "meals", ["user_id", "meal_date"])
+
+    # One partition per month of existing data, plus the months ahead
+    oldest = conn.execute(sa.text("SELECT min(meal_date) FROM meals_unpartitioned")).scalar()
+    ensure_meal_partitions(conn, months_ahead=3, start=oldest or date.today())
+
+    op.execute(f"INSERT INTO meals ({MEAL_COLUMNS}) SELECT {MEAL_COLUMNS} FROM meals_unpartitioned")
+    op.execute("DROP TABLE meals_unpartitioned")
+    op.execute("ANALYZE meals")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE meals RENAME TO meals_partitioned")
+    op.execute("ALTER TABLE meals_partitioned RENAME CONSTRAINT meals_pkey TO meals_partitioned_pkey")
+    for index_name in OLD_INDEXES + ("ix_meals_user_id_meal_date",):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER TABLE meals_partitioned ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE meals_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE meals (
+            id INTEGER NOT NULL DEFAULT nextval('meals_id_seq') PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            meal_date DATE NOT NULL,
+            meal_time TIME WITHOUT TIME ZONE,
+            meal_type VARCHAR(50) NOT NULL,
+            meal_name VARCHAR(200),
+            description TEXT,
+            calories INTEGER,
+            protein_g FLOAT,
+            carbs_g FLOAT,
+            fats_g FLOAT,
+            fiber_g FLOAT,
+            water_ml INTEGER,
+            notes TEXT,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE meals_id_seq OWNED BY meals.id")
+    op.create_index("ix_meals_id", "meals", ["id"])
+    op.create_index("ix_meals_user_id", "meals", ["user_id"])
+    op.create_index("ix_meals_meal_date", "meals", ["meal_date"])
+
+    op.execute(f"INSERT INTO meals ({MEAL_COLUMNS}) SELECT {MEAL_COLUMNS} FROM meals_partitioned")
+    op.execute("DROP TABLE meals_partitioned CASCADE")
@@ -0,0 +1,41 @@
+"""add measurement covering index
+
+Revision ID: b7e4d2a9c105
+Revises: a3c91f0d2b17
+Create Date: 2026-10-19 11:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4d2a9c105'
+down_revision = 'a3c91f0d2b17'
+branch_labels = None
+depends_on = None
+
+
+INCLUDED_COLUMNS = [
+    "id", "weight_kg", "body_fat_percentage", "muscle_mass_kg", "bmi",
+    "neck_cm", "chest_cm", "waist_cm", "abdomen_cm", "hips_cm",
+    "right_bicep_cm", "left_bicep_cm", "right_forearm_cm", "left_forearm_cm",
+    "right_thigh_cm", "left_thigh_cm", "right_calf_cm", "left_calf_cm",
+    "bicep_skinfold_mm", "tricep_skinfold_mm", "subscapular_skinfold_mm",
+    "suprailiac_skinfold_mm", "abdominal_skinfold_mm", "thigh_skinfold_mm",
+]
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_body_measurements_user_id_measurement_date",
+        "body_measurements",
+        ["user_id", "measurement_date"],
+        postgresql_include=INCLUDED_COLUMNS,
+    )
+    # Index-only scans also rely on the visibility map, which autovacuum
+    # maintains; VACUUM cannot run inside the migration transaction.
+    op.execute("ANALYZE body_measurements")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_body_measurements_user_id_measurement_date", table_name="body_measurements")
@@ -0,0 +1,53 @@
+"""add exercise records
+
+Revision ID: c5a8e3f1d246
+Revises: b7e4d2a9c105
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+Existing history is not folded in here; run
+scripts/rebuild_exercise_records.py after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a8e3f1d246'
+down_revision = 'b7e4d2a9c105'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exercise_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("exercise_key", sa.String(length=200), nullable=False),
+        sa.Column("exercise_name", sa.String(length=200), nullable=False),
+        sa.Column("max_weight_kg", sa.Float(), nullable=True),
+        sa.Column("max_weight_date", sa.Date(), nullable=True),
+        sa.Column("best_e1rm_kg", sa.Float(), nullable=True),
+        sa.Column("best_e1rm_date", sa.Date(), nullable=True),
+        sa.Column("best_e1rm_brzycki_kg", sa.Float(), nullable=True),
+        sa.Column("best_volume_kg", sa.Float(), nullable=True),
+        sa.Column("best_volume_date", sa.Date(), nullable=True),
+        sa.Column("total_volume_kg", sa.Float(), nullable=False),
+        sa.Column("total_sets", sa.Integer(), nullable=False),
+        sa.Column("session_count", sa.Integer(), nullable=False),
+        sa.Column("first_performed", sa.Date(), nullable=True),
+        sa.Column("last_performed", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "exercise_key", name="uq_exercise_records_user_exercise"),
+    )
+    op.create_index("ix_exercise_records_id", "exercise_records", ["id"])
+    op.create_index("ix_exercise_records_user_id", "exercise_records", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_exercise_records_user_id", table_name="exercise_records")
+    op.drop_index("ix_exercise_records_id", table_name="exercise_records")
+    op.drop_table("exercise_records")
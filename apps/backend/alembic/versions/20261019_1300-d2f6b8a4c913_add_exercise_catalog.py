@@ -0,0 +1,83 @@
+"""add exercise catalog
+
+Revision ID: d2f6b8a4c913
+Revises: c5a8e3f1d246
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+Creates the canonical exercise catalog with a pg_trgm-indexed alias table,
+seeds it, and links existing exercises by exact or fuzzy name match.
+Run scripts/rebuild_exercise_records.py afterwards so records are
+regrouped under the canonical keys.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.config import get_settings
+from src.database.exercise_catalog import link_exercises_to_catalog, seed_exercise_catalog
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6b8a4c913'
+down_revision = 'c5a8e3f1d246'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "exercise_catalog",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("exercise_key", sa.String(length=200), nullable=False),
+        sa.Column("exercise_type", sa.String(length=50), nullable=True),
+        sa.Column("muscle_group", sa.String(length=50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("exercise_key"),
+    )
+    op.create_index("ix_exercise_catalog_id", "exercise_catalog", ["id"])
+
+    op.create_table(
+        "exercise_aliases",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("catalog_id", sa.Integer(), nullable=False),
+        sa.Column("alias", sa.String(length=200), nullable=False),
+        sa.Column("alias_key", sa.String(length=200), nullable=False),
+        sa.ForeignKeyConstraint(["catalog_id"], ["exercise_catalog.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("alias_key"),
+    )
+    op.create_index("ix_exercise_aliases_id", "exercise_aliases", ["id"])
+    op.create_index("ix_exercise_aliases_catalog_id", "exercise_aliases", ["catalog_id"])
+    op.create_index(
+        "ix_exercise_aliases_alias_key_trgm",
+        "exercise_aliases",
+        ["alias_key"],
+        postgresql_using="gin",
+        postgresql_ops={"alias_key": "gin_trgm_ops"},
+    )
+
+    op.add_column("exercises", sa.Column("catalog_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "exercises_catalog_id_fkey", "exercises", "exercise_catalog", ["catalog_id"], ["id"]
+    )
+    op.create_index("ix_exercises_catalog_id", "exercises", ["catalog_id"])
+
+    conn = op.get_bind()
+    seed_exercise_catalog(conn)
+    link_exercises_to_catalog(conn, get_settings().EXERCISE_MATCH_THRESHOLD)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_exercises_catalog_id", table_name="exercises")
+    op.drop_constraint("exercises_catalog_id_fkey", "exercises", type_="foreignkey")
+    op.drop_column("exercises", "catalog_id")
+
+    op.drop_index("ix_exercise_aliases_alias_key_trgm", table_name="exercise_aliases")
+    op.drop_index("ix_exercise_aliases_catalog_id", table_name="exercise_aliases")
+    op.drop_index("ix_exercise_aliases_id", table_name="exercise_aliases")
+    op.drop_table("exercise_aliases")
+    op.drop_index("ix_exercise_catalog_id", table_name="exercise_catalog")
+    op.drop_table("exercise_catalog")
@@ -0,0 +1,53 @@
+"""add full text search
+
+Revision ID: e8a1c4d7f052
+Revises: d2f6b8a4c913
+Create Date: 2026-10-19 14:00:00.000000+00:00
+
+Adds stored generated search_vector columns (Portuguese + English) with
+GIN indexes. Adding a stored generated column rewrites the table, so
+run this in a maintenance window on large installations. On the
+partitioned meals table the column and index propagate to every partition.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.database.search import search_vector_sql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a1c4d7f052'
+down_revision = 'd2f6b8a4c913'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_COLUMNS = {
+    "workouts": (("workout_type", "A"), ("notes", "B")),
+    "exercises": (("exercise_name", "A"), ("notes", "B")),
+    "meals": (("meal_name", "A"), ("description", "B"), ("notes", "C")),
+    "body_measurements": (("notes", "B"),),
+    "goals": (("title", "A"), ("description", "B"), ("notes", "C")),
+    "progress_photos": (("notes", "B"),),
+}
+
+
+def upgrade() -> None:
+    for table, weighted_columns in SEARCH_COLUMNS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                TSVECTOR(),
+                sa.Computed(search_vector_sql(*weighted_columns), persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(f"ix_{table}_search_vector", table, ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for table in SEARCH_COLUMNS:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,44 @@
+"""add training loads
+
+Revision ID: f4b9d2e6a718
+Revises: e8a1c4d7f052
+Create Date: 2026-10-19 15:00:00.000000+00:00
+
+Existing history is not folded in here; run
+scripts/backfill_training_load.py after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4b9d2e6a718'
+down_revision = 'e8a1c4d7f052'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "training_loads",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("load_date", sa.Date(), nullable=False),
+        sa.Column("load", sa.Float(), nullable=False),
+        sa.Column("tonnage_kg", sa.Float(), nullable=False),
+        sa.Column("workout_count", sa.Integer(), nullable=False),
+        sa.Column("acute_load", sa.Float(), nullable=False),
+        sa.Column("chronic_load", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "load_date", name="uq_training_loads_user_date"),
+    )
+    op.create_index("ix_training_loads_id", "training_loads", ["id"])
+    op.create_index("ix_training_loads_user_id", "training_loads", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_training_loads_user_id", table_name="training_loads")
+    op.drop_index("ix_training_loads_id", table_name="training_loads")
+    op.drop_table("training_loads")
@@ -0,0 +1,44 @@
+"""add activity calendars
+
+Revision ID: 0a7c3e5b9d24
+Revises: f4b9d2e6a718
+Create Date: 2026-10-19 16:00:00.000000+00:00
+
+Existing history is not folded in here; run
+scripts/rebuild_activity_calendar.py after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0a7c3e5b9d24'
+down_revision = 'f4b9d2e6a718'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "activity_calendars",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("workout_counts", postgresql.ARRAY(sa.SmallInteger()), nullable=False),
+        sa.Column("meal_counts", postgresql.ARRAY(sa.SmallInteger()), nullable=False),
+        sa.Column("measurement_counts", postgresql.ARRAY(sa.SmallInteger()), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "year", name="uq_activity_calendars_user_year"),
+    )
+    op.create_index("ix_activity_calendars_id", "activity_calendars", ["id"])
+    op.create_index("ix_activity_calendars_user_id", "activity_calendars", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_calendars_user_id", table_name="activity_calendars")
+    op.drop_index("ix_activity_calendars_id", table_name="activity_calendars")
+    op.drop_table("activity_calendars")
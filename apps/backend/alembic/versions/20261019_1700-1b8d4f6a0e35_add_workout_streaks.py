@@ -0,0 +1,83 @@
+"""add workout streaks
+
+Revision ID: 1b8d4f6a0e35
+Revises: 0a7c3e5b9d24
+Create Date: 2026-10-19 17:00:00.000000+00:00
+
+Backfills streak state for every user with workouts using the same
+gaps-and-islands computation as StreakService.rebuild.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b8d4f6a0e35'
+down_revision = '0a7c3e5b9d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workout_streaks",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("current_streak", sa.Integer(), nullable=False),
+        sa.Column("current_streak_start", sa.Date(), nullable=True),
+        sa.Column("longest_streak", sa.Integer(), nullable=False),
+        sa.Column("longest_streak_start", sa.Date(), nullable=True),
+        sa.Column("last_workout_date", sa.Date(), nullable=True),
+        sa.Column("total_workout_days", sa.Integer(), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=True),
+        sa.Column("week_count", sa.Integer(), nullable=False),
+        sa.Column("previous_week_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    op.execute(
+        """
+        WITH days AS (
+            SELECT DISTINCT user_id, workout_date AS day FROM workouts
+        ),
+        islands AS (
+            SELECT user_id, min(day) AS start_day, max(day) AS end_day, count(*) AS length
+            FROM (
+                SELECT user_id, day, day - row_number() OVER (PARTITION BY user_id ORDER BY day)::int AS island
+                FROM days
+            ) d
+            GROUP BY user_id, island
+        ),
+        current_islands AS (
+            SELECT DISTINCT ON (user_id) user_id, start_day, end_day, length,
+                   date_trunc('week', end_day)::date AS week_start
+            FROM islands ORDER BY user_id, end_day DESC
+        ),
+        longest_islands AS (
+            SELECT DISTINCT ON (user_id) user_id, start_day, length
+            FROM islands ORDER BY user_id, length DESC, start_day ASC
+        ),
+        totals AS (
+            SELECT user_id, sum(length) AS total_days FROM islands GROUP BY user_id
+        )
+        INSERT INTO workout_streaks (
+            user_id, current_streak, current_streak_start, longest_streak, longest_streak_start,
+            last_workout_date, total_workout_days, week_start, week_count, previous_week_count, updated_at
+        )
+        SELECT c.user_id, c.length, c.start_day, l.length, l.start_day,
+               c.end_day, t.total_days, c.week_start,
+               (SELECT count(*) FROM workouts w WHERE w.user_id = c.user_id
+                  AND w.workout_date >= c.week_start AND w.workout_date < c.week_start + 7),
+               (SELECT count(*) FROM workouts w WHERE w.user_id = c.user_id
+                  AND w.workout_date >= c.week_start - 7 AND w.workout_date < c.week_start),
+               now()
+        FROM current_islands c
+        JOIN longest_islands l ON l.user_id = c.user_id
+        JOIN totals t ON t.user_id = c.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workout_streaks")
@@ -0,0 +1,44 @@
+"""add user summaries
+
+Revision ID: 2c9e5a7b1f46
+Revises: 1b8d4f6a0e35
+Create Date: 2026-10-19 18:00:00.000000+00:00
+
+Existing data is not folded in here; run
+scripts/rebuild_user_summaries.py after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c9e5a7b1f46'
+down_revision = '1b8d4f6a0e35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_summaries",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("measurement_count", sa.Integer(), nullable=False),
+        sa.Column("first_measurement_date", sa.Date(), nullable=True),
+        sa.Column("first_weight_kg", sa.Float(), nullable=True),
+        sa.Column("last_measurement_date", sa.Date(), nullable=True),
+        sa.Column("last_weight_kg", sa.Float(), nullable=True),
+        sa.Column("workout_count", sa.Integer(), nullable=False),
+        sa.Column("total_workout_minutes", sa.Integer(), nullable=False),
+        sa.Column("meal_count", sa.Integer(), nullable=False),
+        sa.Column("progress_photo_count", sa.Integer(), nullable=False),
+        sa.Column("goal_count", sa.Integer(), nullable=False),
+        sa.Column("active_goal_count", sa.Integer(), nullable=False),
+        sa.Column("completed_goal_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_summaries")
@@ -0,0 +1,50 @@
+"""cascade foreign keys
+
+Revision ID: 3d0f6b8c2a57
+Revises: 2c9e5a7b1f46
+Create Date: 2026-10-19 19:00:00.000000+00:00
+
+Deleting a user or workout is now handled by ON DELETE CASCADE in the
+database instead of the ORM loading and deleting every child row.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3d0f6b8c2a57'
+down_revision = '2c9e5a7b1f46'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referenced table, ON DELETE action)
+FOREIGN_KEYS = [
+    ("body_measurements", "user_id", "users", "CASCADE"),
+    ("progress_photos", "user_id", "users", "CASCADE"),
+    ("workouts", "user_id", "users", "CASCADE"),
+    ("meals", "user_id", "users", "CASCADE"),
+    ("goals", "user_id", "users", "CASCADE"),
+    ("exercise_records", "user_id", "users", "CASCADE"),
+    ("training_loads", "user_id", "users", "CASCADE"),
+    ("activity_calendars", "user_id", "users", "CASCADE"),
+    ("workout_streaks", "user_id", "users", "CASCADE"),
+    ("user_summaries", "user_id", "users", "CASCADE"),
+    ("exercises", "workout_id", "workouts", "CASCADE"),
+    ("exercises", "catalog_id", "exercise_catalog", "SET NULL"),
+    ("exercise_aliases", "catalog_id", "exercise_catalog", "CASCADE"),
+]
+
+
+def _recreate(ondelete_for) -> None:
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referred, [column], ["id"], ondelete=ondelete_for(ondelete))
+
+
+def upgrade() -> None:
+    _recreate(lambda ondelete: ondelete)
+
+
+def downgrade() -> None:
+    _recreate(lambda ondelete: None)
@@ -0,0 +1,59 @@
+"""add skinfold body fat estimates
+
+Revision ID: 4e1a7c9d3b68
+Revises: 3d0f6b8c2a57
+Create Date: 2026-10-19 20:00:00.000000+00:00
+
+Adds the chest and midaxillary skin folds needed by the Jackson-Pollock
+equations and stored body-fat estimates. Existing rows are filled in by
+scripts/backfill_body_fat.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e1a7c9d3b68'
+down_revision = '3d0f6b8c2a57'
+branch_labels = None
+depends_on = None
+
+
+NEW_COLUMNS = [
+    "chest_skinfold_mm", "midaxillary_skinfold_mm",
+    "body_fat_jp3", "body_fat_jp7", "body_fat_dw",
+]
+
+INCLUDED_COLUMNS = [
+    "id", "weight_kg", "body_fat_percentage", "muscle_mass_kg", "bmi",
+    "neck_cm", "chest_cm", "waist_cm", "abdomen_cm", "hips_cm",
+    "right_bicep_cm", "left_bicep_cm", "right_forearm_cm", "left_forearm_cm",
+    "right_thigh_cm", "left_thigh_cm", "right_calf_cm", "left_calf_cm",
+    "bicep_skinfold_mm", "tricep_skinfold_mm", "subscapular_skinfold_mm",
+    "suprailiac_skinfold_mm", "abdominal_skinfold_mm", "thigh_skinfold_mm",
+]
+
+INDEX_NAME = "ix_body_measurements_user_id_measurement_date"
+
+
+def _recreate_covering_index(included) -> None:
+    # The comparison query reads every measurement field from this index
+    op.drop_index(INDEX_NAME, table_name="body_measurements")
+    op.create_index(
+        INDEX_NAME,
+        "body_measurements",
+        ["user_id", "measurement_date"],
+        postgresql_include=included,
+    )
+
+
+def upgrade() -> None:
+    for name in NEW_COLUMNS:
+        op.add_column("body_measurements", sa.Column(name, sa.Float(), nullable=True))
+    _recreate_covering_index(INCLUDED_COLUMNS + NEW_COLUMNS)
+
+
+def downgrade() -> None:
+    _recreate_covering_index(INCLUDED_COLUMNS)
+    for name in reversed(NEW_COLUMNS):
+        op.drop_column("body_measurements", name)
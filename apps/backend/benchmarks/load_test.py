@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test against a running API.
+
+Registers a pool of throwaway users, logs them in, then runs one async
+virtual user per account. Each virtual user repeatedly picks an action
+from a weighted mix (dashboard reads, meal logging, workout creation,
+photo uploads) until the test duration is over.
+
+Throughput and latency percentiles per endpoint are written to a JSON
+artifact. Pass --compare with an earlier artifact to print the change in
+p95 latency and throughput, e.g. between two commits.
+
+Usage:
+    python benchmarks/load_test.py [--base-url URL] [--users N] [--duration S]
+        [--mix dashboard=50,meal=25,workout=20,photo=5] [--output FILE]
+        [--compare FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import struct
+import subprocess
+import sys
+import time
+import uuid
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import httpx
+import numpy as np
+
+DEFAULT_MIX = "dashboard=50,meal=25,workout=20,photo=5"
+
+WORKOUT_TYPES = ["strength", "running", "cycling", "swimming", "yoga"]
+EXERCISES = ["Supino reto", "Agachamento livre", "Levantamento terra", "Remada curvada", "Desenvolvimento"]
+MEAL_TYPES = ["breakfast", "lunch", "dinner", "snack"]
+
+
+def tiny_png() -> bytes:
+    """A valid 1x1 PNG, enough for upload validation."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00\xff\xff\xff")
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+PNG = tiny_png()
+
+
+class Recorder:
+    """Latencies and failures per endpoint name."""
+
+    def __init__(self) -> None:
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    async def call(self, name: str, client: httpx.AsyncClient, method: str, url: str, expected: int, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, "error"
+        self.latencies[name].append((time.perf_counter() - start) * 1000)
+        self.statuses[name][str(status)] += 1
+        if status != expected:
+            self.errors[name] += 1
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            latencies = np.array(values)
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "statuses": dict(self.statuses[name]),
+                "throughput_rps": round(len(values) / elapsed, 2),
+                "mean_ms": round(float(latencies.mean()), 2),
+                "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+                "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+                "p99_ms": round(float(np.percentile(latencies, 99)), 2),
+                "max_ms": round(float(latencies.max()), 2),
+            }
+        everything = np.concatenate([np.array(v) for v in self.latencies.values()]) if self.latencies else np.zeros(1)
+        total_requests = sum(len(v) for v in self.latencies.values())
+        return {
+            "total": {
+                "requests": total_requests,
+                "errors": sum(self.errors.values()),
+                "throughput_rps": round(total_requests / elapsed, 2),
+                "p50_ms": round(float(np.percentile(everything, 50)), 2),
+                "p95_ms": round(float(np.percentile(everything, 95)), 2),
+                "p99_ms": round(float(np.percentile(everything, 99)), 2),
+            },
+            "endpoints": endpoints,
+        }
+
+
+async def create_user(client: httpx.AsyncClient, run_id: str, index: int) -> dict:
+    """Register and log in one throwaway user; returns auth headers."""
+    email = f"loadtest-{run_id}-{index}@example.com"
+    password = "LoadTest123!"
+    response = await client.post("/v1/auth/register", json={
+        "email": email,
+        "password": password,
+        "full_name": f"Load Test {index}",
+        "gender": random.choice(["male", "female"]),
+        "height_cm": random.randint(155, 195),
+        "date_of_birth": str(date(1970, 1, 1) + timedelta(days=random.randint(0, 365 * 35))),
+    })
+    response.raise_for_status()
+    response = await client.post("/v1/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def random_day(rng: random.Random) -> str:
+    return str(date.today() - timedelta(days=rng.randint(0, 90)))
+
+
+async def dashboard(client, headers, recorder, rng):
+    await recorder.call("GET /v1/dashboard", client, "GET", "/v1/dashboard", 200, headers=headers)
+
+
+async def log_meal(client, headers, recorder, rng):
+    await recorder.call("POST /v1/meals", client, "POST", "/v1/meals/", 201, headers=headers, json={
+        "meal_date": random_day(rng),
+        "meal_type": rng.choice(MEAL_TYPES),
+        "meal_name": "Arroz, feijão e frango",
+        "calories": rng.randint(200, 900),
+        "protein_g": rng.randint(10, 60),
+        "carbs_g": rng.randint(20, 120),
+        "fats_g": rng.randint(5, 40),
+    })
+
+
+async def create_workout(client, headers, recorder, rng):
+    await recorder.call("POST /v1/workouts", client, "POST", "/v1/workouts/", 201, headers=headers, json={
+        "workout_date": random_day(rng),
+        "workout_type": rng.choice(WORKOUT_TYPES),
+        "duration_minutes": rng.randint(20, 90),
+        "intensity": rng.choice(["low", "medium", "high"]),
+        "exercises": [
+            {"exercise_name": name, "sets": 3, "reps": rng.randint(6, 12), "weight_kg": rng.randint(20, 120)}
+            for name in rng.sample(EXERCISES, 3)
+        ],
+    })
+
+
+async def upload_photo(client, headers, recorder, rng):
+    await recorder.call(
+        "POST /v1/progress-photos", client, "POST", "/v1/progress-photos/", 201, headers=headers,
+        data={"photo_date": random_day(rng), "photo_type": rng.choice(["front", "back", "side"])},
+        files={"file": ("photo.png", PNG, "image/png")},
+    )
+
+
+ACTIONS = {
+    "dashboard": dashboard,
+    "meal": log_meal,
+    "workout": create_workout,
+    "photo": upload_photo,
+}
+
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        name, weight = part.split("=")
+        if name not in ACTIONS:
+            raise argparse.ArgumentTypeError(f"Unknown action '{name}'. Allowed: {', '.join(ACTIONS)}")
+        mix[name] = float(weight)
+    return mix
+
+
+async def virtual_user(client, headers, recorder, mix, deadline, think_time, seed):
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while time.monotonic() < deadline:
+        action = ACTIONS[rng.choices(names, weights)[0]]
+        await action(client, headers, recorder, rng)
+        if think_time:
+            await asyncio.sleep(rng.expovariate(1 / think_time))
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(result: dict, previous: dict = None) -> None:
+    print(f"{'endpoint':<28} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    rows = list(result["endpoints"].items()) + [("TOTAL", result["total"])]
+    for name, stats in rows:
+        line = (
+            f"{name:<28} {stats['requests']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8} "
+            f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}"
+        )
+        before = (previous or {}).get("endpoints", {}).get(name) if name != "TOTAL" else (previous or {}).get("total")
+        if before:
+            p95_change = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+            rps_change = (
+                (stats["throughput_rps"] - before["throughput_rps"]) / before["throughput_rps"] * 100
+                if before["throughput_rps"] else 0
+            )
+            line += f"   p95 {p95_change:+.1f}%  rps {rps_change:+.1f}%"
+        print(line)
+
+
+async def run(args) -> dict:
+    random.seed(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        print(f"Creating {args.users} users...")
+        headers = await asyncio.gather(*[create_user(client, run_id, i) for i in range(args.users)])
+
+        recorder = Recorder()
+        if args.warmup:
+            print(f"Warming up for {args.warmup}s...")
+            deadline = time.monotonic() + args.warmup
+            await asyncio.gather(*[
+                virtual_user(client, h, Recorder(), args.mix, deadline, args.think_time, args.seed + i)
+                for i, h in enumerate(headers)
+            ])
+
+        print(f"Running for {args.duration}s with {args.users} virtual users...")
+        started_at = datetime.utcnow()
+        start = time.monotonic()
+        deadline = start + args.duration
+        await asyncio.gather(*[
+            virtual_user(client, h, recorder, args.mix, deadline, args.think_time, args.seed + 1000 + i)
+            for i, h in enumerate(headers)
+        ])
+        elapsed = time.monotonic() - start
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": started_at.isoformat() + "Z",
+            "base_url": args.base_url,
+            "users": args.users,
+            "duration_s": round(elapsed, 2),
+            "think_time_s": args.think_time,
+            "mix": args.mix,
+            "seed": args.seed,
+        },
+        **recorder.summary(elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.environ.get("LOADTEST_BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--users", type=int, default=20, help="Virtual users, one account each (default: 20)")
+    parser.add_argument("--duration", type=float, default=60, help="Measured seconds (default: 60)")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before the run (default: 5)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between actions in seconds")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Action weights (default: {DEFAULT_MIX})"
+    )
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON artifact path (default: benchmarks/results/load-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Earlier JSON artifact to compare against")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"load-{result['meta']['commit']}-{time.strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print_report(result, previous)
+    print(f"Results written to {output}")
+    if result["total"]["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
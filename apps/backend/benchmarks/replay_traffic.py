@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Replay captured traffic against a running API.
+
+Reads the JSONL files written by TrafficCaptureMiddleware (set
+TRAFFIC_CAPTURE_DIR on the captured stack) and re-issues the requests with
+their original spacing divided by --speed, so --speed 2 replays an hour of
+production traffic in 30 minutes at twice the rate.
+
+Every captured user bucket is played by a throwaway account registered on
+the target (at most --max-users; further buckets share accounts), so the
+per-user request mix is preserved. Captures hold no bodies or resource ids:
+request bodies are generated per route, and ids are taken from resources
+the same account created or listed earlier in the replay. Requests that
+cannot be rebuilt (no known id yet, admin routes, account deletion) are
+counted as skipped.
+
+Results use the load test's JSON artifact format, so --compare works
+between replays and load tests.
+
+Usage:
+    python benchmarks/replay_traffic.py CAPTURE [CAPTURE ...] [--base-url URL]
+        [--speed N] [--max-users N] [--output FILE] [--compare FILE]
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import httpx
+
+from load_test import EXERCISES, MEAL_TYPES, PNG, WORKOUT_TYPES, Recorder, git_commit, print_report
+
+PASSWORD = "Replay12345!"
+SKIPPED_ROUTES = {("DELETE", "/v1/users/me"), ("POST", "/v1/auth/logout")}
+SKIPPED_PREFIXES = ("/v1/admin", "/v1/users/admin")
+PATH_PARAM = re.compile(r"{(\w+)(:\w+)?}")
+
+
+def load_capture(patterns) -> list:
+    """Captured records from all files, oldest first."""
+    records = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            with open(path) as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+def day(rng: random.Random) -> str:
+    return str(date.today() - timedelta(days=rng.randint(0, 90)))
+
+
+def json_body(route: str, rng: random.Random):
+    """A valid request body for a route, or None if the route takes none."""
+    if route.startswith("/v1/measurements"):
+        return {"measurement_date": day(rng), "weight_kg": round(rng.uniform(55, 110), 1)}
+    if route.startswith("/v1/workouts"):
+        return {
+            "workout_date": day(rng),
+            "workout_type": rng.choice(WORKOUT_TYPES),
+            "duration_minutes": rng.randint(20, 90),
+            "exercises": [
+                {"exercise_name": name, "sets": 3, "reps": rng.randint(6, 12), "weight_kg": rng.randint(20, 120)}
+                for name in rng.sample(EXERCISES, 3)
+            ],
+        }
+    if route.startswith("/v1/meals"):
+        return {
+            "meal_date": day(rng),
+            "meal_type": rng.choice(MEAL_TYPES),
+            "meal_name": "Arroz, feijão e frango",
+            "calories": rng.randint(200, 900),
+            "protein_g": rng.randint(10, 60),
+        }
+    if route == "/v1/goals/{goal_id}/update-progress":
+        return None
+    if route.startswith("/v1/goals"):
+        return {"goal_type": "weight_loss", "title": "Meta de peso", "start_date": day(rng), "target_weight_kg": 75}
+    if route == "/v1/users/me":
+        return {"full_name": "Replay User"}
+    if route == "/v1/exercises/records/check":
+        return {"exercise_name": rng.choice(EXERCISES), "weight_kg": rng.randint(20, 150), "reps": rng.randint(1, 12)}
+    return None
+
+
+class ReplayUser:
+    """A target-side account standing in for one captured user bucket."""
+
+    def __init__(self, email: str) -> None:
+        self.email = email
+        self.headers = {}
+        # Collection route prefix -> ids seen in its responses
+        self.ids = defaultdict(list)
+
+    def remember(self, route: str, method: str, payload) -> None:
+        collection = route.rstrip("/")
+        if "{" in collection:
+            return
+        items = payload if isinstance(payload, list) else [payload]
+        ids = [item["id"] for item in items if isinstance(item, dict) and isinstance(item.get("id"), int)]
+        if method == "POST":
+            self.ids[collection].extend(ids)
+        elif ids:
+            self.ids[collection] = list(dict.fromkeys(self.ids[collection] + ids))
+
+
+async def register(client: httpx.AsyncClient, run_id: str, index: int) -> ReplayUser:
+    user = ReplayUser(f"replay-{run_id}-{index}@example.com")
+    response = await client.post("/v1/auth/register", json={
+        "email": user.email, "password": PASSWORD, "full_name": f"Replay {index}",
+        "gender": random.choice(["male", "female"]), "height_cm": random.randint(155, 195),
+        "date_of_birth": "1990-01-01",
+    })
+    response.raise_for_status()
+    response = await client.post("/v1/auth/login", json={"email": user.email, "password": PASSWORD})
+    response.raise_for_status()
+    user.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return user
+
+
+def build_path(record: dict, user: ReplayUser, rng: random.Random):
+    """Concrete path for a record, or None if a resource id is not known yet."""
+    route = record["route"]
+
+    def substitute(match):
+        name = match.group(1)
+        if name.endswith("_id"):
+            ids = user.ids.get(route[:match.start()].rstrip("/")) if user else None
+            if not ids:
+                raise LookupError(name)
+            return str(rng.choice(ids))
+        value = record["path_params"].get(name, "*")
+        return str(date.today()) if value == "*" and name.endswith("date") else value
+
+    try:
+        return PATH_PARAM.sub(substitute, route)
+    except LookupError:
+        return None
+
+
+class Replayer:
+    """Issues captured records on schedule and tracks what could not be replayed."""
+
+    def __init__(self, client, users, run_id, recorder, speed, seed) -> None:
+        self.client = client
+        self.users = users
+        self.run_id = run_id
+        self.recorder = recorder
+        self.speed = speed
+        self.rng = random.Random(seed)
+        self.skipped = defaultdict(int)
+        self.lag_ms = []
+        self.registered = 0
+
+    def user_for(self, bucket):
+        if bucket is None:
+            return None
+        return self.users[bucket % len(self.users)]
+
+    async def issue(self, record: dict) -> None:
+        method, route = record["method"], record["route"]
+        name = f"{method} {route}"
+        user = self.user_for(record.get("user"))
+        if route == "unmatched" or (method, route) in SKIPPED_ROUTES or route.startswith(SKIPPED_PREFIXES):
+            self.skipped[name] += 1
+            return
+
+        kwargs = {"headers": dict(user.headers) if user else {}}
+        if route == "/v1/auth/register":
+            self.registered += 1
+            email = f"replay-{self.run_id}-new-{self.registered}@example.com"
+            kwargs["json"] = {"email": email, "password": PASSWORD, "full_name": "Replay New"}
+        elif route == "/v1/auth/login":
+            if user is None:
+                user = self.users[self.rng.randrange(len(self.users))]
+            kwargs["json"] = {"email": user.email, "password": PASSWORD}
+        elif route == "/v1/progress-photos/" and method == "POST":
+            kwargs["data"] = {"photo_date": day(self.rng), "photo_type": self.rng.choice(["front", "back", "side"])}
+            kwargs["files"] = {"file": ("photo.png", PNG, "image/png")}
+        elif method in ("POST", "PUT", "PATCH"):
+            body = json_body(route, self.rng)
+            if body is not None:
+                kwargs["json"] = body
+
+        path = build_path(record, user, self.rng)
+        if path is None:
+            self.skipped[name] += 1
+            return
+        kwargs["params"] = {
+            key: ("a" if value == "*" else value) for key, value in record["query"].items()
+        }
+
+        response = await self.recorder.call(name, self.client, method, path, record["status"], **kwargs)
+        if user is not None and response is not None and response.is_success:
+            if method == "DELETE":
+                collection = route[:route.rfind("/{")]
+                ids = user.ids.get(collection, [])
+                removed = int(path.rsplit("/", 1)[1]) if path.rsplit("/", 1)[1].isdigit() else None
+                if removed in ids:
+                    ids.remove(removed)
+            elif "json" in response.headers.get("content-type", ""):
+                user.remember(route, method, response.json())
+
+    async def run(self, records: list) -> float:
+        tasks = set()
+        first = records[0]["ts"]
+        start = time.monotonic()
+        for record in records:
+            due = start + (record["ts"] - first) / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                self.lag_ms.append(-delay * 1000)
+            task = asyncio.create_task(self.issue(record))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        return time.monotonic() - start
+
+
+async def run(args) -> dict:
+    random.seed(args.seed)
+    records = load_capture(args.capture)
+    if not records:
+        sys.exit("No captured requests found")
+    buckets = sorted({r["user"] for r in records if r.get("user") is not None})
+    run_id = uuid.uuid4().hex[:8]
+
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        count = max(1, min(len(buckets), args.max_users))
+        print(f"Registering {count} users for {len(buckets)} captured user buckets...")
+        accounts = await asyncio.gather(*[register(client, run_id, i) for i in range(count)])
+
+        # Buckets are numbered in order of appearance and share accounts round-robin
+        bucket_index = {bucket: i for i, bucket in enumerate(buckets)}
+        for record in records:
+            if record.get("user") is not None:
+                record["user"] = bucket_index[record["user"]]
+        recorder = Recorder()
+        replayer = Replayer(client, accounts, run_id, recorder, args.speed, args.seed)
+
+        span = records[-1]["ts"] - records[0]["ts"]
+        print(f"Replaying {len(records)} requests spanning {span:.0f}s at {args.speed}x...")
+        started_at = datetime.utcnow()
+        elapsed = await replayer.run(records)
+
+    lag = sorted(replayer.lag_ms) or [0.0]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": started_at.isoformat() + "Z",
+            "base_url": args.base_url,
+            "captured_requests": len(records),
+            "captured_span_s": round(span, 2),
+            "user_buckets": len(buckets),
+            "users": count,
+            "speed": args.speed,
+            "duration_s": round(elapsed, 2),
+            "late_requests": len(replayer.lag_ms),
+            "max_lag_ms": round(lag[-1], 2),
+            "seed": args.seed,
+        },
+        "skipped": dict(replayer.skipped),
+        **recorder.summary(elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", nargs="+", help="Capture files or glob patterns (traffic-*.jsonl)")
+    parser.add_argument("--base-url", default=os.environ.get("LOADTEST_BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier (default: 1)")
+    parser.add_argument("--max-users", type=int, default=200, help="Accounts to register at most (default: 200)")
+    parser.add_argument("--max-connections", type=int, default=100, help="HTTP connection limit (default: 100)")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON artifact path (default: benchmarks/results/replay-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Earlier JSON artifact to compare against")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"replay-{result['meta']['commit']}-{time.strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print_report(result, previous)
+    if result["skipped"]:
+        print(f"Skipped: {sum(result['skipped'].values())} requests ({', '.join(sorted(result['skipped']))})")
+    meta = result["meta"]
+    print(f"Late requests: {meta['late_requests']} (max lag {meta['max_lag_ms']} ms)")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
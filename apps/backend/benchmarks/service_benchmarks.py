@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Service-layer microbenchmarks against a seeded database.
+
+Times the hot service functions (measurement listing, nutrition summaries,
+workout stats, goal progress, token and password authentication) and the
+serialization of ORM rows through the `*Response` schemas, for one user of
+a dataset loaded with scripts/seed.py. Every benchmark runs a few warmup
+calls and is then repeated until both --min-rounds and --min-time are
+reached; the session is rolled back between calls so each one hits the
+database instead of the identity map.
+
+Results are compared with a stored baseline (benchmarks/baselines/
+services.json by default): a benchmark whose median is more than
+--threshold slower than its baseline is reported as a regression and the
+script exits with status 1. Baselines depend on the machine and dataset,
+so record them with --save-baseline on the machine that checks them; until
+one exists the script exits with status 2 instead of passing unchecked.
+
+Usage:
+    python scripts/seed.py --users 200 --end-date 2026-01-31
+    python benchmarks/service_benchmarks.py [--email seed-user-0@example.com]
+        [--filter meal] [--threshold 0.25] [--save-baseline] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from typing import Callable, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+
+from src.core.database import SessionLocal
+from src.core.dependencies import get_current_user
+from src.core.security import create_access_token
+from src.database.models import Goal, Meal, ProgressPhoto, User, Workout
+from src.api.schemas import (
+    BodyMeasurementResponse,
+    GoalResponse,
+    MealResponse,
+    ProgressPhotoResponse,
+    UserLogin,
+    UserResponse,
+    WorkoutResponse,
+)
+from src.api.services import (
+    AuthService,
+    BodyMeasurementService,
+    GoalService,
+    MealService,
+    WorkoutService,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "services.json")
+SEED_PASSWORD = "Seed12345!"
+
+
+class Benchmark:
+    """A named callable, timed by `run`."""
+
+    def __init__(self, name: str, func: Callable[[], object]) -> None:
+        self.name = name
+        self.func = func
+
+    def run(self, reset: Callable[[], None], warmup: int, min_rounds: int, min_time: float, max_rounds: int) -> dict:
+        """Time the callable, calling `reset` (untimed) before every call."""
+        for _ in range(warmup):
+            reset()
+            self._call()
+        timings: List[float] = []
+        started = time.perf_counter()
+        while len(timings) < max_rounds and (len(timings) < min_rounds or time.perf_counter() - started < min_time):
+            reset()
+            timings.append(self._call())
+        timings.sort()
+        return {
+            "rounds": len(timings),
+            "min_ms": round(timings[0] * 1000, 4),
+            "median_ms": round(statistics.median(timings) * 1000, 4),
+            "p95_ms": round(timings[int(0.95 * (len(timings) - 1))] * 1000, 4),
+            "mean_ms": round(statistics.fmean(timings) * 1000, 4),
+            "stdev_ms": round(statistics.stdev(timings) * 1000, 4) if len(timings) > 1 else 0.0,
+        }
+
+    def _call(self) -> float:
+        start = time.perf_counter()
+        self.func()
+        return time.perf_counter() - start
+
+
+def serializer(schema) -> Callable[[list], bytes]:
+    """Validate ORM objects into `schema` and dump JSON, as FastAPI does for response models."""
+    adapter = TypeAdapter(List[schema])
+    return lambda rows: adapter.dump_json(adapter.validate_python(rows))
+
+
+def build_benchmarks(db, user: User, period_days: int) -> List[Benchmark]:
+    """Benchmarks for `user`, with date ranges ending on their latest meal."""
+    end = db.query(func.max(Meal.meal_date)).filter(Meal.user_id == user.id).scalar()
+    if end is None:
+        sys.exit(f"User {user.email} has no meals; seed the database with scripts/seed.py first")
+    start = end - timedelta(days=period_days - 1)
+    user_id, email = user.id, user.email
+    goal = db.query(Goal).filter(Goal.user_id == user_id).order_by(Goal.target_weight_kg.is_(None), Goal.id).first()
+    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": str(user_id)}))
+    credentials = UserLogin(email=email, password=SEED_PASSWORD)
+    loop = asyncio.new_event_loop()
+
+    # Rows for the serialization benchmarks, loaded once with their relationships and
+    # detached (like `user` and `goal`) so rollbacks between calls do not expire them
+    measurements = BodyMeasurementService.get_user_measurements(db, user_id, limit=100)
+    workouts = (
+        db.query(Workout).options(selectinload(Workout.exercises))
+        .filter(Workout.user_id == user_id).order_by(Workout.workout_date.desc()).limit(100).all()
+    )
+    meals = db.query(Meal).filter(Meal.user_id == user_id).order_by(Meal.meal_date.desc()).limit(100).all()
+    goals = db.query(Goal).filter(Goal.user_id == user_id).all()
+    db.refresh(user)
+    photos = db.query(ProgressPhoto).filter(ProgressPhoto.user_id == user_id).limit(100).all()
+    db.expunge_all()
+
+    benchmarks = [
+        Benchmark("BodyMeasurementService.get_user_measurements",
+                  lambda: BodyMeasurementService.get_user_measurements(db, user_id, limit=100)),
+        Benchmark("MealService.get_daily_nutrition",
+                  lambda: MealService.get_daily_nutrition(db, user_id, end)),
+        Benchmark("MealService.get_nutrition_stats",
+                  lambda: MealService.get_nutrition_stats(db, user_id, start, end)),
+        Benchmark("WorkoutService.get_workout_stats",
+                  lambda: WorkoutService.get_workout_stats(db, user_id, start, end)),
+        Benchmark("get_current_user",
+                  lambda: loop.run_until_complete(get_current_user(token, db))),
+        Benchmark("AuthService.authenticate_user",
+                  lambda: AuthService.authenticate_user(db, credentials)),
+        Benchmark("serialize.UserResponse", lambda: UserResponse.model_validate(user).model_dump_json()),
+        Benchmark("serialize.BodyMeasurementResponse[100]",
+                  lambda dump=serializer(BodyMeasurementResponse): dump(measurements)),
+        Benchmark("serialize.WorkoutResponse[100]", lambda dump=serializer(WorkoutResponse): dump(workouts)),
+        Benchmark("serialize.MealResponse[100]", lambda dump=serializer(MealResponse): dump(meals)),
+        Benchmark("serialize.GoalResponse", lambda dump=serializer(GoalResponse): dump(goals)),
+        Benchmark("serialize.ProgressPhotoResponse", lambda dump=serializer(ProgressPhotoResponse): dump(photos)),
+    ]
+    if goal is not None:
+        benchmarks.insert(4, Benchmark(
+            "GoalService.calculate_progress", lambda: GoalService.calculate_progress(db, goal)
+        ))
+    return benchmarks
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Print results against the baseline; returns the names of regressed benchmarks."""
+    regressions = []
+    print(f"{'benchmark':<46} {'rounds':>7} {'median ms':>10} {'p95 ms':>10} {'baseline':>10} {'change':>8}")
+    for name, stats in results.items():
+        line = f"{name:<46} {stats['rounds']:>7} {stats['median_ms']:>10.3f} {stats['p95_ms']:>10.3f}"
+        before = baseline.get(name)
+        if before:
+            change = (stats["median_ms"] - before["median_ms"]) / before["median_ms"]
+            line += f" {before['median_ms']:>10.3f} {change * 100:>+7.1f}%"
+            if change > threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        else:
+            line += f" {'-':>10} {'new':>8}"
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", default="seed-user-0@example.com", help="Seeded user to benchmark")
+    parser.add_argument("--period-days", type=int, default=30, help="Length of the stats periods (default: 30)")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per benchmark (default: 3)")
+    parser.add_argument("--min-rounds", type=int, default=20, help="Minimum timed calls (default: 20)")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Minimum seconds per benchmark (default: 1)")
+    parser.add_argument("--max-rounds", type=int, default=1000, help="Maximum timed calls (default: 1000)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed median slowdown before failing, as a fraction (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == args.email).first()
+        if user is None:
+            sys.exit(f"User {args.email} not found; seed the database with scripts/seed.py first")
+        benchmarks = [b for b in build_benchmarks(db, user, args.period_days) if args.filter in b.name]
+
+        results = {}
+        for benchmark in benchmarks:
+            results[benchmark.name] = benchmark.run(
+                db.rollback, args.warmup, args.min_rounds, args.min_time, args.max_rounds
+            )
+    finally:
+        db.close()
+
+    document = {
+        "meta": {
+            "commit": git_commit(),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "email": args.email,
+            "period_days": args.period_days,
+            "python": sys.version.split()[0],
+        },
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["benchmarks"]
+    regressions = compare(results, baseline, args.threshold)
+
+    if not baseline and not args.save_baseline:
+        print(
+            f"\nNo baseline at {args.baseline}: nothing was checked. "
+            "Record one on this machine with --save-baseline.",
+            file=sys.stderr
+        )
+        sys.exit(2)
+
+    if args.save_baseline:
+        if args.filter and baseline:
+            document["benchmarks"] = {**baseline, **results}
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} benchmark(s) more than {args.threshold:.0%} slower than the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling by worker count.
+
+For each worker count, starts the API locally (gunicorn with
+gunicorn.conf.py, or uvicorn --workers), waits for /health, runs the load
+test against it and stops it. The table shows throughput, latency, the
+speedup over the first count and the scaling efficiency
+(speedup / worker ratio).
+
+The server uses the current environment (DATABASE_URL, JWT_SECRET_KEY,
+...). Run it on the machine, and with the CPU limit, being sized for. The
+load generator runs on the same machine and takes CPU of its own.
+
+Usage:
+    python benchmarks/worker_scaling.py [--workers 1,2,4] [--server gunicorn|uvicorn]
+        [--users 50] [--duration 30] [--port 8100] [--output FILE]
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from load_test import git_commit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(server: str, workers: int, port: int, metrics_dir: str) -> subprocess.Popen:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PROMETHEUS_MULTIPROC_DIR": metrics_dir}
+    if server == "gunicorn":
+        command = [
+            sys.executable, "-m", "gunicorn", "src.main:app", "--config", "gunicorn.conf.py",
+            "--bind", f"127.0.0.1:{port}",
+        ]
+    else:
+        # Same pool sizing as gunicorn.conf.py
+        sizing = subprocess.run(
+            [sys.executable, "gunicorn.conf.py"], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        for line in sizing.splitlines():
+            name, value = line.removeprefix("export ").split("=", 1)
+            env[name] = value
+        command = [
+            sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ]
+    return subprocess.Popen(
+        command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def wait_healthy(base_url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"Server exited with status {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    sys.exit(f"Server not healthy after {timeout}s")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def run_load_test(base_url: str, args, output: str) -> dict:
+    subprocess.run([
+        sys.executable, os.path.join(BACKEND_DIR, "benchmarks", "load_test.py"),
+        "--base-url", base_url, "--users", str(args.users), "--duration", str(args.duration),
+        "--warmup", str(args.warmup), "--mix", args.mix, "--output", output,
+    ], check=False, stdout=subprocess.DEVNULL)
+    with open(output) as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts (default: 1,2,4)")
+    parser.add_argument("--server", choices=["gunicorn", "uvicorn"], default="gunicorn")
+    parser.add_argument("--users", type=int, default=50, help="Load test virtual users (default: 50)")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per run (default: 30)")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds per run (default: 5)")
+    parser.add_argument("--mix", default="dashboard=70,meal=15,workout=15", help="Load test action weights")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--startup-timeout", type=float, default=60)
+    parser.add_argument(
+        "--output", help="JSON artifact path (default: benchmarks/results/workers-<commit>-<time>.json)"
+    )
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    runs = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for workers in [int(count) for count in args.workers.split(",")]:
+            metrics_dir = tempfile.mkdtemp(dir=scratch)
+            print(f"{workers} worker(s): starting {args.server}...", flush=True)
+            process = start_server(args.server, workers, args.port, metrics_dir)
+            try:
+                wait_healthy(base_url, process, args.startup_timeout)
+                result = run_load_test(base_url, args, os.path.join(scratch, f"load-{workers}.json"))
+            finally:
+                stop_server(process)
+            runs.append({"workers": workers, **result["total"]})
+
+    base = runs[0]
+    print(f"\n{'workers':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7} {'speedup':>8} {'efficiency':>11}")
+    for run in runs:
+        run["speedup"] = round(run["throughput_rps"] / base["throughput_rps"], 2) if base["throughput_rps"] else 0
+        run["efficiency"] = round(run["speedup"] / (run["workers"] / base["workers"]), 2)
+        print(
+            f"{run['workers']:>7} {run['throughput_rps']:>9} {run['p50_ms']:>9} {run['p95_ms']:>9} "
+            f"{run['errors']:>7} {run['speedup']:>7}x {run['efficiency']:>11.0%}"
+        )
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, "benchmarks", "results", f"workers-{git_commit()}-{time.strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "meta": {
+                "commit": git_commit(),
+                "server": args.server,
+                "cpus": len(os.sched_getaffinity(0)),
+                "users": args.users,
+                "duration_s": args.duration,
+                "mix": args.mix,
+            },
+            "runs": runs,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,5 +4,33 @@ set -e
 echo "Skipping database migrations (tables already exist)..."
 # alembic upgrade head
 
-echo "Starting application..."
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000
+# SERVER_MODE:
+#   uvicorn  - single process (default)
+#   gunicorn - gunicorn with uvicorn workers, preloaded app (see gunicorn.conf.py)
+#   workers  - uvicorn --workers, sized like gunicorn
+SERVER_MODE="${SERVER_MODE:-uvicorn}"
+
+if [ "$SERVER_MODE" != "uvicorn" ]; then
+    # Workers share metrics through files; stale files from a previous run would be counted
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-multiproc}"
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+echo "Starting application ($SERVER_MODE)..."
+case "$SERVER_MODE" in
+    gunicorn)
+        exec gunicorn src.main:app --config gunicorn.conf.py
+        ;;
+    workers)
+        eval "$(python gunicorn.conf.py)"
+        exec uvicorn src.main:app --host 0.0.0.0 --port 8000 --workers "$WEB_CONCURRENCY"
+        ;;
+    uvicorn)
+        exec uvicorn src.main:app --host 0.0.0.0 --port 8000
+        ;;
+    *)
+        echo "Unknown SERVER_MODE: $SERVER_MODE (expected uvicorn, gunicorn or workers)" >&2
+        exit 1
+        ;;
+esac
@@ -0,0 +1,124 @@
+"""
+Gunicorn configuration for the production server (SERVER_MODE=gunicorn).
+
+Uvicorn workers serve the ASGI app, which is preloaded once in the master
+and forked. The database engine is created lazily per worker, so no
+connection is shared across the fork.
+
+Workers default to the container's CPU limit (cgroup quota, else the CPUs
+the process may run on) times GUNICORN_WORKERS_PER_CORE. Each worker
+restarts after GUNICORN_MAX_REQUESTS requests, plus a random jitter so
+workers do not all restart at once.
+
+The database connection budget is (DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS)
+/ APP_REPLICAS. It is split between the workers as DB_POOL_SIZE and
+DB_MAX_OVERFLOW, unless those are set explicitly.
+
+`python gunicorn.conf.py` prints the derived worker count and pool sizes
+as shell exports (used by SERVER_MODE=workers).
+"""
+import math
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name) or default)
+
+
+def cpu_limit() -> float:
+    """CPUs available to this container: the cgroup quota if any, else the affinity mask."""
+    available = float(len(os.sched_getaffinity(0)))
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return min(available, int(quota) / int(period))
+        return available
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0:
+            return min(available, quota / period)
+    except (OSError, ValueError):
+        pass
+    return available
+
+
+def worker_count() -> int:
+    if os.environ.get("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    per_core = float(os.environ.get("GUNICORN_WORKERS_PER_CORE") or 1)
+    return max(1, math.ceil(cpu_limit() * per_core))
+
+
+def pool_sizing(workers: int) -> dict:
+    """Per-worker pool_size / max_overflow within the connection budget."""
+    budget = (
+        _env_int("DB_MAX_CONNECTIONS", 100) - _env_int("DB_RESERVED_CONNECTIONS", 10)
+    ) // _env_int("APP_REPLICAS", 1)
+    per_worker = max(2, budget // workers)
+    pool_size = min(10, max(1, per_worker // 2))
+    return {
+        "budget": budget,
+        "per_worker": per_worker,
+        "DB_POOL_SIZE": _env_int("DB_POOL_SIZE", pool_size),
+        "DB_MAX_OVERFLOW": _env_int("DB_MAX_OVERFLOW", per_worker - pool_size),
+    }
+
+
+workers = worker_count()
+_pool = pool_sizing(workers)
+
+# Read by the app's settings when it is loaded (after this file)
+os.environ["DB_POOL_SIZE"] = str(_pool["DB_POOL_SIZE"])
+os.environ["DB_MAX_OVERFLOW"] = str(_pool["DB_MAX_OVERFLOW"])
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 10000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 60)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+# Worker heartbeat files on tmpfs; a disk-backed /tmp can stall them under load
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = None
+errorlog = "-"
+
+
+def on_starting(server):
+    connections = workers * (_pool["DB_POOL_SIZE"] + _pool["DB_MAX_OVERFLOW"])
+    server.log.info(
+        "Starting %d workers (CPU limit %.2f); DB pool %d + %d overflow per worker, "
+        "%d connections at most (budget %d)",
+        workers, cpu_limit(), _pool["DB_POOL_SIZE"], _pool["DB_MAX_OVERFLOW"], connections, _pool["budget"],
+    )
+    if connections > _pool["budget"]:
+        server.log.warning(
+            "Worker pools can open %d connections, more than the budget of %d", connections, _pool["budget"]
+        )
+
+
+def child_exit(server, worker):
+    # Drop the dead worker's live gauges from the aggregated metrics
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+if __name__ == "__main__":
+    print(f"export WEB_CONCURRENCY={workers}")
+    print(f"export DB_POOL_SIZE={_pool['DB_POOL_SIZE']}")
+    print(f"export DB_MAX_OVERFLOW={_pool['DB_MAX_OVERFLOW']}")
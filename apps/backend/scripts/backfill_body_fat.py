@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Fill in skinfold body-fat estimates (Jackson-Pollock 3/7-site and
+Durnin-Womersley) for existing body measurements.
+
+New measurements get their estimates on insert; run this after the
+migration that added the columns, or after changing the equations.
+Measurements are read in id order in batches; each batch is computed with
+one vectorized NumPy pass and written back with a single UPDATE, committed
+on its own; the data version of every user with changed rows is then
+bumped, invalidating their cached comparisons. Unchanged rows are not
+rewritten, so re-runs are cheap.
+
+Usage:
+    python scripts/backfill_body_fat.py [--user-id ID] [--batch-size N]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.cache import bump_user_data_version
+from src.core.database import SessionLocal
+from src.api.services.body_measurement_service import BodyMeasurementService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only backfill this user's measurements")
+    parser.add_argument("--batch-size", type=int, default=20000, help="Measurements per batch (default: 20000)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        after_id = 0
+        updated = 0
+        while True:
+            changed, user_ids, after_id = BodyMeasurementService.recalculate_body_fat(
+                db, user_id=args.user_id, after_id=after_id, limit=args.batch_size
+            )
+            db.commit()
+            for user_id in user_ids:
+                bump_user_data_version(user_id)
+            updated += changed
+            if after_id is None:
+                break
+        print(f"Updated body-fat estimates of {updated} measurement(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Rebuild the training_loads table from workout history.
+
+Training load is normally maintained incrementally by WorkoutService; run
+this after the training_loads migration or to repair drift.
+
+Users are processed in chunks. For each chunk the daily loads are laid out
+as a dense (users x days) matrix and both averages are computed with one
+vectorized pass over the days, then the chunk's rows are replaced in bulk.
+
+Usage:
+    python scripts/backfill_training_load.py [--user-id ID] [--chunk-size N]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert
+
+from src.core.database import SessionLocal
+from src.database.models import Exercise, TrainingLoad, User, Workout
+from src.api.services.training_load_service import ACUTE_ALPHA, CHRONIC_ALPHA, TrainingLoadService
+from src.shared.training_load import daily_ewma
+
+
+def daily_totals(db, user_ids):
+    """(user_id, date, load, tonnage, workout count) per training day."""
+    tonnage = db.query(
+        Exercise.workout_id.label("workout_id"),
+        func.sum(func.coalesce(Exercise.sets, 1) * Exercise.reps * Exercise.weight_kg).label("tonnage")
+    ).filter(
+        Exercise.reps.isnot(None),
+        Exercise.weight_kg.isnot(None)
+    ).group_by(Exercise.workout_id).subquery()
+
+    return db.query(
+        Workout.user_id,
+        Workout.workout_date,
+        func.sum(TrainingLoadService.workout_load_column()),
+        func.coalesce(func.sum(tonnage.c.tonnage), 0),
+        func.count(Workout.id)
+    ).outerjoin(tonnage, tonnage.c.workout_id == Workout.id).filter(
+        Workout.user_id.in_(user_ids)
+    ).group_by(Workout.user_id, Workout.workout_date).all()
+
+
+def rebuild_chunk(db, user_ids) -> int:
+    """Replace the training_loads rows of a chunk of users. Returns rows written."""
+    totals = daily_totals(db, user_ids)
+    db.query(TrainingLoad).filter(TrainingLoad.user_id.in_(user_ids)).delete(synchronize_session=False)
+    if not totals:
+        return 0
+
+    user_index = {user_id: i for i, user_id in enumerate(sorted({row[0] for row in totals}))}
+    rows_user = np.array([user_index[row[0]] for row in totals])
+    rows_day = np.array([row[1].toordinal() for row in totals])
+    first_day = rows_day.min()
+    rows_day -= first_day
+
+    loads = np.zeros((len(user_index), rows_day.max() + 1))
+    loads[rows_user, rows_day] = [float(row[2]) for row in totals]
+    acute = daily_ewma(loads, ACUTE_ALPHA)[rows_user, rows_day]
+    chronic = daily_ewma(loads, CHRONIC_ALPHA)[rows_user, rows_day]
+
+    now = datetime.utcnow()
+    db.execute(insert(TrainingLoad), [
+        {
+            "user_id": user_id,
+            "load_date": load_date,
+            "load": float(load),
+            "tonnage_kg": round(float(tonnage), 2),
+            "workout_count": count,
+            "acute_load": float(acute[i]),
+            "chronic_load": float(chronic[i]),
+            "updated_at": now,
+        }
+        for i, (user_id, load_date, load, tonnage, count) in enumerate(totals)
+    ])
+    return len(totals)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's training load")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Users per chunk (default: 500)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id:
+            user_ids = [args.user_id]
+        else:
+            user_ids = [user_id for (user_id,) in db.query(User.id).order_by(User.id)]
+
+        written = 0
+        for start in range(0, len(user_ids), args.chunk_size):
+            written += rebuild_chunk(db, user_ids[start:start + args.chunk_size])
+            db.commit()
+        print(f"Rebuilt {written} training load day(s) for {len(user_ids)} user(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
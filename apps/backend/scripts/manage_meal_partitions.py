@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Maintain monthly partitions of the meals table.
+
+Creates partitions for the upcoming months and, when a retention window
+is configured, detaches older partitions into an archive schema.
+Meant to run from cron (e.g. daily); it is idempotent.
+
+Usage:
+    python scripts/manage_meal_partitions.py [--months-ahead N] [--retain-months N]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.config import get_settings
+from src.core.database import get_engine
+from src.database.partitions import ensure_meal_partitions, detach_old_meal_partitions
+
+
+def main() -> None:
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--months-ahead", type=int, default=settings.MEAL_PARTITION_MONTHS_AHEAD,
+                        help="Number of future months to pre-create")
+    parser.add_argument("--retain-months", type=int, default=settings.MEAL_PARTITION_RETENTION_MONTHS,
+                        help="Detach partitions older than this many months (0 = keep all)")
+    parser.add_argument("--archive-schema", default=settings.MEAL_PARTITION_ARCHIVE_SCHEMA,
+                        help="Schema that receives detached partitions")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    with engine.begin() as conn:
+        created = ensure_meal_partitions(conn, args.months_ahead)
+    print(f"Created partitions: {', '.join(created) or 'none'}")
+
+    if args.retain_months > 0:
+        with engine.begin() as conn:
+            detached = detach_old_meal_partitions(conn, args.retain_months, args.archive_schema)
+        print(f"Detached partitions: {', '.join(detached) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild activity calendars from workouts, meals and body measurements.
+
+Calendars are normally maintained incrementally by the services; run this
+after the activity_calendars migration or to repair drift. The rebuild is
+a single set-based statement.
+
+Usage:
+    python scripts/rebuild_activity_calendar.py [--user-id ID]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import SessionLocal
+from src.api.services.activity_calendar_service import ActivityCalendarService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's calendars")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ActivityCalendarService.rebuild(db, args.user_id)
+        db.commit()
+        print("Rebuilt activity calendars")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Rebuild exercise personal records from workout history.
+
+Records are normally maintained incrementally by WorkoutService; run this
+after the exercise_records migration or to repair drift.
+
+Usage:
+    python scripts/rebuild_exercise_records.py [--user-id ID]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import SessionLocal
+from src.database.models import User
+from src.api.services.exercise_record_service import ExerciseRecordService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's records")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id:
+            user_ids = [args.user_id]
+        else:
+            user_ids = [user_id for (user_id,) in db.query(User.id).order_by(User.id)]
+
+        for user_id in user_ids:
+            ExerciseRecordService.rebuild_records(db, user_id)
+            db.commit()
+        print(f"Rebuilt exercise records for {len(user_ids)} user(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
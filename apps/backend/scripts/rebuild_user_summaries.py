@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild user summaries from the source tables.
+
+Summaries are normally maintained by every service write; run this after
+the user_summaries migration or to repair drift. The rebuild is a single
+set-based statement.
+
+Usage:
+    python scripts/rebuild_user_summaries.py [--user-id ID]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import SessionLocal
+from src.api.services.user_summary_service import UserSummaryService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's summary")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        UserSummaryService.rebuild(db, args.user_id)
+        db.commit()
+        print("Rebuilt user summaries")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Recompute the stored BMI of every body measurement from current user heights.
+
+Profile height changes already trigger this per user; run it after bulk
+imports or to repair drift. Users are processed in id ranges, each range
+being a single set-based UPDATE committed on its own; the data version of
+every user whose BMI changed is then bumped, invalidating their cached
+trends and comparison ETags.
+
+Usage:
+    python scripts/recalculate_bmi.py [--user-id ID] [--chunk-size N]
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+
+from src.core.cache import bump_user_data_version
+from src.core.database import SessionLocal
+from src.database.models import User
+from src.api.services.body_measurement_service import BodyMeasurementService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only recompute this user's measurements")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="User ids per UPDATE (default: 1000)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id:
+            updated, _ = BodyMeasurementService.recalculate_bmi(db, user_id=args.user_id)
+            db.commit()
+            bump_user_data_version(args.user_id)
+            print(f"Updated BMI of {updated} measurement(s)")
+            return
+
+        low, high = db.query(func.min(User.id), func.max(User.id)).one()
+        updated = 0
+        if low is not None:
+            for start in range(low, high + 1, args.chunk_size):
+                changed, user_ids = BodyMeasurementService.recalculate_bmi(
+                    db, min_user_id=start, max_user_id=start + args.chunk_size
+                )
+                db.commit()
+                for user_id in user_ids:
+                    bump_user_data_version(user_id)
+                updated += changed
+        print(f"Updated BMI of {updated} measurement(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
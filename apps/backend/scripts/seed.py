@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Generate a deterministic synthetic dataset at production scale.
+
+Creates N users with multi-year histories: body measurement trajectories
+(weight trend, seasonality and noise, circumferences and skin folds for
+some users), workouts with exercises from the catalog, several meals per
+logged day, goals and progress photos.
+
+Every user is generated from its own RNG seeded with (--seed, user index),
+so the data does not depend on the number of workers or shard order. Pass
+--end-date to get identical data on another day. Ids of child rows follow
+load order.
+
+Users are split into shards processed by parallel worker processes. Each
+shard is generated with NumPy and loaded with COPY; user and workout ids
+are reserved in blocks from their sequences up front so exercises can
+reference their workouts without a round trip. Derived tables (records,
+training load, streaks, calendars, summaries) are rebuilt per shard
+afterwards unless --skip-derived is given.
+
+Meant for an empty development database; emails are seed-user-<n>@<domain>.
+
+Usage:
+    python scripts/seed.py [--users N] [--years Y] [--seed S] [--workers W]
+        [--shard-size N] [--end-date YYYY-MM-DD] [--skip-derived]
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from src.core.database import SessionLocal, get_engine
+from src.core.security import hash_password
+from src.database.partitions import ensure_meal_partitions
+from src.shared.body_composition import SKINFOLD_SITES, age_in_years, estimate_body_fat
+from src.api.services.activity_calendar_service import ActivityCalendarService
+from src.api.services.exercise_record_service import ExerciseRecordService
+from src.api.services.streak_service import StreakService
+from src.api.services.user_summary_service import UserSummaryService
+
+SEED_PASSWORD = "Seed12345!"
+MEAL_TYPES = ("breakfast", "lunch", "snack", "dinner")
+MEAL_NAMES = {
+    "breakfast": ("Pão com ovos", "Tapioca", "Iogurte com granola", "Aveia com banana"),
+    "lunch": ("Arroz, feijão e frango", "Salada com atum", "Macarrão com carne", "Peixe com legumes"),
+    "snack": ("Whey protein", "Frutas", "Castanhas", "Sanduíche natural"),
+    "dinner": ("Omelete", "Sopa de legumes", "Frango grelhado", "Carne com batata doce"),
+}
+CARDIO_TYPES = ("running", "cycling", "swimming")
+OTHER_TYPES = ("yoga", "hiit")
+GOAL_TYPES = ("weight_loss", "muscle_gain", "strength", "endurance")
+
+MEASUREMENT_COLUMNS = (
+    "user_id", "measurement_date", "weight_kg", "body_fat_percentage", "muscle_mass_kg", "bmi",
+    "waist_cm", "hips_cm", "chest_cm", "right_bicep_cm", *SKINFOLD_SITES,
+    "body_fat_jp3", "body_fat_jp7", "body_fat_dw", "created_at", "updated_at",
+)
+
+
+# --- COPY helpers -----------------------------------------------------------
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, float):
+        return "\\N" if value != value else repr(round(value, 2))
+    return str(value)
+
+
+def copy_rows(cursor, table: str, columns, rows) -> int:
+    """Load rows (tuples matching columns) with COPY ... FROM STDIN."""
+    if not rows:
+        return 0
+    buffer = io.StringIO()
+    buffer.writelines("\t".join(map(_copy_value, row)) + "\n" for row in rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return len(rows)
+
+
+def reserve_ids(cursor, table: str, count: int) -> int:
+    """Reserve `count` consecutive ids from the table's sequence; returns the first."""
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", (table,))
+    sequence = cursor.fetchone()[0]
+    cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (sequence,))
+    cursor.execute("SELECT nextval(%s)", (sequence,))
+    first = cursor.fetchone()[0]
+    if count > 1:
+        cursor.execute("SELECT setval(%s, %s)", (sequence, first + count - 1))
+    return first
+
+
+# --- Generators -------------------------------------------------------------
+
+def days_of(start: date, offsets: np.ndarray) -> list:
+    return [start + timedelta(days=int(offset)) for offset in offsets]
+
+
+def timestamps(days: list, rng: np.random.Generator) -> list:
+    seconds = rng.integers(6 * 3600, 23 * 3600, len(days))
+    return [datetime(d.year, d.month, d.day) + timedelta(seconds=int(s)) for d, s in zip(days, seconds)]
+
+
+def generate_user(index: int, user_id: int, args, catalog, password_hash: str) -> dict:
+    """All rows of one user, except exercises' workout ids (filled in by the shard)."""
+    rng = np.random.default_rng([args.seed, index])
+    male = rng.random() < 0.5
+    height = int(np.clip(rng.normal(177 if male else 164, 7), 150, 205))
+    birth = args.end_date - timedelta(days=int(rng.integers(18 * 365, 60 * 365)))
+    history_days = int(rng.integers(90, args.years * 365 + 1))
+    start = args.end_date - timedelta(days=history_days)
+    joined = datetime(start.year, start.month, start.day, 9)
+
+    user = (
+        user_id, f"seed-user-{index}@{args.email_domain}", f"Seed User {index}", password_hash,
+        birth, "male" if male else "female", height, None, True, True, False, joined, joined,
+        datetime(args.end_date.year, args.end_date.month, args.end_date.day, 8),
+    )
+
+    # Body measurements: trend + seasonality + random walk
+    gaps = rng.integers(3, 11, history_days // 3 + 1)
+    offsets = np.cumsum(gaps)
+    offsets = offsets[offsets <= history_days]
+    t = offsets / 365.0
+    start_weight = np.clip(rng.normal(84 if male else 68, 13), 45, 150)
+    # Overall change of a few percent of the start weight, mostly losses
+    change = np.clip(rng.normal(-0.04, 0.07), -0.2, 0.15) * start_weight
+    weight = (
+        start_weight
+        + change * offsets / history_days
+        + 0.8 * np.sin(2 * np.pi * (t + rng.random()))
+        + np.cumsum(rng.normal(0, 0.2, len(offsets)))
+    )
+    weight = np.round(np.clip(weight, 17 * (height / 100) ** 2, 200), 1)
+    bmi = np.round(weight / (height / 100) ** 2, 2)
+    n = len(offsets)
+    nan = np.full(n, np.nan)
+
+    tracks_fat = rng.random() < 0.4
+    base_fat = (19 if male else 27) + (start_weight - (84 if male else 68)) * 0.3
+    body_fat = np.round(base_fat + (weight - start_weight) * 0.5 + rng.normal(0, 0.7, n), 1) if tracks_fat else nan
+    muscle = np.round(weight * (0.45 if male else 0.38) + rng.normal(0, 0.4, n), 1) if tracks_fat else nan
+
+    tape = rng.random(n) < 0.5
+    waist = np.where(tape, np.round(weight * 0.95 + rng.normal(0, 1.5, n), 1), np.nan)
+    hips = np.where(tape, np.round(weight * 0.6 + 50 + rng.normal(0, 1.5, n), 1), np.nan)
+    chest = np.where(tape, np.round(weight * 0.55 + 55 + rng.normal(0, 1.5, n), 1), np.nan)
+    bicep = np.where(tape, np.round(weight * 0.2 + 17 + rng.normal(0, 0.6, n), 1), np.nan)
+
+    skinfold_mask = (rng.random(n) < 0.5) if rng.random() < 0.25 else np.zeros(n, dtype=bool)
+    fat_level = np.clip(weight / start_weight, 0.7, 1.3)
+    skinfolds = {}
+    for site in SKINFOLD_SITES:
+        site_base = rng.uniform(6, 22) * (0.8 if male else 1.2)
+        skinfolds[site] = np.where(
+            skinfold_mask, np.round(np.clip(site_base * fat_level + rng.normal(0, 1, n), 2, 60), 1), np.nan
+        )
+    measurement_days = days_of(start, offsets)
+    estimates = estimate_body_fat(
+        skinfolds,
+        age_in_years(np.full(n, birth.toordinal()), np.array([d.toordinal() for d in measurement_days])),
+        np.full(n, 1.0 if male else 0.0),
+    )
+    created = timestamps(measurement_days, rng)
+    measurements = [
+        (
+            user_id, measurement_days[i], float(weight[i]), float(body_fat[i]), float(muscle[i]), float(bmi[i]),
+            float(waist[i]), float(hips[i]), float(chest[i]), float(bicep[i]),
+            *[float(skinfolds[site][i]) for site in SKINFOLD_SITES],
+            float(estimates["body_fat_jp3"][i]), float(estimates["body_fat_jp7"][i]),
+            float(estimates["body_fat_dw"][i]), created[i], created[i],
+        )
+        for i in range(n)
+    ]
+
+    # Workouts: each day trains with the user's own probability
+    workout_offsets = np.flatnonzero(rng.random(history_days + 1) < rng.uniform(0.2, 0.65))
+    kinds = rng.choice(3, len(workout_offsets), p=(0.6, 0.3, 0.1))
+    workout_days = days_of(start, workout_offsets)
+    workout_created = timestamps(workout_days, rng)
+    workouts, exercises = [], []
+    strength_catalog = [entry for entry in catalog if entry[2] != "cardio"]
+    cardio_catalog = {entry[1].lower(): entry for entry in catalog if entry[2] == "cardio"}
+    progression = 1 + 0.15 * (workout_offsets / max(history_days, 1))
+    strength_level = rng.uniform(0.5, 1.3) * (1.0 if male else 0.65)
+    for i, kind in enumerate(kinds):
+        duration = int(rng.integers(30, 91))
+        intensity = ("low", "medium", "high")[int(rng.integers(0, 3))]
+        if kind == 0:
+            workout_type = "strength"
+            picks = rng.choice(
+                len(strength_catalog), min(int(rng.integers(3, 7)), len(strength_catalog)), replace=False
+            )
+            for order, pick in enumerate(picks):
+                catalog_id, name, exercise_type = strength_catalog[pick]
+                base = 60 if exercise_type == "compound" else 20
+                exercises.append((
+                    i, catalog_id, name, exercise_type, int(rng.integers(3, 5)), int(rng.integers(6, 13)),
+                    float(round(base * strength_level * progression[i] + rng.normal(0, 2), 1)),
+                    90, None, None, order, workout_created[i],
+                ))
+        elif kind == 1:
+            workout_type = CARDIO_TYPES[int(rng.integers(0, len(CARDIO_TYPES)))]
+            entry = cardio_catalog.get("running" if workout_type == "running" else "cycling")
+            distance = round(duration / 60 * (10 if workout_type == "running" else 25) * rng.uniform(0.8, 1.2), 2)
+            exercises.append((
+                i, entry[0] if entry else None, entry[1] if entry else workout_type.title(), "cardio",
+                None, None, None, None, distance, duration, 0, workout_created[i],
+            ))
+        else:
+            workout_type = OTHER_TYPES[int(rng.integers(0, len(OTHER_TYPES)))]
+        workouts.append((
+            user_id, workout_days[i], workout_type, duration, int(duration * rng.uniform(5, 11)),
+            intensity, ("great", "good", "ok", "tired")[int(rng.integers(0, 4))],
+            workout_created[i], workout_created[i],
+        ))
+
+    # Meals: logged days get three to five meals
+    logging_rate = rng.uniform(0.4, 0.95)
+    meal_offsets = np.flatnonzero(rng.random(history_days + 1) < logging_rate)
+    meals_per_day = rng.integers(3, 6, len(meal_offsets))
+    calorie_target = (2500 if male else 1900) * rng.uniform(0.85, 1.15)
+    meals = []
+    for offset, count in zip(meal_offsets, meals_per_day):
+        day = start + timedelta(days=int(offset))
+        types = ("breakfast", "lunch", "dinner", "snack", "snack")[:count]
+        for meal_type in types:
+            calories = int(calorie_target / count * rng.uniform(0.6, 1.4))
+            names = MEAL_NAMES[meal_type]
+            hour = {"breakfast": 7, "lunch": 12, "snack": 16, "dinner": 20}[meal_type]
+            eaten = datetime(day.year, day.month, day.day, hour, int(rng.integers(0, 60)))
+            meals.append((
+                user_id, day, eaten.time(), meal_type, names[int(rng.integers(0, len(names)))], calories,
+                round(calories * 0.25 / 4, 1), round(calories * 0.5 / 4, 1), round(calories * 0.25 / 9, 1),
+                round(rng.uniform(2, 10), 1), int(rng.integers(200, 800)), eaten, eaten,
+            ))
+
+    # Goals
+    goals = []
+    for g in range(int(rng.integers(1, 4))):
+        goal_type = GOAL_TYPES[int(rng.integers(0, len(GOAL_TYPES)))]
+        goal_start = start + timedelta(days=int(rng.integers(0, history_days + 1)))
+        completed = rng.random() < 0.3
+        target_weight = round(float(start_weight) * (0.9 if goal_type == "weight_loss" else 1.05), 1)
+        created_at = datetime(goal_start.year, goal_start.month, goal_start.day, 10)
+        goals.append((
+            user_id, goal_type, f"{goal_type.replace('_', ' ').title()} {g + 1}",
+            target_weight if goal_type in ("weight_loss", "muscle_gain") else None,
+            goal_start, goal_start + timedelta(days=int(rng.integers(60, 240))),
+            goal_start + timedelta(days=int(rng.integers(30, 120))) if completed else None,
+            bool(completed), not completed and g == 0,
+            100.0 if completed else round(float(rng.uniform(0, 90)), 1), created_at, created_at,
+        ))
+
+    # Progress photos: roughly monthly, for half of the users
+    photos = []
+    if rng.random() < 0.5:
+        for offset in range(0, history_days + 1, int(rng.integers(25, 45))):
+            day = start + timedelta(days=offset)
+            for photo_type in ("front", "side"):
+                created_at = datetime(day.year, day.month, day.day, 8)
+                photos.append((
+                    user_id, day, f"https://storage.example.com/progress-photos/{user_id}/{photo_type}/{offset}.jpg",
+                    photo_type, int(weight[min(np.searchsorted(offsets, offset), n - 1)]) if n else None,
+                    created_at, created_at,
+                ))
+
+    return {
+        "user": user, "measurements": measurements, "workouts": workouts, "exercises": exercises,
+        "meals": meals, "goals": goals, "photos": photos,
+    }
+
+
+# --- Shards -----------------------------------------------------------------
+
+def load_shard(task) -> dict:
+    """Generate and COPY the users with indexes [first, last)."""
+    first, last, first_user_id, args, catalog, password_hash = task
+    users = [
+        generate_user(index, first_user_id + (index - first), args, catalog, password_hash)
+        for index in range(first, last)
+    ]
+
+    counts = {}
+    connection = get_engine().raw_connection()
+    try:
+        cursor = connection.cursor()
+        workouts = [row for user in users for row in user["workouts"]]
+        first_workout_id = reserve_ids(cursor, "workouts", len(workouts)) if workouts else 0
+        connection.commit()
+
+        counts["users"] = copy_rows(cursor, "users", (
+            "id", "email", "full_name", "hashed_password", "date_of_birth", "gender", "height_cm",
+            "target_weight_kg", "is_active", "is_verified", "is_admin", "created_at", "updated_at", "last_login",
+        ), [user["user"] for user in users])
+        counts["body_measurements"] = copy_rows(
+            cursor, "body_measurements", MEASUREMENT_COLUMNS, [row for user in users for row in user["measurements"]]
+        )
+        counts["workouts"] = copy_rows(cursor, "workouts", (
+            "id", "user_id", "workout_date", "workout_type", "duration_minutes", "calories_burned",
+            "intensity", "feeling", "created_at", "updated_at",
+        ), [(first_workout_id + i, *row) for i, row in enumerate(workouts)])
+
+        exercises, offset = [], 0
+        for user in users:
+            exercises.extend((first_workout_id + offset + row[0], *row[1:]) for row in user["exercises"])
+            offset += len(user["workouts"])
+        counts["exercises"] = copy_rows(cursor, "exercises", (
+            "workout_id", "catalog_id", "exercise_name", "exercise_type", "sets", "reps", "weight_kg",
+            "rest_seconds", "distance_km", "duration_minutes", "order_index", "created_at",
+        ), exercises)
+        counts["meals"] = copy_rows(cursor, "meals", (
+            "user_id", "meal_date", "meal_time", "meal_type", "meal_name", "calories", "protein_g",
+            "carbs_g", "fats_g", "fiber_g", "water_ml", "created_at", "updated_at",
+        ), [row for user in users for row in user["meals"]])
+        counts["goals"] = copy_rows(cursor, "goals", (
+            "user_id", "goal_type", "title", "target_weight_kg", "start_date", "target_date",
+            "completed_date", "is_completed", "is_active", "current_progress", "created_at", "updated_at",
+        ), [row for user in users for row in user["goals"]])
+        counts["progress_photos"] = copy_rows(cursor, "progress_photos", (
+            "user_id", "photo_date", "photo_url", "photo_type", "weight_at_photo_kg", "created_at", "updated_at",
+        ), [row for user in users for row in user["photos"]])
+        connection.commit()
+    finally:
+        connection.close()
+
+    if not args.skip_derived:
+        rebuild_derived([user["user"][0] for user in users])
+    return counts
+
+
+def rebuild_derived(user_ids) -> None:
+    """Rebuild the tables services maintain on write, for a shard of users."""
+    from backfill_training_load import rebuild_chunk
+
+    db = SessionLocal()
+    try:
+        rebuild_chunk(db, user_ids)
+        for user_id in user_ids:
+            ExerciseRecordService.rebuild_records(db, user_id)
+            StreakService.rebuild(db, user_id)
+            ActivityCalendarService.rebuild(db, user_id)
+            UserSummaryService.rebuild(db, user_id)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _init_worker() -> None:
+    # Connections inherited from the parent must not be shared
+    get_engine().dispose(close=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000, help="Users to generate (default: 1000)")
+    parser.add_argument("--years", type=int, default=3, help="Maximum history length in years (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=50, help="Users per shard (default: 50)")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="Last day of history (default: today)")
+    parser.add_argument("--email-domain", default="example.com", help="Domain of generated emails")
+    parser.add_argument("--skip-derived", action="store_true", help="Do not rebuild derived tables")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    with get_engine().begin() as conn:
+        start = args.end_date - timedelta(days=args.years * 365)
+        ensure_meal_partitions(conn, start=start)
+        catalog = [tuple(row) for row in conn.execute(
+            text("SELECT id, name, exercise_type FROM exercise_catalog ORDER BY id")
+        )]
+
+    connection = get_engine().raw_connection()
+    try:
+        first_user_id = reserve_ids(connection.cursor(), "users", args.users)
+        connection.commit()
+    finally:
+        connection.close()
+
+    password_hash = hash_password(SEED_PASSWORD)
+    tasks = [
+        (first, min(first + args.shard_size, args.users), first_user_id + first, args, catalog, password_hash)
+        for first in range(0, args.users, args.shard_size)
+    ]
+
+    totals = {}
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        for done, counts in enumerate(pool.imap_unordered(load_shard, tasks), 1):
+            for table, count in counts.items():
+                totals[table] = totals.get(table, 0) + count
+            print(f"\rShards {done}/{len(tasks)}, {sum(totals.values()):,} rows", end="", flush=True)
+    print()
+
+    with get_engine().connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+
+    for table, count in totals.items():
+        print(f"  {table:<20} {count:>14,}")
+    print(f"Loaded {sum(totals.values()):,} rows in {time.monotonic() - started:.1f}s "
+          f"(users {first_user_id}..{first_user_id + args.users - 1}, password '{SEED_PASSWORD}')")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ from .meals import router as meals_router
 from .goals import router as goals_router
 from .progress_photos import router as progress_photos_router
 from .admin import router as admin_router
+from .analytics import router as analytics_router
+from .dashboard import router as dashboard_router
+from .exercises import router as exercises_router
+from .search import router as search_router
+from .activity import router as activity_router
 
 __all__ = [
     "auth_router",
@@ -17,4 +22,9 @@ __all__ = [
     "goals_router",
     "progress_photos_router",
     "admin_router",
+    "analytics_router",
+    "dashboard_router",
+    "exercises_router",
+    "search_router",
+    "activity_router",
 ]
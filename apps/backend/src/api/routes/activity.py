@@ -0,0 +1,42 @@
+"""
+Activity routes - yearly activity heatmap.
+"""
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+
+from ...core.cache import etag_matches
+from ...core.database import get_db
+from ...core.dependencies import get_current_active_user
+from ...database.models import User
+from ..schemas.activity import ActivityCalendarResponse
+from ..services.activity_calendar_service import ActivityCalendarService
+
+router = APIRouter(prefix="/activity", tags=["Activity"])
+
+
+@router.get("/calendar", response_model=ActivityCalendarResponse)
+async def get_activity_calendar(
+    request: Request,
+    response: Response,
+    year: Optional[int] = Query(None, ge=1900, le=2100, description="Calendar year (default: current year)"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get daily workout, meal and measurement counts for a year.
+
+    Served from a precomputed per-year row. Responses carry an ETag tied
+    to the calendar version, so unchanged calendars return 304.
+    """
+    year = year or date.today().year
+    version = ActivityCalendarService.get_version(db, current_user.id, year)
+    etag = f'W/"activity-{current_user.id}-{year}-{version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    calendar = ActivityCalendarService.get_calendar(db, current_user.id, year)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return ActivityCalendarService.calendar_response(calendar, year)
@@ -1,8 +1,27 @@
 """
 Administrative endpoints for database management.
 """
-from fastapi import APIRouter, HTTPException
-from src.core.database import Base, engine
+import asyncio
+import tracemalloc
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from src.core.config import get_settings
+from src.core.database import Base, init_db
+from src.core import memory
+from src.core.dependencies import get_current_admin_user
+from src.core.profiler import profile_filename, stop_sampler, try_start_sampler
+from src.core.query_monitor import get_query_monitor
+from src.database.models import User
+from src.api.schemas.admin import (
+    MemoryGroupBy,
+    MemoryStatusResponse,
+    MemoryTracingUpdate,
+    QueryMonitorSettings,
+    QueryMonitorUpdate,
+)
+
+settings = get_settings()
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -14,8 +33,8 @@ async def initialize_database():
     WARNING: This is a one-time operation for initial setup.
     """
     try:
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        # Create all tables (and the initial meal partitions)
+        init_db()
         return {
             "status": "success",
             "message": "Database tables created successfully",
@@ -23,3 +42,132 @@ async def initialize_database():
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create tables: {str(e)}")
+
+
+@router.get("/query-monitor", response_model=QueryMonitorSettings)
+async def get_query_monitor_settings(
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Get the slow-query log and N+1 detector settings of this worker.
+
+    Requires admin authentication.
+    """
+    return get_query_monitor().settings()
+
+
+@router.put("/query-monitor", response_model=QueryMonitorSettings)
+async def update_query_monitor_settings(
+    update: QueryMonitorUpdate,
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Enable, disable or tune the query monitor at runtime.
+
+    Applies to the worker process serving the request only.
+    Requires admin authentication.
+    """
+    monitor = get_query_monitor()
+    monitor.configure(**update.model_dump(exclude_unset=True))
+    return monitor.settings()
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(10, gt=0, le=settings.PROFILER_MAX_SECONDS),
+    interval_ms: float = Query(settings.PROFILER_INTERVAL_MS, ge=1, le=1000),
+    include_idle: bool = Query(False, description="Keep samples of threads that are only waiting"),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Sample the stacks of the worker serving this request for `seconds`.
+
+    Traffic keeps being served while sampling. Returns collapsed stacks
+    (flamegraph.pl / speedscope format). Requires admin authentication.
+    """
+    sampler = try_start_sampler(interval_ms / 1000, include_idle)
+    if sampler is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running on this worker"
+        )
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        stop_sampler(sampler)
+
+    return PlainTextResponse(
+        sampler.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile_filename()}"',
+            "X-Profile-Samples": str(sampler.samples),
+        }
+    )
+
+
+@router.get("/memory", response_model=MemoryStatusResponse)
+async def get_memory_status(
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Get this worker's RSS and tracemalloc totals.
+
+    Requires admin authentication.
+    """
+    return memory.memory_status([])
+
+
+@router.put("/memory/tracing", response_model=MemoryStatusResponse)
+def set_memory_tracing(
+    update: MemoryTracingUpdate,
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Start or stop tracemalloc on this worker.
+
+    Tracing slows allocations down; stop it when done. Requires admin
+    authentication.
+    """
+    memory.set_tracing(update.enabled, update.frames)
+    return memory.memory_status([])
+
+
+@router.post("/memory/snapshot", response_model=MemoryStatusResponse)
+def take_memory_snapshot(
+    group_by: MemoryGroupBy = "lineno",
+    top: int = Query(20, ge=1, le=200),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Store a tracemalloc snapshot as the baseline for /memory/diff.
+
+    Returns the largest allocations in the snapshot. A plain def: snapshots
+    of a large heap take seconds, so this runs in the threadpool instead of
+    blocking the event loop. Requires admin authentication.
+    """
+    if not tracemalloc.is_tracing():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Memory tracing is not running on this worker"
+        )
+    return memory.take_baseline(group_by, top)
+
+
+@router.get("/memory/diff", response_model=MemoryStatusResponse)
+def diff_memory_snapshot(
+    group_by: MemoryGroupBy = "lineno",
+    top: int = Query(20, ge=1, le=200),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    Compare the live heap with the baseline snapshot, largest growth first.
+
+    Runs in the threadpool, like /memory/snapshot. Requires admin
+    authentication.
+    """
+    if not tracemalloc.is_tracing() or not memory.has_baseline():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Start memory tracing and take a snapshot first"
+        )
+    return memory.diff_with_baseline(group_by, top)
@@ -0,0 +1,48 @@
+"""
+Analytics routes.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+
+from ...core.database import get_db
+from ...core.dependencies import get_current_active_user
+from ...database.models import User
+from ..schemas.analytics import BodyTrendsResponse, TrainingLoadResponse
+from ..services.analytics_service import AnalyticsService
+from ..services.training_load_service import TrainingLoadService
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+@router.get("/body-trends", response_model=BodyTrendsResponse)
+async def get_body_trends(
+    window_days: int = Query(90, ge=7, le=730, description="Days of history used for trends"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get trend statistics for all measurement fields.
+
+    Includes 7/30-day moving averages, an EWMA trend value, linear and
+    robust (Theil-Sen) slopes, and a projected date to reach the target weight.
+    """
+    return AnalyticsService.get_body_trends(db, current_user, window_days)
+
+
+@router.get("/training-load", response_model=TrainingLoadResponse)
+async def get_training_load(
+    days: int = Query(90, ge=7, le=730, description="Number of days in the series"),
+    end_date: Optional[date] = Query(None, description="Last day of the series (default: today)"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get daily training load with acute (7-day) and chronic (28-day)
+    exponentially weighted averages and their ratio.
+
+    Load is workout duration times an intensity factor (low 3, medium 5,
+    high 8); tonnage is sets x reps x weight.
+    """
+    return TrainingLoadService.get_training_load(db, current_user.id, days, end_date)
@@ -1,18 +1,21 @@
 """
 Body measurement routes.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 
+from ...core.cache import etag_matches, get_user_data_version
 from ...core.database import get_db
 from ...core.dependencies import get_current_active_user
 from ...database.models import User
 from ..schemas.body_measurement import (
     BodyMeasurementCreate,
     BodyMeasurementUpdate,
-    BodyMeasurementResponse
+    BodyMeasurementResponse,
+    BodyMeasurementSeriesResponse,
+    BodyMeasurementComparisonResponse
 )
 from ..services.body_measurement_service import BodyMeasurementService
 
@@ -65,6 +68,61 @@ async def get_latest_measurement(
     return measurement
 
 
+@router.get("/series", response_model=BodyMeasurementSeriesResponse)
+async def get_measurement_series(
+    metric: str = Query("weight_kg", description="Measurement field to chart"),
+    points: int = Query(200, ge=3, le=2000, description="Maximum points returned"),
+    method: str = Query("lttb", pattern="^(lttb|average)$", description="Downsampling method"),
+    start_date: Optional[date] = Query(None, description="Filter by start date"),
+    end_date: Optional[date] = Query(None, description="Filter by end date"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a chart-ready series for one metric.
+
+    Returns columnar `dates`/`values` downsampled server-side, so the
+    payload size is bounded by `points` regardless of history length.
+    """
+    series = BodyMeasurementService.get_measurement_series(
+        db, current_user.id, metric, points, method, start_date, end_date
+    )
+    return series
+
+
+@router.get("/compare", response_model=BodyMeasurementComparisonResponse)
+async def compare_measurements(
+    request: Request,
+    response: Response,
+    from_date: date = Query(..., alias="from", description="Start date"),
+    to_date: date = Query(..., alias="to", description="End date"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Compare all measurement fields between two dates.
+
+    Uses the nearest measurement on or before each date and returns
+    per-field deltas and percent change. Responses carry an ETag tied to
+    the user's data version, so unchanged comparisons return 304 (no ETag
+    is sent while the version is unknown, i.e. the cache is down).
+    """
+    version = get_user_data_version(current_user.id)
+    if version is None:
+        return BodyMeasurementService.compare_measurements(db, current_user.id, from_date, to_date)
+
+    etag = f'W/"compare-{current_user.id}-{version}-{from_date}-{to_date}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    comparison = BodyMeasurementService.compare_measurements(
+        db, current_user.id, from_date, to_date
+    )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return comparison
+
+
 @router.get("/{measurement_id}", response_model=BodyMeasurementResponse)
 async def get_measurement(
     measurement_id: int,
@@ -0,0 +1,45 @@
+"""
+Dashboard routes.
+"""
+from fastapi import APIRouter, Depends, Query, Response
+from typing import Optional
+from datetime import date
+import time
+
+from ...core.config import get_settings
+from ...core.dependencies import get_current_active_user
+from ...database.models import User
+from ..schemas.dashboard import DashboardResponse
+from ..services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+settings = get_settings()
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    response: Response,
+    target_date: Optional[date] = Query(None, description="Day to summarize (defaults to today)"),
+    stats_days: int = Query(30, ge=1, le=365, description="Days covered by workout stats"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the whole dashboard in one round trip.
+
+    Combines the profile, latest measurement, active goals, workout stats
+    and today's nutrition. Per-section timings are reported in the
+    `Server-Timing` header; sections that fail or miss the latency budget
+    are returned as null and listed in `incomplete_sections`.
+    """
+    started = time.perf_counter()
+    dashboard, timings = await DashboardService.get_dashboard(
+        current_user, target_date or date.today(), stats_days
+    )
+    total_ms = (time.perf_counter() - started) * 1000
+
+    response.headers["Server-Timing"] = ", ".join(
+        [f"{name};dur={duration:.1f}" for name, duration in timings.items()]
+        + [f"total;dur={total_ms:.1f}"]
+    )
+    response.headers["X-Latency-Budget-Ms"] = str(settings.DASHBOARD_LATENCY_BUDGET_MS)
+    return dashboard
@@ -0,0 +1,98 @@
+"""
+Exercise routes - catalog search, personal records and progression.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+
+from ...core.database import get_db
+from ...core.dependencies import get_current_active_user
+from ...database.models import User
+from ..schemas.exercise_record import (
+    ExerciseRecordResponse,
+    PRCheckRequest,
+    PRCheckResponse,
+    ExerciseProgressionResponse,
+    ExerciseCatalogResponse
+)
+from ..services.exercise_catalog_service import ExerciseCatalogService
+from ..services.exercise_record_service import ExerciseRecordService
+
+router = APIRouter(prefix="/exercises", tags=["Exercises"])
+
+
+@router.get("/search", response_model=List[ExerciseCatalogResponse])
+async def search_exercises(
+    q: str = Query(..., min_length=1, max_length=200, description="Partial exercise name"),
+    limit: int = Query(10, ge=1, le=20, description="Maximum number of results"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Autocomplete exercise names from the catalog.
+
+    Matches any alias (Portuguese or English) by prefix of the name or of
+    any of its words, falling back to typo-tolerant trigram matching.
+    """
+    results = ExerciseCatalogService.search(db, q, limit)
+    return results
+
+
+@router.get("/records", response_model=List[ExerciseRecordResponse])
+async def get_exercise_records(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Get personal records for every exercise the user has logged."""
+    records = ExerciseRecordService.get_user_records(db, current_user.id)
+    return records
+
+
+@router.get("/records/lookup", response_model=ExerciseRecordResponse)
+async def get_exercise_record(
+    name: str = Query(..., min_length=1, max_length=200, description="Exercise name"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Get personal records for one exercise."""
+    record = ExerciseRecordService.get_record(db, current_user.id, name)
+    return record
+
+
+@router.post("/records/check", response_model=PRCheckResponse)
+async def check_personal_record(
+    check_data: PRCheckRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Check whether a set would be a personal record.
+
+    Compares max weight, estimated 1RM (Epley) and volume against the
+    stored record, without scanning workout history.
+    """
+    result = ExerciseRecordService.check_personal_record(
+        db,
+        current_user.id,
+        check_data.exercise_name,
+        check_data.weight_kg,
+        check_data.reps,
+        check_data.sets
+    )
+    return result
+
+
+@router.get("/progression", response_model=ExerciseProgressionResponse)
+async def get_exercise_progression(
+    name: str = Query(..., min_length=1, max_length=200, description="Exercise name"),
+    start_date: Optional[date] = Query(None, description="Filter by start date"),
+    end_date: Optional[date] = Query(None, description="Filter by end date"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Get the best weight, estimated 1RM and volume per workout for one exercise."""
+    progression = ExerciseRecordService.get_progression(
+        db, current_user.id, name, start_date, end_date
+    )
+    return progression
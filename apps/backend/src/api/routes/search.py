@@ -0,0 +1,33 @@
+"""
+Search routes.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ...core.database import get_db
+from ...core.dependencies import get_current_active_user
+from ...database.models import User
+from ..schemas.search import SearchResponse, SearchType
+from ..services.search_service import SearchService
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    type: Optional[List[SearchType]] = Query(None, description="Restrict to result types"),
+    limit: int = Query(20, ge=1, le=50, description="Page size"),
+    cursor: Optional[str] = Query(None, max_length=200, description="Cursor from the previous page"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Search notes and descriptions of workouts, exercises, meals,
+    measurements, goals and progress photos.
+
+    Portuguese and English wording both match. Results are ordered by
+    relevance; pass next_cursor back to get the following page.
+    """
+    return SearchService.search(db, current_user.id, q, type, limit, cursor)
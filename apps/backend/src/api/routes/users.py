@@ -1,63 +1,106 @@
 """
 User routes - user profile management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
+from ...core.cache import bump_user_data_version
 from ...core.database import get_db
-from ...core.dependencies import get_current_active_user
+from ...core.dependencies import get_current_active_user, get_current_admin_user, get_current_user_with_summary
 from ...database.models import User
-from ..schemas.user import UserResponse, UserUpdate
+from ..schemas.user import UserProfileResponse, UserResponse, UserUpdate, UserSummaryResponse
+from ..services.account_service import AccountService
+from ..services.body_measurement_service import BodyMeasurementService
+from ..services.streak_service import StreakService
+from ..services.user_summary_service import UserSummaryService
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
-def get_current_admin_user(
-    current_user: User = Depends(get_current_active_user)
-) -> User:
-    """Verify that current user is an admin."""
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only administrators can access this resource"
-        )
-    return current_user
+@router.get("/me", response_model=UserProfileResponse)
+async def get_current_user_profile(
+    current_user: User = Depends(get_current_user_with_summary)
+):
+    """
+    Get current user profile with their totals and workout streak.
 
+    The profile, summary and streak rows are read with a single
+    primary-key lookup. Requires authentication.
+    """
+    return {
+        **UserResponse.model_validate(current_user).model_dump(),
+        "summary": UserSummaryService.to_dict(current_user.summary),
+        "streak": StreakService.streak_state(current_user.streak),
+    }
 
-@router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(
-    current_user: User = Depends(get_current_active_user)
+
+@router.get("/me/summary", response_model=UserSummaryResponse)
+async def get_current_user_summary(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
 ):
     """
-    Get current user profile.
+    Get totals across the user's measurements, workouts, meals, photos and goals.
 
-    Requires authentication.
+    Served from a row maintained on every write (single primary-key lookup).
     """
-    return current_user
+    return UserSummaryService.get_summary(db, current_user.id)
 
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user_profile(
     user_data: UserUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
     Update current user profile.
 
+    A height change recomputes the BMI of past measurements, and a gender or
+    birth date change their skinfold body-fat estimates, in the background.
+
     Requires authentication.
     """
     update_data = user_data.model_dump(exclude_unset=True)
+    height_changed = "height_cm" in update_data and update_data["height_cm"] != current_user.height_cm
+    body_fat_inputs_changed = any(
+        field in update_data and update_data[field] != getattr(current_user, field)
+        for field in ("gender", "date_of_birth")
+    )
     for field, value in update_data.items():
         setattr(current_user, field, value)
 
     db.commit()
     db.refresh(current_user)
+    bump_user_data_version(current_user.id)
+
+    if height_changed:
+        background_tasks.add_task(BodyMeasurementService.recalculate_user_bmi, current_user.id)
+    if body_fat_inputs_changed:
+        background_tasks.add_task(BodyMeasurementService.recalculate_user_body_fat, current_user.id)
 
     return current_user
 
 
+@router.delete("/me", status_code=202)
+async def delete_current_user_account(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Delete the current user's account and all of their data.
+
+    The account is deactivated immediately; its rows are removed in batches
+    in the background.
+    """
+    AccountService.deactivate_user(db, current_user)
+    background_tasks.add_task(AccountService.purge_user, current_user.id)
+    return {"message": "Account scheduled for deletion"}
+
+
 @router.get("/admin/all", response_model=List[UserResponse])
 async def get_all_users_admin(
     db: Session = Depends(get_db),
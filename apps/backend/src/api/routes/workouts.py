@@ -12,8 +12,10 @@ from ...database.models import User
 from ..schemas.workout import (
     WorkoutCreate,
     WorkoutUpdate,
-    WorkoutResponse
+    WorkoutResponse,
+    WorkoutStreakResponse
 )
+from ..services.streak_service import StreakService
 from ..services.workout_service import WorkoutService
 
 router = APIRouter(prefix="/workouts", tags=["Workouts"])
@@ -66,6 +68,19 @@ async def get_workout_stats(
     return stats
 
 
+@router.get("/streak", response_model=WorkoutStreakResponse)
+async def get_workout_streak(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get current and longest workout streaks and this/last week's workout counts.
+
+    Read from a precomputed row, independent of history length.
+    """
+    return StreakService.get_streak(db, current_user.id)
+
+
 @router.get("/{workout_id}", response_model=WorkoutResponse)
 async def get_workout(
     workout_id: int,
@@ -1,22 +1,58 @@
 """API schemas package."""
-from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token
-from .body_measurement import BodyMeasurementCreate, BodyMeasurementUpdate, BodyMeasurementResponse
+from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token, UserSummaryResponse, UserProfileResponse
+from .body_measurement import (
+    BodyMeasurementCreate,
+    BodyMeasurementUpdate,
+    BodyMeasurementResponse,
+    BodyMeasurementSeriesResponse,
+    BodyMeasurementComparisonResponse,
+)
 from .progress_photo import ProgressPhotoCreate, ProgressPhotoResponse
-from .workout import WorkoutCreate, WorkoutUpdate, WorkoutResponse, ExerciseCreate, ExerciseResponse
+from .workout import (
+    WorkoutCreate,
+    WorkoutUpdate,
+    WorkoutResponse,
+    ExerciseCreate,
+    ExerciseResponse,
+    WorkoutStreakResponse,
+)
 from .meal import MealCreate, MealUpdate, MealResponse
 from .goal import GoalCreate, GoalUpdate, GoalResponse
+from .analytics import MetricTrend, WeightForecast, BodyTrendsResponse, TrainingLoadResponse
+from .dashboard import DashboardResponse
+from .exercise_record import (
+    ExerciseRecordResponse,
+    PRCheckRequest,
+    PRCheckResponse,
+    ExerciseProgressionPoint,
+    ExerciseProgressionResponse,
+    ExerciseCatalogResponse,
+)
+from .search import SearchResult, SearchResponse
+from .activity import ActivityCalendarResponse
+from .admin import (
+    QueryMonitorSettings,
+    QueryMonitorUpdate,
+    MemoryTracingUpdate,
+    MemoryAllocation,
+    MemoryStatusResponse,
+)
 
 __all__ = [
     # User
     "UserCreate",
     "UserUpdate",
     "UserResponse",
+    "UserSummaryResponse",
+    "UserProfileResponse",
     "UserLogin",
     "Token",
     # Body Measurement
     "BodyMeasurementCreate",
     "BodyMeasurementUpdate",
     "BodyMeasurementResponse",
+    "BodyMeasurementSeriesResponse",
+    "BodyMeasurementComparisonResponse",
     # Progress Photo
     "ProgressPhotoCreate",
     "ProgressPhotoResponse",
@@ -26,6 +62,7 @@ __all__ = [
     "WorkoutResponse",
     "ExerciseCreate",
     "ExerciseResponse",
+    "WorkoutStreakResponse",
     # Meal
     "MealCreate",
     "MealUpdate",
@@ -34,4 +71,29 @@ __all__ = [
     "GoalCreate",
     "GoalUpdate",
     "GoalResponse",
+    # Analytics
+    "MetricTrend",
+    "WeightForecast",
+    "BodyTrendsResponse",
+    "TrainingLoadResponse",
+    # Dashboard
+    "DashboardResponse",
+    # Exercise Records
+    "ExerciseRecordResponse",
+    "PRCheckRequest",
+    "PRCheckResponse",
+    "ExerciseProgressionPoint",
+    "ExerciseProgressionResponse",
+    "ExerciseCatalogResponse",
+    # Search
+    "SearchResult",
+    "SearchResponse",
+    # Activity
+    "ActivityCalendarResponse",
+    # Admin
+    "QueryMonitorSettings",
+    "QueryMonitorUpdate",
+    "MemoryTracingUpdate",
+    "MemoryAllocation",
+    "MemoryStatusResponse",
 ]
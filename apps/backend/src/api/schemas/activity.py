@@ -0,0 +1,18 @@
+"""Activity calendar schemas."""
+from pydantic import BaseModel
+from typing import List
+from datetime import date
+
+
+class ActivityCalendarResponse(BaseModel):
+    """
+    Yearly activity heatmap.
+
+    Each list holds one count per day, starting at start_date (January 1st).
+    """
+    year: int
+    start_date: date
+    version: int
+    workouts: List[int]
+    meals: List[int]
+    measurements: List[int]
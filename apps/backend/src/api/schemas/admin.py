@@ -0,0 +1,46 @@
+"""Admin schemas."""
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+
+
+class QueryMonitorSettings(BaseModel):
+    """Current query monitor settings."""
+    enabled: bool
+    slow_query_ms: float
+    n_plus_one_threshold: int
+
+
+class QueryMonitorUpdate(BaseModel):
+    """Schema for changing query monitor settings (omitted fields are kept)."""
+    enabled: Optional[bool] = None
+    slow_query_ms: Optional[float] = Field(None, ge=0)
+    n_plus_one_threshold: Optional[int] = Field(None, ge=2)
+
+
+class MemoryTracingUpdate(BaseModel):
+    """Schema for starting or stopping tracemalloc."""
+    enabled: bool
+    frames: int = Field(1, ge=1, le=50)
+
+
+class MemoryAllocation(BaseModel):
+    """Memory held by one source location (or traceback)."""
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: Optional[int] = None
+    count_diff: Optional[int] = None
+
+
+class MemoryStatusResponse(BaseModel):
+    """Worker memory state, with the largest allocations or growth."""
+    tracing: bool
+    traceback_frames: int
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    rss_bytes: Optional[int] = None
+    has_baseline: bool
+    allocations: List[MemoryAllocation]
+
+
+MemoryGroupBy = Literal["lineno", "filename", "traceback"]
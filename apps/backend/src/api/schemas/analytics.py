@@ -0,0 +1,49 @@
+"""Analytics schemas."""
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import date
+
+
+class MetricTrend(BaseModel):
+    """Trend statistics for a single measurement field."""
+    count: int
+    latest: Optional[float] = None
+    latest_date: Optional[date] = None
+    moving_avg_7d: Optional[float] = None
+    moving_avg_30d: Optional[float] = None
+    trend: Optional[float] = None  # EWMA trend value
+    slope_per_week: Optional[float] = None  # Least squares
+    robust_slope_per_week: Optional[float] = None  # Theil-Sen
+
+
+class WeightForecast(BaseModel):
+    """Projection of when the target weight will be reached."""
+    target_weight_kg: float
+    current_trend_kg: Optional[float] = None
+    slope_per_week: Optional[float] = None
+    projected_date: Optional[date] = None
+    goal_id: Optional[int] = None
+
+
+class BodyTrendsResponse(BaseModel):
+    """Trend statistics over all measurement fields."""
+    window_days: int
+    metrics: Dict[str, MetricTrend]
+    forecast: Optional[WeightForecast] = None
+
+
+class TrainingLoadResponse(BaseModel):
+    """
+    Daily training load series.
+
+    Every list holds one value per day from start_date to end_date.
+    """
+    start_date: date
+    end_date: date
+    acute_span_days: int
+    chronic_span_days: int
+    load: List[float]
+    tonnage_kg: List[float]
+    acute: List[float]  # EWMA of load
+    chronic: List[float]  # EWMA of load
+    acwr: List[Optional[float]]  # Acute:chronic workload ratio
@@ -1,6 +1,6 @@
 """Body measurement schemas."""
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date
 
 
@@ -36,6 +36,8 @@ class BodyMeasurementCreate(BodyMeasurementBase):
     suprailiac_skinfold_mm: Optional[float] = Field(None, ge=0, le=100)
     abdominal_skinfold_mm: Optional[float] = Field(None, ge=0, le=100)
     thigh_skinfold_mm: Optional[float] = Field(None, ge=0, le=100)
+    chest_skinfold_mm: Optional[float] = Field(None, ge=0, le=100)
+    midaxillary_skinfold_mm: Optional[float] = Field(None, ge=0, le=100)
 
     notes: Optional[str] = None
 
@@ -67,6 +69,41 @@ class BodyMeasurementResponse(BodyMeasurementBase):
     left_thigh_cm: Optional[float] = None
     right_calf_cm: Optional[float] = None
     left_calf_cm: Optional[float] = None
+    body_fat_jp3: Optional[float] = None
+    body_fat_jp7: Optional[float] = None
+    body_fat_dw: Optional[float] = None
     notes: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+
+
+class BodyMeasurementSeriesResponse(BaseModel):
+    """Columnar, downsampled time series for a single metric."""
+    metric: str
+    method: str
+    total_points: int
+    dates: List[date]
+    values: List[float]
+
+
+class MeasurementSnapshot(BaseModel):
+    """Measurement found on or before a requested date."""
+    as_of: date
+    measurement_id: Optional[int] = None
+    measurement_date: Optional[date] = None
+
+
+class FieldComparison(BaseModel):
+    """Change of a single field between two snapshots."""
+    start: Optional[float] = None
+    end: Optional[float] = None
+    delta: Optional[float] = None
+    percent_change: Optional[float] = None
+
+
+class BodyMeasurementComparisonResponse(BaseModel):
+    """Per-field comparison between two dates."""
+    start: MeasurementSnapshot
+    end: MeasurementSnapshot
+    days_between: Optional[int] = None
+    fields: Dict[str, FieldComparison]
@@ -0,0 +1,25 @@
+"""Dashboard schemas."""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+from .user import UserResponse
+from .body_measurement import BodyMeasurementResponse
+from .goal import GoalResponse
+from .workout import WorkoutStreakResponse
+
+
+class DashboardResponse(BaseModel):
+    """Composite dashboard payload.
+
+    Sections that failed or did not finish within the latency budget are
+    null and listed in `incomplete_sections`.
+    """
+    date: date
+    user: UserResponse
+    latest_measurement: Optional[BodyMeasurementResponse] = None
+    active_goals: Optional[List[GoalResponse]] = None
+    workout_stats: Optional[dict] = None
+    daily_nutrition: Optional[dict] = None
+    streak: Optional[WorkoutStreakResponse] = None
+    incomplete_sections: List[str] = []
@@ -0,0 +1,68 @@
+"""Exercise record schemas."""
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
+from datetime import datetime, date
+
+
+class ExerciseRecordResponse(BaseModel):
+    """Schema for exercise record response."""
+    model_config = ConfigDict(from_attributes=True)
+
+    exercise_key: str
+    exercise_name: str
+    max_weight_kg: Optional[float] = None
+    max_weight_date: Optional[date] = None
+    best_e1rm_kg: Optional[float] = None
+    best_e1rm_date: Optional[date] = None
+    best_e1rm_brzycki_kg: Optional[float] = None
+    best_volume_kg: Optional[float] = None
+    best_volume_date: Optional[date] = None
+    total_volume_kg: float
+    total_sets: int
+    session_count: int
+    first_performed: Optional[date] = None
+    last_performed: Optional[date] = None
+    updated_at: datetime
+
+
+class PRCheckRequest(BaseModel):
+    """Schema for checking whether a set would be a personal record."""
+    exercise_name: str = Field(..., min_length=1, max_length=200)
+    weight_kg: float = Field(..., ge=0, le=1000)
+    reps: int = Field(..., ge=1, le=500)
+    sets: int = Field(default=1, ge=1, le=50)
+
+
+class PRCheckResponse(BaseModel):
+    """Schema for personal record check result."""
+    exercise_name: str
+    estimated_1rm_kg: float
+    volume_kg: float
+    is_weight_pr: bool
+    is_e1rm_pr: bool
+    is_volume_pr: bool
+    record: Optional[ExerciseRecordResponse] = None
+
+
+class ExerciseProgressionPoint(BaseModel):
+    """Best performance of an exercise within one workout."""
+    workout_id: int
+    workout_date: date
+    max_weight_kg: float
+    best_e1rm_kg: float
+    volume_kg: float
+
+
+class ExerciseProgressionResponse(BaseModel):
+    """Progression series for one exercise."""
+    exercise_key: str
+    points: List[ExerciseProgressionPoint]
+
+
+class ExerciseCatalogResponse(BaseModel):
+    """Schema for catalog exercise (autocomplete result)."""
+    id: int
+    name: str
+    exercise_key: str
+    exercise_type: Optional[str] = None
+    muscle_group: Optional[str] = None
@@ -0,0 +1,23 @@
+"""Search schemas."""
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from datetime import date
+
+SearchType = Literal["workout", "exercise", "meal", "measurement", "goal", "photo"]
+
+
+class SearchResult(BaseModel):
+    """A single search hit."""
+    type: SearchType
+    id: int
+    workout_id: Optional[int] = None  # Set for workouts and exercises
+    date: date
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """A page of search results."""
+    results: List[SearchResult]
+    next_cursor: Optional[str] = None
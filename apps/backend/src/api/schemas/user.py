@@ -3,6 +3,8 @@ from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from typing import Optional
 from datetime import datetime, date
 
+from .workout import WorkoutStreakResponse
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -59,3 +61,26 @@ class Token(BaseModel):
 class TokenRefresh(BaseModel):
     """Schema for token refresh request."""
     refresh_token: str
+
+
+class UserSummaryResponse(BaseModel):
+    """Schema for the user's totals across measurements, training, nutrition and goals."""
+    measurement_count: int
+    first_measurement_date: Optional[date] = None
+    first_weight_kg: Optional[float] = None
+    last_measurement_date: Optional[date] = None
+    last_weight_kg: Optional[float] = None
+    workout_count: int
+    total_workout_minutes: int
+    meal_count: int
+    progress_photo_count: int
+    goal_count: int
+    active_goal_count: int
+    completed_goal_count: int
+    updated_at: Optional[datetime] = None
+
+
+class UserProfileResponse(UserResponse):
+    """Schema for the current user's profile with their totals and workout streak."""
+    summary: UserSummaryResponse
+    streak: WorkoutStreakResponse
@@ -28,6 +28,7 @@ class ExerciseResponse(ExerciseBase):
 
     id: int
     workout_id: int
+    catalog_id: Optional[int] = None
     sets: Optional[int] = None
     reps: Optional[int] = None
     weight_kg: Optional[float] = None
@@ -79,3 +80,14 @@ class WorkoutResponse(WorkoutBase):
     exercises: List[ExerciseResponse] = []
     created_at: datetime
     updated_at: datetime
+
+
+class WorkoutStreakResponse(BaseModel):
+    """Schema for workout streak and weekly consistency counters."""
+    current_streak: int  # Consecutive days, 0 once a day is missed
+    current_streak_start: Optional[date] = None
+    longest_streak: int
+    last_workout_date: Optional[date] = None
+    total_workout_days: int
+    workouts_this_week: int
+    workouts_last_week: int
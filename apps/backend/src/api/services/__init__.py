@@ -5,6 +5,16 @@ from .workout_service import WorkoutService
 from .meal_service import MealService
 from .goal_service import GoalService
 from .progress_photo_service import ProgressPhotoService
+from .analytics_service import AnalyticsService
+from .dashboard_service import DashboardService
+from .exercise_record_service import ExerciseRecordService
+from .exercise_catalog_service import ExerciseCatalogService
+from .search_service import SearchService
+from .training_load_service import TrainingLoadService
+from .activity_calendar_service import ActivityCalendarService
+from .streak_service import StreakService
+from .user_summary_service import UserSummaryService
+from .account_service import AccountService
 
 __all__ = [
     "AuthService",
@@ -13,4 +23,14 @@ __all__ = [
     "MealService",
     "GoalService",
     "ProgressPhotoService",
+    "AnalyticsService",
+    "DashboardService",
+    "ExerciseRecordService",
+    "ExerciseCatalogService",
+    "SearchService",
+    "TrainingLoadService",
+    "ActivityCalendarService",
+    "StreakService",
+    "UserSummaryService",
+    "AccountService",
 ]
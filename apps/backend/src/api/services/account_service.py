@@ -0,0 +1,93 @@
+"""
+Account service - account deletion.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Optional
+import structlog
+
+from ...core.cache import bump_user_data_version
+from ...core.config import get_settings
+from ...core.database import SessionLocal
+from ...database.models import User
+
+settings = get_settings()
+logger = structlog.get_logger()
+
+# (table, primary key columns, rows of the user) in deletion order: children
+# before parents, so every statement only touches rows it selected itself.
+PURGE_STEPS = (
+    ("exercises", "id",
+     "SELECT e.id FROM exercises e JOIN workouts w ON w.id = e.workout_id WHERE w.user_id = :user_id"),
+    ("exercise_records", "id", "SELECT id FROM exercise_records WHERE user_id = :user_id"),
+    ("training_loads", "id", "SELECT id FROM training_loads WHERE user_id = :user_id"),
+    ("activity_calendars", "id", "SELECT id FROM activity_calendars WHERE user_id = :user_id"),
+    ("workout_streaks", "user_id", "SELECT user_id FROM workout_streaks WHERE user_id = :user_id"),
+    ("user_summaries", "user_id", "SELECT user_id FROM user_summaries WHERE user_id = :user_id"),
+    ("workouts", "id", "SELECT id FROM workouts WHERE user_id = :user_id"),
+    ("meals", "id, meal_date", "SELECT id, meal_date FROM meals WHERE user_id = :user_id"),
+    ("body_measurements", "id", "SELECT id FROM body_measurements WHERE user_id = :user_id"),
+    ("progress_photos", "id", "SELECT id FROM progress_photos WHERE user_id = :user_id"),
+    ("goals", "id", "SELECT id FROM goals WHERE user_id = :user_id"),
+)
+
+
+class AccountService:
+    """Account service."""
+
+    @staticmethod
+    def deactivate_user(db: Session, user: User) -> None:
+        """
+        Mark an account as deleted so it can no longer authenticate.
+
+        The data itself is removed afterwards by purge_user.
+        """
+        user.is_active = False
+        db.commit()
+        bump_user_data_version(user.id)
+
+    @staticmethod
+    def purge_user(user_id: int, batch_size: Optional[int] = None) -> int:
+        """
+        Delete a user and all of their rows in batches.
+
+        Each batch is one set-based DELETE of at most batch_size rows selected
+        by primary key, committed on its own, so no rows are loaded into
+        memory and locks are held briefly regardless of the account's size.
+        Safe to re-run if interrupted. Runs in its own session (meant for
+        background tasks).
+
+        Args:
+            user_id: User ID
+            batch_size: Rows per statement (default: ACCOUNT_PURGE_BATCH_SIZE)
+
+        Returns:
+            Number of rows deleted
+        """
+        batch_size = batch_size or settings.ACCOUNT_PURGE_BATCH_SIZE
+        db = SessionLocal()
+        deleted = 0
+        try:
+            for table, key, rows in PURGE_STEPS:
+                statement = text(
+                    f"DELETE FROM {table} WHERE ({key}) IN ({rows} LIMIT :batch_size)"
+                )
+                while True:
+                    count = db.execute(statement, {"user_id": user_id, "batch_size": batch_size}).rowcount
+                    db.commit()
+                    deleted += count
+                    if count < batch_size:
+                        break
+
+            deleted += db.execute(text("DELETE FROM users WHERE id = :user_id"), {"user_id": user_id}).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("User purge failed", user_id=user_id, rows_deleted=deleted)
+            raise
+        finally:
+            db.close()
+
+        bump_user_data_version(user_id)
+        logger.info("Purged user", user_id=user_id, rows_deleted=deleted)
+        return deleted
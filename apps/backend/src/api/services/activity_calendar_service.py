@@ -0,0 +1,152 @@
+"""
+Activity calendar service - yearly activity heatmap counters.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+
+from ...database.models import ActivityCalendar
+from ...database.models.activity_calendar import CALENDAR_DAYS
+
+# Activity kind -> counter column
+ACTIVITY_COLUMNS = {
+    "workout": "workout_counts",
+    "meal": "meal_counts",
+    "measurement": "measurement_counts",
+}
+
+
+class ActivityCalendarService:
+    """Activity calendar service."""
+
+    @staticmethod
+    def record_activity(db: Session, user_id: int, day: date, kind: str, delta: int = 1) -> None:
+        """
+        Adjust one day's counter in a single upsert. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            day: Day of the activity
+            kind: workout, meal or measurement
+            delta: 1 when an entry is added, -1 when one is removed
+        """
+        column = ACTIVITY_COLUMNS[kind]
+        db.execute(
+            text(
+                f"""
+                INSERT INTO activity_calendars
+                    (user_id, year, workout_counts, meal_counts, measurement_counts, version, updated_at)
+                VALUES (:user_id, :year, array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]),
+                        array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]),
+                        array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]), 0, now())
+                ON CONFLICT ON CONSTRAINT uq_activity_calendars_user_year DO NOTHING;
+
+                UPDATE activity_calendars
+                SET {column}[:day] = greatest({column}[:day] + :delta, 0),
+                    version = version + 1,
+                    updated_at = now()
+                WHERE user_id = :user_id AND year = :year
+                """
+            ),
+            {"user_id": user_id, "year": day.year, "day": day.timetuple().tm_yday, "delta": delta},
+        )
+
+    @staticmethod
+    def get_calendar(db: Session, user_id: int, year: int) -> Optional[ActivityCalendar]:
+        """Get the stored calendar row (None if the user had no activity that year)."""
+        return db.query(ActivityCalendar).filter(
+            ActivityCalendar.user_id == user_id,
+            ActivityCalendar.year == year
+        ).first()
+
+    @staticmethod
+    def get_version(db: Session, user_id: int, year: int) -> int:
+        """Current calendar version, read without fetching the counters."""
+        version = db.query(ActivityCalendar.version).filter(
+            ActivityCalendar.user_id == user_id,
+            ActivityCalendar.year == year
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def calendar_response(calendar: Optional[ActivityCalendar], year: int) -> dict:
+        """Shape a calendar row for the API, trimmed to the year's length."""
+        days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+        empty = [0] * days
+        return {
+            "year": year,
+            "start_date": date(year, 1, 1),
+            "version": calendar.version if calendar else 0,
+            "workouts": calendar.workout_counts[:days] if calendar else empty,
+            "meals": calendar.meal_counts[:days] if calendar else empty,
+            "measurements": calendar.measurement_counts[:days] if calendar else empty,
+        }
+
+    @staticmethod
+    def rebuild(db: Session, user_id: Optional[int] = None) -> None:
+        """
+        Recompute calendars from history with one set-based statement.
+
+        Used after the migration or to repair drift. Calendars of years that
+        no longer have any activity are zeroed in the same statement; every
+        calendar that changes gets a new version. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: Optional single user to rebuild (default: everyone)
+        """
+        user_filter = "WHERE user_id = :user_id" if user_id is not None else ""
+        db.execute(
+            text(
+                f"""
+                WITH activity AS (
+                    SELECT user_id, workout_date AS day, 1 AS w, 0 AS m, 0 AS b FROM workouts {user_filter}
+                    UNION ALL
+                    SELECT user_id, meal_date, 0, 1, 0 FROM meals {user_filter}
+                    UNION ALL
+                    SELECT user_id, measurement_date, 0, 0, 1 FROM body_measurements {user_filter}
+                ),
+                counts AS (
+                    SELECT user_id, extract(year FROM day)::int AS year, extract(doy FROM day)::int AS doy,
+                           sum(w) AS w, sum(m) AS m, sum(b) AS b
+                    FROM activity
+                    GROUP BY 1, 2, 3
+                ),
+                calendars AS (
+                    SELECT DISTINCT user_id, year FROM counts
+                ),
+                cleared AS (
+                    UPDATE activity_calendars a
+                    SET workout_counts = array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]),
+                        meal_counts = array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]),
+                        measurement_counts = array_fill(0::smallint, ARRAY[{CALENDAR_DAYS}]),
+                        version = a.version + 1,
+                        updated_at = now()
+                    WHERE {"a.user_id = :user_id AND" if user_id is not None else ""}
+                          NOT EXISTS (SELECT 1 FROM calendars k WHERE k.user_id = a.user_id AND k.year = a.year)
+                          AND (0 <> ANY(a.workout_counts) OR 0 <> ANY(a.meal_counts)
+                               OR 0 <> ANY(a.measurement_counts))
+                )
+                INSERT INTO activity_calendars
+                    (user_id, year, workout_counts, meal_counts, measurement_counts, version, updated_at)
+                SELECT k.user_id, k.year,
+                       array_agg(coalesce(c.w, 0)::smallint ORDER BY g.doy),
+                       array_agg(coalesce(c.m, 0)::smallint ORDER BY g.doy),
+                       array_agg(coalesce(c.b, 0)::smallint ORDER BY g.doy),
+                       1, now()
+                FROM calendars k
+                CROSS JOIN generate_series(1, {CALENDAR_DAYS}) AS g(doy)
+                LEFT JOIN counts c ON c.user_id = k.user_id AND c.year = k.year AND c.doy = g.doy
+                GROUP BY k.user_id, k.year
+                ON CONFLICT ON CONSTRAINT uq_activity_calendars_user_year DO UPDATE
+                SET workout_counts = excluded.workout_counts,
+                    meal_counts = excluded.meal_counts,
+                    measurement_counts = excluded.measurement_counts,
+                    version = activity_calendars.version + 1,
+                    updated_at = now()
+                """
+            ),
+            {"user_id": user_id},
+        )
@@ -0,0 +1,154 @@
+"""
+Analytics service - trend statistics over body measurements.
+"""
+import math
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date, timedelta
+
+from ...core.cache import cache_get, cache_set, user_cache_key
+from ...database.models import BodyMeasurement, Goal, User
+from .body_measurement_service import MEASUREMENT_FIELDS
+
+
+# Forecasts further out than this are not meaningful
+MAX_FORECAST_DAYS = 5 * 365
+
+
+def _to_float(value: float, digits: int = 2) -> Optional[float]:
+    """Convert a NumPy scalar to a rounded float, mapping NaN to None."""
+    if value is None or math.isnan(value):
+        return None
+    return round(float(value), digits)
+
+
+class AnalyticsService:
+    """Analytics service."""
+
+    EWMA_HALFLIFE_DAYS = 10
+
+    @staticmethod
+    def get_body_trends(db: Session, user: User, window_days: int = 90) -> dict:
+        """
+        Get trend statistics for every measurement field.
+
+        Results are cached per user data version, so they are recomputed
+        only after the user's measurements, goals or profile change.
+
+        Args:
+            db: Database session
+            user: Current user
+            window_days: Days of history (ending at the latest measurement) used
+
+        Returns:
+            Trends dict with per-metric statistics and a weight forecast
+        """
+        cache_key = user_cache_key("body-trends", user.id, window_days)
+        cached = cache_get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        result = AnalyticsService.compute_body_trends(db, user, window_days)
+        if cache_key:
+            cache_set(cache_key, result)
+        return result
+
+    @staticmethod
+    def compute_body_trends(db: Session, user: User, window_days: int = 90) -> dict:
+        """
+        Compute trend statistics without caching.
+
+        All metrics are loaded into a single (rows x metrics) array and every
+        statistic is computed column-wise with NumPy.
+        """
+        import numpy as np
+        from ...shared import trends
+
+        last_date = db.query(func.max(BodyMeasurement.measurement_date)).filter(
+            BodyMeasurement.user_id == user.id
+        ).scalar()
+
+        if last_date is None:
+            return {"window_days": window_days, "metrics": {}, "forecast": None}
+
+        columns = [getattr(BodyMeasurement, field) for field in MEASUREMENT_FIELDS]
+        rows = db.query(BodyMeasurement.measurement_date, *columns).filter(
+            BodyMeasurement.user_id == user.id,
+            BodyMeasurement.measurement_date > last_date - timedelta(days=window_days)
+        ).order_by(BodyMeasurement.measurement_date.asc()).all()
+
+        days = np.fromiter((row[0].toordinal() for row in rows), dtype=np.float64, count=len(rows))
+        values = np.array([row[1:] for row in rows], dtype=np.float64)
+
+        counts = (~np.isnan(values)).sum(axis=0)
+        latest, latest_day = trends.last_valid(days, values)
+        moving_avg_7d = trends.trailing_mean(days, values, 7)
+        moving_avg_30d = trends.trailing_mean(days, values, 30)
+        trend = trends.ewma(days, values, AnalyticsService.EWMA_HALFLIFE_DAYS)
+        slope = trends.linear_slope(days, values)
+        robust_slope = trends.theil_sen_slope(days, values)
+
+        metrics = {}
+        for i, field in enumerate(MEASUREMENT_FIELDS):
+            if counts[i] == 0:
+                continue
+            metrics[field] = {
+                "count": int(counts[i]),
+                "latest": _to_float(latest[i]),
+                "latest_date": date.fromordinal(int(latest_day[i])),
+                "moving_avg_7d": _to_float(moving_avg_7d[i]),
+                "moving_avg_30d": _to_float(moving_avg_30d[i]),
+                "trend": _to_float(trend[i]),
+                "slope_per_week": _to_float(slope[i] * 7, 3),
+                "robust_slope_per_week": _to_float(robust_slope[i] * 7, 3),
+            }
+
+        weight = MEASUREMENT_FIELDS.index("weight_kg")
+        forecast = AnalyticsService.forecast_target_weight(
+            db, user, last_date, trend[weight], robust_slope[weight], slope[weight]
+        )
+
+        return {"window_days": window_days, "metrics": metrics, "forecast": forecast}
+
+    @staticmethod
+    def forecast_target_weight(
+        db: Session,
+        user: User,
+        last_date: date,
+        current_trend: float,
+        robust_slope: float,
+        linear_slope: float
+    ) -> Optional[dict]:
+        """
+        Project the date the weight trend reaches the target weight.
+
+        The target comes from the most recent active weight goal, falling
+        back to the profile's target weight.
+        """
+        goal = db.query(Goal).filter(
+            Goal.user_id == user.id,
+            Goal.is_active == True,  # noqa: E712
+            Goal.is_completed == False,  # noqa: E712
+            Goal.target_weight_kg.isnot(None)
+        ).order_by(Goal.created_at.desc()).first()
+
+        target = goal.target_weight_kg if goal else user.target_weight_kg
+        if not target:
+            return None
+
+        daily_slope = robust_slope if not math.isnan(robust_slope) else linear_slope
+        projected_date = None
+        if not math.isnan(current_trend) and not math.isnan(daily_slope) and daily_slope != 0:
+            days_needed = (target - current_trend) / daily_slope
+            if 0 <= days_needed <= MAX_FORECAST_DAYS:
+                projected_date = last_date + timedelta(days=math.ceil(days_needed))
+
+        return {
+            "target_weight_kg": float(target),
+            "current_trend_kg": _to_float(current_trend),
+            "slope_per_week": _to_float(daily_slope * 7, 3),
+            "projected_date": projected_date,
+            "goal_id": goal.id if goal else None,
+        }
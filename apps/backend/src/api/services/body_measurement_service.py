@@ -1,13 +1,55 @@
 """
 Body measurement service - handles body measurement logic.
 """
+from sqlalchemy import Date, Float, Integer, Numeric, case, cast, column, func, select, true, update, values
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from datetime import date
 
+
+from ...core.cache import bump_user_data_version, cache_get, cache_set, user_cache_key
+from ...core.database import SessionLocal
 from ...database.models import BodyMeasurement, User
 from ..schemas.body_measurement import BodyMeasurementCreate, BodyMeasurementUpdate
+from .activity_calendar_service import ActivityCalendarService
+from .user_summary_service import UserSummaryService
+
+
+# Numeric measurement columns that can be charted or compared
+MEASUREMENT_FIELDS = (
+    "weight_kg",
+    "body_fat_percentage",
+    "muscle_mass_kg",
+    "bmi",
+    "neck_cm",
+    "chest_cm",
+    "waist_cm",
+    "abdomen_cm",
+    "hips_cm",
+    "right_bicep_cm",
+    "left_bicep_cm",
+    "right_forearm_cm",
+    "left_forearm_cm",
+    "right_thigh_cm",
+    "left_thigh_cm",
+    "right_calf_cm",
+    "left_calf_cm",
+    "bicep_skinfold_mm",
+    "tricep_skinfold_mm",
+    "subscapular_skinfold_mm",
+    "suprailiac_skinfold_mm",
+    "abdominal_skinfold_mm",
+    "thigh_skinfold_mm",
+    "chest_skinfold_mm",
+    "midaxillary_skinfold_mm",
+    "body_fat_jp3",
+    "body_fat_jp7",
+    "body_fat_dw",
+)
+
+# Columns derived from skin folds by src/shared/body_composition.py
+BODY_FAT_ESTIMATES = ("body_fat_jp3", "body_fat_jp7", "body_fat_dw")
 
 
 class BodyMeasurementService:
@@ -19,6 +61,198 @@ class BodyMeasurementService:
         height_m = height_cm / 100
         return round(weight_kg / (height_m ** 2), 2)
 
+    @staticmethod
+    def recalculate_bmi(
+        db: Session,
+        user_id: Optional[int] = None,
+        min_user_id: Optional[int] = None,
+        max_user_id: Optional[int] = None
+    ) -> Tuple[int, Set[int]]:
+        """
+        Recompute stored BMI from each user's current height in one UPDATE.
+
+        Set-based (UPDATE ... FROM users); rows whose BMI is already correct
+        are left untouched. Measurements of users without a height get NULL.
+        Does not commit.
+
+        Args:
+            db: Database session
+            user_id: Optional single user
+            min_user_id: Optional inclusive lower bound of a user id range
+            max_user_id: Optional exclusive upper bound of a user id range
+
+        Returns:
+            (measurements changed, ids of the users owning them)
+        """
+        height_m = User.height_cm / 100.0
+        bmi = case(
+            (User.height_cm > 0, func.round(cast(BodyMeasurement.weight_kg / (height_m * height_m), Numeric), 2)),
+            else_=None
+        )
+
+        statement = update(BodyMeasurement).where(
+            BodyMeasurement.user_id == User.id,
+            BodyMeasurement.bmi.is_distinct_from(bmi)
+        ).values(bmi=bmi).returning(BodyMeasurement.user_id)
+        if user_id is not None:
+            statement = statement.where(BodyMeasurement.user_id == user_id)
+        if min_user_id is not None:
+            statement = statement.where(BodyMeasurement.user_id >= min_user_id)
+        if max_user_id is not None:
+            statement = statement.where(BodyMeasurement.user_id < max_user_id)
+
+        # One result row per call: the UPDATE runs in a CTE and is aggregated in SQL
+        updated = statement.cte("updated")
+        changed, owners = db.execute(
+            select(func.count(), func.array_agg(func.distinct(updated.c.user_id))).select_from(updated)
+        ).one()
+        return changed, set(owners or ())
+
+    @staticmethod
+    def recalculate_user_bmi(user_id: int) -> None:
+        """
+        Recompute a user's BMI history after a height change.
+
+        Runs in its own session (meant for background tasks).
+        """
+        db = SessionLocal()
+        try:
+            BodyMeasurementService.recalculate_bmi(db, user_id=user_id)
+            db.commit()
+        finally:
+            db.close()
+        bump_user_data_version(user_id)
+
+    @staticmethod
+    def estimate_body_fat(user: User, measurement_date: date, skinfolds: dict) -> dict:
+        """
+        Skinfold body-fat estimates for a single measurement.
+
+        Args:
+            user: Owner (gender and date of birth are used)
+            measurement_date: Date the skin folds were taken
+            skinfolds: Site column name -> value in mm (None if not measured)
+
+        Returns:
+            Estimate column -> value (None when it cannot be computed)
+        """
+        import numpy as np
+        from ...shared.body_composition import SKINFOLD_SITES, age_in_years, estimate_body_fat, sex_indicator
+
+        birth = user.date_of_birth.toordinal() if user.date_of_birth else np.nan
+        estimates = estimate_body_fat(
+            {site: np.array([skinfolds.get(site)], dtype=np.float64) for site in SKINFOLD_SITES},
+            age_in_years(np.array([birth]), np.array([measurement_date.toordinal()])),
+            np.array([sex_indicator(user.gender)])
+        )
+        return {
+            name: None if np.isnan(values[0]) else float(values[0])
+            for name, values in estimates.items()
+        }
+
+    @staticmethod
+    def recalculate_body_fat(
+        db: Session,
+        user_id: Optional[int] = None,
+        after_id: int = 0,
+        limit: int = 10000
+    ) -> Tuple[int, Set[int], Optional[int]]:
+        """
+        Recompute skinfold body-fat estimates for a batch of measurements.
+
+        Reads the next `limit` measurements by id (with the owner's gender and
+        date of birth), computes every estimate with one vectorized pass and
+        writes back only the rows that changed, in a single UPDATE ... FROM
+        VALUES. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: Optional single user
+            after_id: Keyset cursor; only measurements with a greater id are read
+            limit: Batch size
+
+        Returns:
+            (rows updated, ids of the users owning them,
+            last id read or None when there are no more rows)
+        """
+        import numpy as np
+        from ...shared.body_composition import SKINFOLD_SITES, age_in_years, estimate_body_fat, sex_indicator
+
+        estimate_columns = [getattr(BodyMeasurement, name) for name in BODY_FAT_ESTIMATES]
+        query = db.query(
+            BodyMeasurement.id,
+            BodyMeasurement.measurement_date,
+            User.gender,
+            User.date_of_birth,
+            *[getattr(BodyMeasurement, site) for site in SKINFOLD_SITES],
+            *estimate_columns,
+            BodyMeasurement.user_id
+        ).join(User, User.id == BodyMeasurement.user_id).filter(BodyMeasurement.id > after_id)
+        if user_id is not None:
+            query = query.filter(BodyMeasurement.user_id == user_id)
+        rows = query.order_by(BodyMeasurement.id).limit(limit).all()
+        if not rows:
+            return 0, set(), None
+
+        columns = list(zip(*rows))
+        ids = np.array(columns[0])
+        owner_ids = np.array(columns[-1])
+        age = age_in_years(
+            np.array([birth.toordinal() if birth else np.nan for birth in columns[3]], dtype=np.float64),
+            np.array([day.toordinal() for day in columns[1]], dtype=np.float64)
+        )
+        male = np.array([sex_indicator(gender) for gender in columns[2]])
+        skinfolds = {
+            site: np.array(columns[4 + i], dtype=np.float64) for i, site in enumerate(SKINFOLD_SITES)
+        }
+        estimates = estimate_body_fat(skinfolds, age, male)
+
+        first_stored = 4 + len(SKINFOLD_SITES)
+        changed = np.zeros(len(rows), dtype=bool)
+        for i, name in enumerate(BODY_FAT_ESTIMATES):
+            stored = np.array(columns[first_stored + i], dtype=np.float64)
+            new = estimates[name]
+            changed |= ~((stored == new) | (np.isnan(stored) & np.isnan(new)))
+
+        if changed.any():
+            new_values = values(
+                column("id", Integer),
+                *[column(name, Float) for name in BODY_FAT_ESTIMATES],
+                name="estimates"
+            ).data([
+                (int(ids[i]), *[None if np.isnan(estimates[name][i]) else float(estimates[name][i])
+                                for name in BODY_FAT_ESTIMATES])
+                for i in np.flatnonzero(changed)
+            ])
+            db.execute(
+                update(BodyMeasurement).where(
+                    BodyMeasurement.id == new_values.c.id
+                ).values({
+                    # Cast: a VALUES column that is NULL in every row is typed text
+                    name: cast(new_values.c[name], Float) for name in BODY_FAT_ESTIMATES
+                }).execution_options(synchronize_session=False)
+            )
+
+        owners = {int(owner) for owner in owner_ids[changed]}
+        return int(changed.sum()), owners, int(ids[-1])
+
+    @staticmethod
+    def recalculate_user_body_fat(user_id: int) -> None:
+        """
+        Recompute a user's body-fat estimates after a gender or birth date change.
+
+        Runs in its own session (meant for background tasks).
+        """
+        db = SessionLocal()
+        try:
+            after_id = 0
+            while after_id is not None:
+                _, _, after_id = BodyMeasurementService.recalculate_body_fat(db, user_id=user_id, after_id=after_id)
+            db.commit()
+        finally:
+            db.close()
+        bump_user_data_version(user_id)
+
     @staticmethod
     def create_measurement(
         db: Session,
@@ -44,16 +278,24 @@ class BodyMeasurementService:
                 user.height_cm
             )
 
+        data = measurement_data.model_dump()
+        body_fat_estimates = BodyMeasurementService.estimate_body_fat(user, measurement_data.measurement_date, data)
+
         # Create measurement
         measurement = BodyMeasurement(
             user_id=user.id,
             bmi=bmi,
-            **measurement_data.model_dump()
+            **body_fat_estimates,
+            **data
         )
 
         db.add(measurement)
+        db.flush()
+        ActivityCalendarService.record_activity(db, user.id, measurement.measurement_date, "measurement")
+        UserSummaryService.record_measurements(db, user.id, 1)
         db.commit()
         db.refresh(measurement)
+        bump_user_data_version(user.id)
 
         return measurement
 
@@ -140,8 +382,11 @@ class BodyMeasurementService:
         for field, value in update_data.items():
             setattr(measurement, field, value)
 
+        db.flush()
+        UserSummaryService.record_measurements(db, user_id)
         db.commit()
         db.refresh(measurement)
+        bump_user_data_version(user_id)
 
         return measurement
 
@@ -153,7 +398,11 @@ class BodyMeasurementService:
         )
 
         db.delete(measurement)
+        db.flush()
+        ActivityCalendarService.record_activity(db, user_id, measurement.measurement_date, "measurement", -1)
+        UserSummaryService.record_measurements(db, user_id, -1)
         db.commit()
+        bump_user_data_version(user_id)
 
     @staticmethod
     def get_latest_measurement(db: Session, user_id: int) -> Optional[BodyMeasurement]:
@@ -163,3 +412,156 @@ class BodyMeasurementService:
         ).order_by(
             BodyMeasurement.measurement_date.desc()
         ).first()
+
+    @staticmethod
+    def get_measurement_series(
+        db: Session,
+        user_id: int,
+        metric: str,
+        points: int = 200,
+        method: str = "lttb",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        Get a downsampled time series for one metric.
+
+        Only the date and metric columns are fetched; downsampling runs
+        on NumPy arrays so the payload is bounded by `points`.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            metric: Measurement column name
+            points: Maximum number of points returned
+            method: "lttb" or "average"
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+
+        Returns:
+            Columnar series dict
+
+        Raises:
+            HTTPException: If metric is unknown
+        """
+        import numpy as np
+        from ...shared.downsampling import lttb, bucket_average
+
+        if metric not in MEASUREMENT_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid metric. Allowed: {', '.join(MEASUREMENT_FIELDS)}"
+            )
+
+        column = getattr(BodyMeasurement, metric)
+        query = db.query(BodyMeasurement.measurement_date, column).filter(
+            BodyMeasurement.user_id == user_id,
+            column.isnot(None)
+        )
+
+        if start_date:
+            query = query.filter(BodyMeasurement.measurement_date >= start_date)
+        if end_date:
+            query = query.filter(BodyMeasurement.measurement_date <= end_date)
+
+        rows = query.order_by(BodyMeasurement.measurement_date.asc()).all()
+
+        x = np.fromiter((row[0].toordinal() for row in rows), dtype=np.float64, count=len(rows))
+        y = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+
+        downsample = lttb if method == "lttb" else bucket_average
+        x, y = downsample(x, y, points)
+
+        return {
+            "metric": metric,
+            "method": method,
+            "total_points": len(rows),
+            "dates": [date.fromordinal(int(round(v))) for v in x],
+            "values": np.round(y, 2).tolist(),
+        }
+
+    @staticmethod
+    def compare_measurements(
+        db: Session,
+        user_id: int,
+        from_date: date,
+        to_date: date
+    ) -> dict:
+        """
+        Compare the measurements in effect on two dates.
+
+        For each date the nearest measurement on or before it is fetched in
+        a single as-of query (a LATERAL join over both dates), answered from
+        the covering (user_id, measurement_date) index. Results are cached
+        per user data version.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            from_date: Start date
+            to_date: End date
+
+        Returns:
+            Comparison dict with per-field deltas and percent change
+        """
+        cache_key = user_cache_key("measurement-compare", user_id, from_date, to_date)
+        cached = cache_get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        as_of = values(column("as_of", Date), name="as_of").data([(from_date,), (to_date,)])
+        nearest = select(
+            BodyMeasurement.id,
+            BodyMeasurement.measurement_date,
+            *[getattr(BodyMeasurement, field) for field in MEASUREMENT_FIELDS]
+        ).where(
+            BodyMeasurement.user_id == user_id,
+            BodyMeasurement.measurement_date <= as_of.c.as_of
+        ).order_by(
+            BodyMeasurement.measurement_date.desc(),
+            BodyMeasurement.id.desc()
+        ).limit(1).lateral("nearest")
+
+        rows = db.execute(
+            select(as_of.c.as_of, nearest)
+            .select_from(as_of.outerjoin(nearest, true()))
+        ).mappings().all()
+        by_date = {row["as_of"]: row for row in rows}
+        start, end = by_date[from_date], by_date[to_date]
+
+        fields = {}
+        for field in MEASUREMENT_FIELDS:
+            start_value, end_value = start[field], end[field]
+            delta = percent_change = None
+            if start_value is not None and end_value is not None:
+                delta = round(end_value - start_value, 2)
+                if start_value:
+                    percent_change = round(delta / start_value * 100, 2)
+            fields[field] = {
+                "start": start_value,
+                "end": end_value,
+                "delta": delta,
+                "percent_change": percent_change,
+            }
+
+        days_between = None
+        if start["measurement_date"] and end["measurement_date"]:
+            days_between = (end["measurement_date"] - start["measurement_date"]).days
+
+        result = {
+            "start": {
+                "as_of": from_date,
+                "measurement_id": start["id"],
+                "measurement_date": start["measurement_date"],
+            },
+            "end": {
+                "as_of": to_date,
+                "measurement_id": end["id"],
+                "measurement_date": end["measurement_date"],
+            },
+            "days_between": days_between,
+            "fields": fields,
+        }
+        if cache_key:
+            cache_set(cache_key, result)
+        return result
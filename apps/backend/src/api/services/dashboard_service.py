@@ -0,0 +1,134 @@
+"""
+Dashboard service - assembles the dashboard in a single request.
+"""
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Dict, Tuple
+
+import structlog
+
+from ...core.config import get_settings
+from ...core.database import SessionLocal
+from ...database.models import User
+from ..schemas.body_measurement import BodyMeasurementResponse
+from ..schemas.goal import GoalResponse
+from ..schemas.user import UserResponse
+from .body_measurement_service import BodyMeasurementService
+from .goal_service import GoalService
+from .meal_service import MealService
+from .streak_service import StreakService
+from .workout_service import WorkoutService
+
+settings = get_settings()
+logger = structlog.get_logger()
+
+# Sessions are not thread-safe, so every section opens its own
+_executor = ThreadPoolExecutor(
+    max_workers=settings.DASHBOARD_MAX_WORKERS,
+    thread_name_prefix="dashboard",
+)
+
+
+def _run_section(loader: Callable, *args) -> Tuple[object, float]:
+    """Run a section loader in its own session and time it (ms)."""
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = loader(db, *args)
+    finally:
+        db.close()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _load_latest_measurement(db, user_id: int):
+    measurement = BodyMeasurementService.get_latest_measurement(db, user_id)
+    return BodyMeasurementResponse.model_validate(measurement) if measurement else None
+
+
+def _load_active_goals(db, user_id: int):
+    goals = GoalService.get_user_goals(db, user_id, is_active=True)
+    return [GoalResponse.model_validate(goal) for goal in goals]
+
+
+def _load_workout_stats(db, user_id: int, start_date: date, end_date: date):
+    return WorkoutService.get_workout_stats(db, user_id, start_date, end_date)
+
+
+def _load_daily_nutrition(db, user_id: int, target_date: date):
+    return MealService.get_daily_nutrition(db, user_id, target_date)
+
+
+def _load_streak(db, user_id: int, target_date: date):
+    return StreakService.get_streak(db, user_id, target_date)
+
+
+class DashboardService:
+    """Dashboard service."""
+
+    @staticmethod
+    async def get_dashboard(
+        user: User,
+        target_date: date,
+        stats_days: int = 30,
+        budget_ms: int = None
+    ) -> Tuple[dict, Dict[str, float]]:
+        """
+        Load every dashboard section concurrently.
+
+        Each section runs in the thread pool with its own session. Sections
+        still running when the latency budget expires are left out of the
+        payload (and keep running in the background until they finish);
+        sections that fail are logged and left out the same way.
+
+        Args:
+            user: Current user (already authenticated)
+            target_date: Day used for nutrition and as end of the stats period
+            stats_days: Length of the workout stats period
+            budget_ms: Latency budget, defaults to DASHBOARD_LATENCY_BUDGET_MS
+
+        Returns:
+            Tuple of (dashboard dict, per-section timings in ms)
+        """
+        budget_ms = budget_ms or settings.DASHBOARD_LATENCY_BUDGET_MS
+        loop = asyncio.get_running_loop()
+
+        sections = {
+            "latest_measurement": (_load_latest_measurement, user.id),
+            "active_goals": (_load_active_goals, user.id),
+            "workout_stats": (
+                _load_workout_stats, user.id, target_date - timedelta(days=stats_days - 1), target_date
+            ),
+            "daily_nutrition": (_load_daily_nutrition, user.id, target_date),
+            "streak": (_load_streak, user.id, target_date),
+        }
+        tasks = {
+            # Copied context: queries made by the sections count towards this request's metrics
+            name: loop.run_in_executor(_executor, contextvars.copy_context().run, _run_section, *loader)
+            for name, loader in sections.items()
+        }
+
+        await asyncio.wait(tasks.values(), timeout=budget_ms / 1000)
+
+        dashboard = {
+            "date": target_date,
+            "user": UserResponse.model_validate(user),
+            "incomplete_sections": [],
+        }
+        timings = {}
+        for name, task in tasks.items():
+            if task.done() and task.exception() is None:
+                dashboard[name], timings[name] = task.result()
+                continue
+            if task.done():
+                error = task.exception()
+                logger.error(
+                    "Dashboard section failed", section=name, user_id=user.id,
+                    exc_info=(type(error), error, error.__traceback__)
+                )
+            dashboard[name] = None
+            dashboard["incomplete_sections"].append(name)
+
+        return dashboard, timings
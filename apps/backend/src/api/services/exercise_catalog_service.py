@@ -0,0 +1,141 @@
+"""
+Exercise catalog service - canonical exercise lookup and autocomplete.
+"""
+import threading
+import time
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+
+from ...core.config import get_settings
+from ...database.models import ExerciseAlias, ExerciseCatalog
+from ...shared.text import normalize_exercise_name
+from ...shared.trie import PrefixTrie
+
+settings = get_settings()
+
+
+class CatalogIndex:
+    """In-memory snapshot of the catalog used for autocomplete and resolution."""
+
+    def __init__(self, entries: Dict[int, dict], aliases: Dict[str, int]):
+        self.entries = entries  # catalog id -> entry dict
+        self.aliases = aliases  # alias key -> catalog id
+        self.trie = PrefixTrie(max_results=settings.EXERCISE_SEARCH_MAX_RESULTS)
+
+        # Whole keys first so "supino" ranks "supino reto" above "reto supino"
+        for key, catalog_id in aliases.items():
+            self.trie.insert(key, catalog_id)
+        for key, catalog_id in aliases.items():
+            words = key.split(" ")
+            for i in range(1, len(words)):
+                self.trie.insert(" ".join(words[i:]), catalog_id)
+
+
+_index: Optional[CatalogIndex] = None
+_index_loaded_at = 0.0
+_index_lock = threading.Lock()
+
+
+class ExerciseCatalogService:
+    """Exercise catalog service."""
+
+    @staticmethod
+    def get_index(db: Session) -> CatalogIndex:
+        """
+        Get the per-process catalog index, reloading it after
+        EXERCISE_CATALOG_TTL_SECONDS.
+        """
+        global _index, _index_loaded_at
+        if _index is not None and time.monotonic() - _index_loaded_at < settings.EXERCISE_CATALOG_TTL_SECONDS:
+            return _index
+
+        with _index_lock:
+            if _index is None or time.monotonic() - _index_loaded_at >= settings.EXERCISE_CATALOG_TTL_SECONDS:
+                entries = {
+                    entry.id: {
+                        "id": entry.id,
+                        "name": entry.name,
+                        "exercise_key": entry.exercise_key,
+                        "exercise_type": entry.exercise_type,
+                        "muscle_group": entry.muscle_group,
+                    }
+                    for entry in db.query(ExerciseCatalog).order_by(ExerciseCatalog.id)
+                }
+                aliases = dict(
+                    db.query(ExerciseAlias.alias_key, ExerciseAlias.catalog_id).order_by(ExerciseAlias.id)
+                )
+                _index = CatalogIndex(entries, aliases)
+                _index_loaded_at = time.monotonic()
+        return _index
+
+    @staticmethod
+    def search(db: Session, query: str, limit: int = 10) -> List[dict]:
+        """
+        Autocomplete catalog exercises.
+
+        Prefix matches (on the full name or any word boundary of any alias)
+        come from the in-memory trie. When that yields nothing, falls back
+        to a pg_trgm similarity query to tolerate typos.
+
+        Args:
+            db: Database session
+            query: Partial exercise name
+            limit: Maximum number of results
+
+        Returns:
+            List of catalog entries
+        """
+        index = ExerciseCatalogService.get_index(db)
+        key = normalize_exercise_name(query)
+        if not key:
+            return []
+
+        matches = index.trie.search(key, limit)
+        if not matches and len(key) >= 3:
+            matches = ExerciseCatalogService.fuzzy_match_ids(db, key, limit)
+
+        return [index.entries[catalog_id] for catalog_id in matches if catalog_id in index.entries]
+
+    @staticmethod
+    def fuzzy_match_ids(db: Session, key: str, limit: int = 10) -> List[int]:
+        """Catalog ids whose aliases are trigram-similar to key, best first."""
+        similarity = func.similarity(ExerciseAlias.alias_key, key)
+        rows = db.query(ExerciseAlias.catalog_id, func.max(similarity).label("score")).filter(
+            ExerciseAlias.alias_key.op("%")(key),
+            similarity >= settings.EXERCISE_MATCH_THRESHOLD
+        ).group_by(ExerciseAlias.catalog_id).order_by(
+            func.max(similarity).desc()
+        ).limit(limit).all()
+        return [catalog_id for catalog_id, _ in rows]
+
+    @staticmethod
+    def resolve_catalog_id(db: Session, exercise_name: str) -> Optional[int]:
+        """
+        Map a free-text exercise name to a catalog id.
+
+        Exact alias matches are answered from memory; otherwise the best
+        trigram match above EXERCISE_MATCH_THRESHOLD is used, if any.
+        """
+        index = ExerciseCatalogService.get_index(db)
+        key = normalize_exercise_name(exercise_name)
+        catalog_id = index.aliases.get(key)
+        if catalog_id is None and len(key) >= 3:
+            matches = ExerciseCatalogService.fuzzy_match_ids(db, key, limit=1)
+            catalog_id = matches[0] if matches else None
+        return catalog_id
+
+    @staticmethod
+    def canonical_key(db: Session, exercise_name: str, catalog_id: Optional[int] = None) -> str:
+        """
+        Key used to group entries of the same exercise.
+
+        Catalog exercises use the catalog key, so "Bench press" and
+        "Supino reto" share one record; unknown names use their normalized form.
+        """
+        index = ExerciseCatalogService.get_index(db)
+        key = normalize_exercise_name(exercise_name)
+        if catalog_id is None:
+            catalog_id = index.aliases.get(key)
+        entry = index.entries.get(catalog_id) if catalog_id is not None else None
+        return entry["exercise_key"] if entry else key
@@ -0,0 +1,363 @@
+"""
+Exercise record service - personal records and progression per exercise.
+"""
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime
+
+from ...database.models import Exercise, ExerciseCatalog, ExerciseRecord, Workout
+from .exercise_catalog_service import ExerciseCatalogService
+
+
+def exercise_key_column():
+    """
+    SQL equivalent of ExerciseCatalogService.canonical_key.
+
+    Queries using it must outer join ExerciseCatalog on Exercise.catalog_id.
+    """
+    return func.coalesce(
+        ExerciseCatalog.exercise_key,
+        func.lower(func.regexp_replace(func.btrim(Exercise.exercise_name), r"\s+", " ", "g"))
+    )
+
+
+class ExerciseRecordService:
+    """Exercise record service."""
+
+    @staticmethod
+    def estimate_1rm_epley(weight_kg: float, reps: int) -> float:
+        """Estimate one-rep max with the Epley formula."""
+        if reps == 1:
+            return round(weight_kg, 2)
+        return round(weight_kg * (1 + reps / 30), 2)
+
+    @staticmethod
+    def estimate_1rm_brzycki(weight_kg: float, reps: int) -> Optional[float]:
+        """Estimate one-rep max with the Brzycki formula (undefined past 36 reps)."""
+        if reps >= 37:
+            return None
+        return round(weight_kg * 36 / (37 - reps), 2)
+
+    @staticmethod
+    def _entry_stats(weight_kg: Optional[float], reps: Optional[int], sets: Optional[int]) -> Optional[dict]:
+        """Stats of one strength entry, or None if it has no load."""
+        if weight_kg is None or not reps:
+            return None
+        sets = sets or 1
+        return {
+            "weight": weight_kg,
+            "e1rm": ExerciseRecordService.estimate_1rm_epley(weight_kg, reps),
+            "brzycki": ExerciseRecordService.estimate_1rm_brzycki(weight_kg, reps),
+            "volume": round(sets * reps * weight_kg, 2),
+            "sets": sets,
+        }
+
+    @staticmethod
+    def _apply_entry(record: ExerciseRecord, stats: dict, performed_on: date) -> None:
+        """Fold one entry into a record."""
+        if record.max_weight_kg is None or stats["weight"] > record.max_weight_kg:
+            record.max_weight_kg = stats["weight"]
+            record.max_weight_date = performed_on
+        if record.best_e1rm_kg is None or stats["e1rm"] > record.best_e1rm_kg:
+            record.best_e1rm_kg = stats["e1rm"]
+            record.best_e1rm_date = performed_on
+        if stats["brzycki"] is not None and (
+            record.best_e1rm_brzycki_kg is None or stats["brzycki"] > record.best_e1rm_brzycki_kg
+        ):
+            record.best_e1rm_brzycki_kg = stats["brzycki"]
+        if record.best_volume_kg is None or stats["volume"] > record.best_volume_kg:
+            record.best_volume_kg = stats["volume"]
+            record.best_volume_date = performed_on
+
+        record.total_volume_kg = round((record.total_volume_kg or 0) + stats["volume"], 2)
+        record.total_sets = (record.total_sets or 0) + stats["sets"]
+        if record.first_performed is None or performed_on < record.first_performed:
+            record.first_performed = performed_on
+        if record.last_performed is None or performed_on > record.last_performed:
+            record.last_performed = performed_on
+
+    @staticmethod
+    def _new_record(user_id: int, key: str, name: str) -> ExerciseRecord:
+        return ExerciseRecord(
+            user_id=user_id,
+            exercise_key=key,
+            exercise_name=name,
+            total_volume_kg=0,
+            total_sets=0,
+            session_count=0,
+        )
+
+    @staticmethod
+    def record_workout(db: Session, workout: Workout, exercises: Iterable[Exercise]) -> None:
+        """
+        Fold a newly created workout into the user's records.
+
+        Only the records of the exercises in this workout are touched
+        (locked with SELECT ... FOR UPDATE). Missing records are inserted
+        with ON CONFLICT DO NOTHING first, so concurrent workouts logging a
+        new exercise both end up locking the same row. Does not commit.
+
+        Args:
+            db: Database session
+            workout: Workout being created
+            exercises: Its exercises
+        """
+        grouped: Dict[str, List[Exercise]] = {}
+        for exercise in exercises:
+            if ExerciseRecordService._entry_stats(exercise.weight_kg, exercise.reps, exercise.sets):
+                key = ExerciseCatalogService.canonical_key(db, exercise.exercise_name, exercise.catalog_id)
+                grouped.setdefault(key, []).append(exercise)
+
+        if not grouped:
+            return
+
+        def lock_records(keys) -> Dict[str, ExerciseRecord]:
+            # Sorted so concurrent workouts take the row locks in the same order
+            return {
+                record.exercise_key: record
+                for record in db.query(ExerciseRecord).filter(
+                    ExerciseRecord.user_id == workout.user_id,
+                    ExerciseRecord.exercise_key.in_(keys)
+                ).order_by(ExerciseRecord.exercise_key).with_for_update()
+            }
+
+        records = lock_records(list(grouped))
+        missing = [key for key in grouped if key not in records]
+        if missing:
+            now = datetime.utcnow()
+            db.execute(
+                insert(ExerciseRecord).values([
+                    {
+                        "user_id": workout.user_id,
+                        "exercise_key": key,
+                        "exercise_name": grouped[key][-1].exercise_name,
+                        "total_volume_kg": 0,
+                        "total_sets": 0,
+                        "session_count": 0,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for key in missing
+                ]).on_conflict_do_nothing(
+                    index_elements=[ExerciseRecord.user_id, ExerciseRecord.exercise_key]
+                )
+            )
+            records.update(lock_records(missing))
+
+        for key, entries in grouped.items():
+            record = records[key]
+            for exercise in entries:
+                stats = ExerciseRecordService._entry_stats(exercise.weight_kg, exercise.reps, exercise.sets)
+                ExerciseRecordService._apply_entry(record, stats, workout.workout_date)
+            record.session_count += 1
+            record.exercise_name = entries[-1].exercise_name
+
+    @staticmethod
+    def rebuild_records(db: Session, user_id: int, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Recompute records from workout history.
+
+        Used when history shrinks (a workout is deleted), since a removed
+        entry may have been the best. Only the given exercise keys are
+        rebuilt; with keys=None every record of the user is. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            keys: Optional normalized exercise names to rebuild
+        """
+        key_column = exercise_key_column()
+        records_query = db.query(ExerciseRecord).filter(ExerciseRecord.user_id == user_id)
+        history = db.query(
+            key_column,
+            Exercise.exercise_name,
+            Exercise.weight_kg,
+            Exercise.reps,
+            Exercise.sets,
+            Workout.id,
+            Workout.workout_date
+        ).join(Workout, Exercise.workout_id == Workout.id).outerjoin(
+            ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+        ).filter(
+            Workout.user_id == user_id,
+            Exercise.weight_kg.isnot(None),
+            Exercise.reps.isnot(None)
+        )
+
+        if keys is not None:
+            keys = list(keys)
+            if not keys:
+                return
+            records_query = records_query.filter(ExerciseRecord.exercise_key.in_(keys))
+            history = history.filter(key_column.in_(keys))
+
+        records_query.delete(synchronize_session=False)
+
+        records: Dict[str, ExerciseRecord] = {}
+        sessions: Dict[str, set] = {}
+        rows = history.order_by(Workout.workout_date.asc(), Exercise.id.asc()).yield_per(1000)
+        for key, name, weight_kg, reps, sets, workout_id, workout_date in rows:
+            stats = ExerciseRecordService._entry_stats(weight_kg, reps, sets)
+            if stats is None:
+                continue
+            record = records.get(key)
+            if record is None:
+                record = records[key] = ExerciseRecordService._new_record(user_id, key, name)
+            ExerciseRecordService._apply_entry(record, stats, workout_date)
+            record.exercise_name = name
+            sessions.setdefault(key, set()).add(workout_id)
+
+        for key, record in records.items():
+            record.session_count = len(sessions[key])
+        db.add_all(records.values())
+
+    @staticmethod
+    def get_user_records(db: Session, user_id: int) -> List[ExerciseRecord]:
+        """Get all exercise records of a user."""
+        return db.query(ExerciseRecord).filter(
+            ExerciseRecord.user_id == user_id
+        ).order_by(ExerciseRecord.exercise_key.asc()).all()
+
+    @staticmethod
+    def lookup_key(db: Session, exercise_name: str) -> str:
+        """
+        Record key of a free-text name, resolved like workout entries are.
+
+        Uses the same catalog resolution as workout writes (exact alias,
+        then trigram match), so a name that was fuzzy-matched when logged
+        finds the record it was stored under.
+        """
+        catalog_id = ExerciseCatalogService.resolve_catalog_id(db, exercise_name)
+        return ExerciseCatalogService.canonical_key(db, exercise_name, catalog_id)
+
+    @staticmethod
+    def find_record(db: Session, user_id: int, exercise_name: str) -> Optional[ExerciseRecord]:
+        """Get the record of one exercise (single unique-key lookup)."""
+        return db.query(ExerciseRecord).filter(
+            ExerciseRecord.user_id == user_id,
+            ExerciseRecord.exercise_key == ExerciseRecordService.lookup_key(db, exercise_name)
+        ).first()
+
+    @staticmethod
+    def get_record(db: Session, user_id: int, exercise_name: str) -> ExerciseRecord:
+        """
+        Get the record of one exercise.
+
+        Raises:
+            HTTPException: If the user has no record for the exercise
+        """
+        record = ExerciseRecordService.find_record(db, user_id, exercise_name)
+        if not record:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Exercise record not found"
+            )
+        return record
+
+    @staticmethod
+    def check_personal_record(
+        db: Session,
+        user_id: int,
+        exercise_name: str,
+        weight_kg: float,
+        reps: int,
+        sets: int = 1
+    ) -> dict:
+        """
+        Check whether a set would beat the user's current records.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            exercise_name: Exercise name (any alias of the same exercise)
+            weight_kg: Load
+            reps: Repetitions
+            sets: Sets
+
+        Returns:
+            PR check dict
+        """
+        record = ExerciseRecordService.find_record(db, user_id, exercise_name)
+        stats = ExerciseRecordService._entry_stats(weight_kg, reps, sets)
+
+        def beats(value: float, best: Optional[float]) -> bool:
+            return best is None or value > best
+
+        return {
+            "exercise_name": exercise_name,
+            "estimated_1rm_kg": stats["e1rm"],
+            "volume_kg": stats["volume"],
+            "is_weight_pr": beats(stats["weight"], record.max_weight_kg if record else None),
+            "is_e1rm_pr": beats(stats["e1rm"], record.best_e1rm_kg if record else None),
+            "is_volume_pr": beats(stats["volume"], record.best_volume_kg if record else None),
+            "record": record,
+        }
+
+    @staticmethod
+    def get_progression(
+        db: Session,
+        user_id: int,
+        exercise_name: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        Get the per-workout best of one exercise over time.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            exercise_name: Exercise name
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+
+        Returns:
+            Progression dict
+        """
+        key = ExerciseRecordService.lookup_key(db, exercise_name)
+        e1rm = case(
+            (Exercise.reps == 1, Exercise.weight_kg),
+            else_=Exercise.weight_kg * (1 + Exercise.reps / 30.0)
+        )
+        volume = func.coalesce(Exercise.sets, 1) * Exercise.reps * Exercise.weight_kg
+
+        query = db.query(
+            Workout.id,
+            Workout.workout_date,
+            func.max(Exercise.weight_kg),
+            func.max(e1rm),
+            func.sum(volume)
+        ).join(Workout, Exercise.workout_id == Workout.id).outerjoin(
+            ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+        ).filter(
+            Workout.user_id == user_id,
+            exercise_key_column() == key,
+            Exercise.weight_kg.isnot(None),
+            Exercise.reps.isnot(None)
+        )
+
+        if start_date:
+            query = query.filter(Workout.workout_date >= start_date)
+        if end_date:
+            query = query.filter(Workout.workout_date <= end_date)
+
+        rows = query.group_by(Workout.id, Workout.workout_date).order_by(
+            Workout.workout_date.asc()
+        ).all()
+
+        return {
+            "exercise_key": key,
+            "points": [
+                {
+                    "workout_id": workout_id,
+                    "workout_date": workout_date,
+                    "max_weight_kg": max_weight,
+                    "best_e1rm_kg": round(best_e1rm, 2),
+                    "volume_kg": round(total_volume, 2),
+                }
+                for workout_id, workout_date, max_weight, best_e1rm, total_volume in rows
+            ],
+        }
@@ -6,8 +6,10 @@ from fastapi import HTTPException, status
 from typing import List, Optional
 from datetime import date, datetime
 
+from ...core.cache import bump_user_data_version
 from ...database.models import Goal, User, BodyMeasurement
 from ..schemas.goal import GoalCreate, GoalUpdate
+from .user_summary_service import UserSummaryService
 
 
 class GoalService:
@@ -36,8 +38,13 @@ class GoalService:
         )
 
         db.add(goal)
+        db.flush()
+        UserSummaryService.record_goal_change(
+            db, user.id, UserSummaryService.goal_counters(None), UserSummaryService.goal_counters(goal)
+        )
         db.commit()
         db.refresh(goal)
+        bump_user_data_version(user.id)
 
         return goal
 
@@ -121,6 +128,7 @@ class GoalService:
     ) -> Goal:
         """Update goal."""
         goal = GoalService.get_goal_by_id(db, goal_id, user_id)
+        counters_before = UserSummaryService.goal_counters(goal)
 
         update_data = goal_data.model_dump(exclude_unset=True)
 
@@ -131,8 +139,12 @@ class GoalService:
         for field, value in update_data.items():
             setattr(goal, field, value)
 
+        UserSummaryService.record_goal_change(
+            db, user_id, counters_before, UserSummaryService.goal_counters(goal)
+        )
         db.commit()
         db.refresh(goal)
+        bump_user_data_version(user_id)
 
         return goal
 
@@ -142,7 +154,11 @@ class GoalService:
         goal = GoalService.get_goal_by_id(db, goal_id, user_id)
 
         db.delete(goal)
+        UserSummaryService.record_goal_change(
+            db, user_id, UserSummaryService.goal_counters(goal), UserSummaryService.goal_counters(None)
+        )
         db.commit()
+        bump_user_data_version(user_id)
 
     @staticmethod
     def calculate_progress(db: Session, goal: Goal) -> float:
@@ -232,6 +248,7 @@ class GoalService:
             Updated goal
         """
         goal = GoalService.get_goal_by_id(db, goal_id, user_id)
+        counters_before = UserSummaryService.goal_counters(goal)
 
         progress = GoalService.calculate_progress(db, goal)
         goal.current_progress = round(progress, 2)
@@ -241,7 +258,11 @@ class GoalService:
             goal.is_completed = True
             goal.completed_date = date.today()
 
+        UserSummaryService.record_goal_change(
+            db, user_id, counters_before, UserSummaryService.goal_counters(goal)
+        )
         db.commit()
         db.refresh(goal)
+        bump_user_data_version(user_id)
 
         return goal
@@ -8,6 +8,8 @@ from datetime import date
 
 from ...database.models import Meal, User
 from ..schemas.meal import MealCreate, MealUpdate
+from .activity_calendar_service import ActivityCalendarService
+from .user_summary_service import UserSummaryService
 
 
 class MealService:
@@ -36,6 +38,8 @@ class MealService:
         )
 
         db.add(meal)
+        ActivityCalendarService.record_activity(db, user.id, meal.meal_date, "meal")
+        UserSummaryService.adjust(db, user.id, {"meal_count": 1})
         db.commit()
         db.refresh(meal)
 
@@ -53,6 +57,9 @@ class MealService:
         """
         Get user meals with optional filtering.
 
+        The meals table is partitioned by month on meal_date, so passing a
+        date range lets PostgreSQL prune to the matching partitions.
+
         Args:
             db: Database session
             user_id: User ID
@@ -138,6 +145,8 @@ class MealService:
         meal = MealService.get_meal_by_id(db, meal_id, user_id)
 
         db.delete(meal)
+        ActivityCalendarService.record_activity(db, user_id, meal.meal_date, "meal", -1)
+        UserSummaryService.adjust(db, user_id, {"meal_count": -1})
         db.commit()
 
     @staticmethod
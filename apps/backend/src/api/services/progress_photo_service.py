@@ -10,6 +10,7 @@ from pathlib import Path
 
 from ...database.models import ProgressPhoto, User
 from ..schemas.progress_photo import ProgressPhotoCreate
+from .user_summary_service import UserSummaryService
 
 
 class ProgressPhotoService:
@@ -96,6 +97,7 @@ class ProgressPhotoService:
         )
 
         db.add(progress_photo)
+        UserSummaryService.adjust(db, user.id, {"progress_photo_count": 1})
         db.commit()
         db.refresh(progress_photo)
 
@@ -190,6 +192,7 @@ class ProgressPhotoService:
         # Extract filename from URL and delete from storage
 
         db.delete(photo)
+        UserSummaryService.adjust(db, user_id, {"progress_photo_count": -1})
         db.commit()
 
     @staticmethod
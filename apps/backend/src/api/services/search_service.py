@@ -0,0 +1,209 @@
+"""
+Search service - full-text search across the user's records.
+"""
+import base64
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import Numeric, and_, cast, func, literal, null, or_, select, tuple_, union_all
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional, get_args
+
+from ...database.models import BodyMeasurement, Exercise, Goal, Meal, ProgressPhoto, Workout
+from ..schemas.search import SearchType
+
+# Config used to highlight matches in snippets
+HEADLINE_CONFIG = "portuguese"
+HEADLINE_OPTIONS = "MaxWords=20, MinWords=8, MaxFragments=2, StartSel=<b>, StopSel=</b>"
+
+
+def _search_sources():
+    """
+    Per-type search definitions.
+
+    Each entry gives the searched model, its owner column, a date, a title
+    and the document text matching the generated search_vector expression.
+    """
+    return {
+        "workout": dict(
+            model=Workout,
+            user_id=Workout.user_id,
+            date=Workout.workout_date,
+            title=Workout.workout_type,
+            document=func.concat_ws(" ", Workout.workout_type, Workout.notes),
+            workout_id=Workout.id,
+        ),
+        "exercise": dict(
+            model=Exercise,
+            user_id=Workout.user_id,
+            date=Workout.workout_date,
+            title=Exercise.exercise_name,
+            document=func.concat_ws(" ", Exercise.exercise_name, Exercise.notes),
+            workout_id=Exercise.workout_id,
+            join=(Workout, Exercise.workout_id == Workout.id),
+        ),
+        "meal": dict(
+            model=Meal,
+            user_id=Meal.user_id,
+            date=Meal.meal_date,
+            title=func.coalesce(Meal.meal_name, Meal.meal_type),
+            document=func.concat_ws(" ", Meal.meal_name, Meal.description, Meal.notes),
+        ),
+        "measurement": dict(
+            model=BodyMeasurement,
+            user_id=BodyMeasurement.user_id,
+            date=BodyMeasurement.measurement_date,
+            title=null(),
+            document=BodyMeasurement.notes,
+        ),
+        "goal": dict(
+            model=Goal,
+            user_id=Goal.user_id,
+            date=Goal.start_date,
+            title=Goal.title,
+            document=func.concat_ws(" ", Goal.title, Goal.description, Goal.notes),
+        ),
+        "photo": dict(
+            model=ProgressPhoto,
+            user_id=ProgressPhoto.user_id,
+            date=ProgressPhoto.photo_date,
+            title=ProgressPhoto.photo_type,
+            document=ProgressPhoto.notes,
+        ),
+    }
+
+
+class SearchService:
+    """Search service."""
+
+    @staticmethod
+    def encode_cursor(rank: Decimal, result_type: str, result_id: int) -> str:
+        """Encode the keyset position after a result."""
+        raw = f"{rank}:{result_type}:{result_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        """
+        Decode a cursor into (rank, type, id).
+
+        Raises:
+            HTTPException: If the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            rank, result_type, result_id = base64.urlsafe_b64decode(padded).decode().split(":")
+            if result_type not in get_args(SearchType):
+                raise ValueError(result_type)
+            return Decimal(rank), result_type, int(result_id)
+        except (ValueError, UnicodeDecodeError, InvalidOperation):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    @staticmethod
+    def search(
+        db: Session,
+        user_id: int,
+        query: str,
+        types: Optional[List[str]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Search notes and descriptions across the user's records.
+
+        Every type is searched through its GIN-indexed search_vector and
+        pre-limited to one page, then the pages are merged with UNION ALL
+        and ordered by (rank desc, type, id). Ranks are rounded so the
+        keyset cursor compares exactly.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Search text (web search syntax: quotes, OR, -word)
+            types: Optional result types to include
+            limit: Page size
+            cursor: Cursor returned by the previous page
+
+        Returns:
+            Dict with results and next_cursor
+        """
+        ts_query = func.websearch_to_tsquery("portuguese", query).op("||")(
+            func.websearch_to_tsquery("english", query)
+        )
+        after = SearchService.decode_cursor(cursor) if cursor else None
+
+        branches = []
+        for result_type, source in _search_sources().items():
+            if types and result_type not in types:
+                continue
+
+            model = source["model"]
+            rank = cast(func.ts_rank_cd(model.search_vector, ts_query), Numeric(12, 6))
+            type_label = literal(result_type)
+            branch = select(
+                type_label.label("type"),
+                model.id.label("id"),
+                source.get("workout_id", null()).label("workout_id"),
+                source["date"].label("date"),
+                source["title"].label("title"),
+                source["document"].label("document"),
+                rank.label("rank"),
+            ).select_from(model)
+            if "join" in source:
+                branch = branch.join(*source["join"])
+            branch = branch.where(source["user_id"] == user_id, model.search_vector.op("@@")(ts_query))
+
+            if after is not None:
+                after_rank, after_type, after_id = after
+                branch = branch.where(or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, tuple_(type_label, model.id) > tuple_(after_type, after_id))
+                ))
+
+            # Each type contributes at most one page
+            branches.append(branch.order_by(rank.desc(), model.id.asc()).limit(limit + 1))
+
+        if not branches:
+            return {"results": [], "next_cursor": None}
+
+        merged = union_all(*branches).subquery("merged")
+        page = select(merged).order_by(
+            merged.c.rank.desc(), merged.c.type.asc(), merged.c.id.asc()
+        ).limit(limit + 1).subquery("page")
+
+        # Snippets are only built for the returned page
+        rows = db.execute(
+            select(
+                page.c.type,
+                page.c.id,
+                page.c.workout_id,
+                page.c.date,
+                page.c.title,
+                func.ts_headline(HEADLINE_CONFIG, page.c.document, ts_query, HEADLINE_OPTIONS).label("snippet"),
+                page.c.rank,
+            ).order_by(page.c.rank.desc(), page.c.type.asc(), page.c.id.asc())
+        ).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = SearchService.encode_cursor(last.rank, last.type, last.id)
+
+        return {
+            "results": [
+                {
+                    "type": row.type,
+                    "id": row.id,
+                    "workout_id": row.workout_id,
+                    "date": row.date,
+                    "title": row.title,
+                    "snippet": row.snippet,
+                    "rank": float(row.rank),
+                }
+                for row in rows
+            ],
+            "next_cursor": next_cursor,
+        }
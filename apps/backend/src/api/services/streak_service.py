@@ -0,0 +1,193 @@
+"""
+Streak service - workout streaks and weekly consistency counters.
+"""
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date, datetime, timedelta
+
+from ...database.models import Workout, WorkoutStreak
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing day."""
+    return day - timedelta(days=day.weekday())
+
+
+class StreakService:
+    """Streak service."""
+
+    @staticmethod
+    def _lock_streak(db: Session, user_id: int) -> WorkoutStreak:
+        """Get the user's streak row (created if missing) locked FOR UPDATE."""
+        db.execute(
+            insert(WorkoutStreak).values(
+                user_id=user_id,
+                current_streak=0,
+                longest_streak=0,
+                total_workout_days=0,
+                week_count=0,
+                previous_week_count=0,
+                updated_at=datetime.utcnow(),
+            ).on_conflict_do_nothing(index_elements=["user_id"])
+        )
+        return db.query(WorkoutStreak).filter(
+            WorkoutStreak.user_id == user_id
+        ).with_for_update().populate_existing().one()
+
+    @staticmethod
+    def record_workout(db: Session, user_id: int, day: date) -> None:
+        """
+        Account for a new workout on `day`. Does not commit.
+
+        Workouts on or after the last workout day update the counters in
+        place. Backdated workouts can merge or extend past streaks, so they
+        trigger a rebuild instead (the new workout must already be flushed).
+        """
+        streak = StreakService._lock_streak(db, user_id)
+        last = streak.last_workout_date
+
+        if last is not None and day < last:
+            StreakService.rebuild(db, user_id)
+            return
+
+        if last is None or day > last:
+            if last is not None and (day - last).days == 1:
+                streak.current_streak += 1
+            else:
+                streak.current_streak = 1
+                streak.current_streak_start = day
+            if streak.current_streak > streak.longest_streak:
+                streak.longest_streak = streak.current_streak
+                streak.longest_streak_start = streak.current_streak_start
+            streak.total_workout_days += 1
+            streak.last_workout_date = day
+
+        monday = week_start(day)
+        if streak.week_start == monday:
+            streak.week_count += 1
+        else:
+            previous_monday = monday - timedelta(days=7)
+            streak.previous_week_count = streak.week_count if streak.week_start == previous_monday else 0
+            streak.week_start = monday
+            streak.week_count = 1
+
+    @staticmethod
+    def rebuild(db: Session, user_id: int) -> None:
+        """
+        Recompute the user's streak state from workout history.
+
+        Streaks are found with a gaps-and-islands query over distinct
+        workout days, so only the summary rows leave the database. Used
+        after deletes and backdated inserts (pending changes must be
+        flushed). Does not commit.
+        """
+        streak = StreakService._lock_streak(db, user_id)
+
+        islands = text(
+            """
+            WITH days AS (
+                SELECT DISTINCT workout_date AS day FROM workouts WHERE user_id = :user_id
+            ),
+            islands AS (
+                SELECT min(day) AS start_day, max(day) AS end_day, count(*) AS length
+                FROM (SELECT day, day - row_number() OVER (ORDER BY day)::int AS island FROM days) d
+                GROUP BY island
+            )
+            SELECT
+                (SELECT coalesce(sum(length), 0) FROM islands) AS total_days,
+                c.start_day, c.end_day, c.length,
+                l.start_day AS longest_start, l.length AS longest_length
+            FROM (SELECT * FROM islands ORDER BY end_day DESC LIMIT 1) c
+            CROSS JOIN (SELECT * FROM islands ORDER BY length DESC, start_day ASC LIMIT 1) l
+            """
+        )
+        row = db.execute(islands, {"user_id": user_id}).first()
+
+        if row is None:
+            streak.current_streak = streak.longest_streak = streak.total_workout_days = 0
+            streak.current_streak_start = streak.longest_streak_start = None
+            streak.last_workout_date = streak.week_start = None
+            streak.week_count = streak.previous_week_count = 0
+            return
+
+        streak.total_workout_days = row.total_days
+        streak.current_streak = row.length
+        streak.current_streak_start = row.start_day
+        streak.longest_streak = row.longest_length
+        streak.longest_streak_start = row.longest_start
+        streak.last_workout_date = row.end_day
+
+        monday = week_start(row.end_day)
+        previous_monday = monday - timedelta(days=7)
+        counts = dict(
+            db.query(
+                Workout.workout_date >= monday,
+                func.count(Workout.id)
+            ).filter(
+                Workout.user_id == user_id,
+                Workout.workout_date >= previous_monday,
+                Workout.workout_date < monday + timedelta(days=7)
+            ).group_by(Workout.workout_date >= monday).all()
+        )
+        streak.week_start = monday
+        streak.week_count = counts.get(True, 0)
+        streak.previous_week_count = counts.get(False, 0)
+
+    @staticmethod
+    def get_streak(db: Session, user_id: int, today: Optional[date] = None) -> dict:
+        """
+        Get streak and weekly counters as seen on `today`.
+
+        A single primary-key read: the current streak is reported as 0 once
+        a full day has passed without a workout, and the weekly counts are
+        shifted when the stored week is not the current one.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            today: Reference day (default: today)
+
+        Returns:
+            Streak dict
+        """
+        return StreakService.streak_state(db.get(WorkoutStreak, user_id), today)
+
+    @staticmethod
+    def streak_state(streak: Optional[WorkoutStreak], today: Optional[date] = None) -> dict:
+        """
+        Streak dict of an already loaded row (None if the user has none), as seen on `today`.
+
+        Used by get_streak and by the profile, which joins the row in.
+        """
+        today = today or date.today()
+        if streak is None or streak.last_workout_date is None:
+            return {
+                "current_streak": 0,
+                "current_streak_start": None,
+                "longest_streak": 0,
+                "last_workout_date": None,
+                "total_workout_days": 0,
+                "workouts_this_week": 0,
+                "workouts_last_week": 0,
+            }
+
+        alive = (today - streak.last_workout_date).days <= 1
+        this_monday = week_start(today)
+        if streak.week_start == this_monday:
+            this_week, last_week = streak.week_count, streak.previous_week_count
+        elif streak.week_start == this_monday - timedelta(days=7):
+            this_week, last_week = 0, streak.week_count
+        else:
+            this_week, last_week = 0, 0
+
+        return {
+            "current_streak": streak.current_streak if alive else 0,
+            "current_streak_start": streak.current_streak_start if alive else None,
+            "longest_streak": streak.longest_streak,
+            "last_workout_date": streak.last_workout_date,
+            "total_workout_days": streak.total_workout_days,
+            "workouts_this_week": this_week,
+            "workouts_last_week": last_week,
+        }
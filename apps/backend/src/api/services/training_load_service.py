@@ -0,0 +1,205 @@
+"""
+Training load service - daily load and acute/chronic workload averages.
+"""
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from typing import Iterable, Optional
+from datetime import date, datetime, timedelta
+
+from ...database.models import Exercise, TrainingLoad, Workout
+from ...shared.training_load import ACUTE_SPAN_DAYS, CHRONIC_SPAN_DAYS, decay_fill, ewma_alpha
+
+# Load units per minute for each workout intensity
+INTENSITY_FACTORS = {"low": 3, "medium": 5, "high": 8}
+DEFAULT_INTENSITY = "medium"
+
+ACUTE_ALPHA = ewma_alpha(ACUTE_SPAN_DAYS)
+CHRONIC_ALPHA = ewma_alpha(CHRONIC_SPAN_DAYS)
+
+
+class TrainingLoadService:
+    """Training load service."""
+
+    @staticmethod
+    def workout_load(duration_minutes: Optional[int], intensity: Optional[str]) -> float:
+        """Load of one workout: duration x intensity factor."""
+        factor = INTENSITY_FACTORS.get(intensity or DEFAULT_INTENSITY, INTENSITY_FACTORS[DEFAULT_INTENSITY])
+        return float((duration_minutes or 0) * factor)
+
+    @staticmethod
+    def workout_load_column():
+        """SQL equivalent of workout_load over Workout columns."""
+        return func.coalesce(Workout.duration_minutes, 0) * case(
+            *[(Workout.intensity == name, factor) for name, factor in INTENSITY_FACTORS.items()],
+            else_=INTENSITY_FACTORS[DEFAULT_INTENSITY]
+        )
+
+    @staticmethod
+    def tonnage(exercises: Iterable[Exercise]) -> float:
+        """Total sets x reps x weight of the given exercises."""
+        return round(sum(
+            (e.sets or 1) * e.reps * e.weight_kg
+            for e in exercises
+            if e.reps and e.weight_kg is not None
+        ), 2)
+
+    @staticmethod
+    def apply_delta(
+        db: Session,
+        user_id: int,
+        day: date,
+        load: float,
+        tonnage_kg: float = 0,
+        workout_count: int = 0
+    ) -> None:
+        """
+        Add a load change on one day and update the averages incrementally.
+
+        The day's row is created (seeded with the decayed averages of the
+        previous row) or locked and adjusted; averages of later rows are
+        shifted in a single UPDATE. No history is rescanned. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            day: Day of the change
+            load: Load delta (negative when removing a workout)
+            tonnage_kg: Tonnage delta
+            workout_count: Workout count delta
+        """
+        row = db.query(TrainingLoad).filter(
+            TrainingLoad.user_id == user_id,
+            TrainingLoad.load_date == day
+        ).with_for_update().first()
+
+        if row is None:
+            previous = db.query(TrainingLoad).filter(
+                TrainingLoad.user_id == user_id,
+                TrainingLoad.load_date < day
+            ).order_by(TrainingLoad.load_date.desc()).first()
+            acute = chronic = 0.0
+            if previous is not None:
+                gap = (day - previous.load_date).days
+                acute = previous.acute_load * (1 - ACUTE_ALPHA) ** gap
+                chronic = previous.chronic_load * (1 - CHRONIC_ALPHA) ** gap
+
+            db.execute(
+                insert(TrainingLoad).values(
+                    user_id=user_id,
+                    load_date=day,
+                    load=0,
+                    tonnage_kg=0,
+                    workout_count=0,
+                    acute_load=acute,
+                    chronic_load=chronic,
+                    updated_at=datetime.utcnow(),
+                ).on_conflict_do_nothing(constraint="uq_training_loads_user_date")
+            )
+            row = db.query(TrainingLoad).filter(
+                TrainingLoad.user_id == user_id,
+                TrainingLoad.load_date == day
+            ).with_for_update().one()
+
+        row.load += load
+        row.tonnage_kg = round(row.tonnage_kg + tonnage_kg, 2)
+        row.workout_count += workout_count
+        row.acute_load += ACUTE_ALPHA * load
+        row.chronic_load += CHRONIC_ALPHA * load
+
+        if load:
+            days_after = TrainingLoad.load_date - day
+            db.query(TrainingLoad).filter(
+                TrainingLoad.user_id == user_id,
+                TrainingLoad.load_date > day
+            ).update({
+                TrainingLoad.acute_load: TrainingLoad.acute_load
+                + ACUTE_ALPHA * load * func.power(1 - ACUTE_ALPHA, days_after),
+                TrainingLoad.chronic_load: TrainingLoad.chronic_load
+                + CHRONIC_ALPHA * load * func.power(1 - CHRONIC_ALPHA, days_after),
+            }, synchronize_session=False)
+
+        # A day without workouts carries no information beyond the decay
+        if row.workout_count <= 0:
+            db.delete(row)
+
+    @staticmethod
+    def record_workout(db: Session, workout: Workout, exercises: Iterable[Exercise], sign: int = 1) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a workout's load. Does not commit.
+        """
+        TrainingLoadService.apply_delta(
+            db,
+            workout.user_id,
+            workout.workout_date,
+            sign * TrainingLoadService.workout_load(workout.duration_minutes, workout.intensity),
+            sign * TrainingLoadService.tonnage(exercises),
+            sign
+        )
+
+    @staticmethod
+    def get_training_load(db: Session, user_id: int, days: int = 90, end_date: Optional[date] = None) -> dict:
+        """
+        Get the daily training load series.
+
+        The series is dense (one value per day) and columnar: each metric is
+        a list aligned with the days from start_date to end_date. Averages
+        for days without workouts are decayed from the last stored day.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            days: Number of days in the series
+            end_date: Last day (default: today)
+
+        Returns:
+            Training load series dict
+        """
+        import numpy as np
+
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=days - 1)
+
+        rows = db.query(TrainingLoad).filter(
+            TrainingLoad.user_id == user_id,
+            TrainingLoad.load_date >= start_date,
+            TrainingLoad.load_date <= end_date
+        ).order_by(TrainingLoad.load_date.asc()).all()
+
+        # Averages entering the window come from the last row before it
+        anchor = db.query(TrainingLoad).filter(
+            TrainingLoad.user_id == user_id,
+            TrainingLoad.load_date < start_date
+        ).order_by(TrainingLoad.load_date.desc()).first()
+        state_rows = ([anchor] if anchor else []) + rows
+
+        day_ordinals = np.arange(start_date.toordinal(), end_date.toordinal() + 1)
+        state_days = np.array([row.load_date.toordinal() for row in state_rows], dtype=np.int64)
+        acute = decay_fill(
+            state_days, np.array([row.acute_load for row in state_rows]), day_ordinals, ACUTE_ALPHA
+        )
+        chronic = decay_fill(
+            state_days, np.array([row.chronic_load for row in state_rows]), day_ordinals, CHRONIC_ALPHA
+        )
+
+        load = np.zeros(len(day_ordinals))
+        tonnage = np.zeros(len(day_ordinals))
+        for row in rows:
+            index = row.load_date.toordinal() - day_ordinals[0]
+            load[index] = row.load
+            tonnage[index] = row.tonnage_kg
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = np.where(chronic > 1e-9, acute / chronic, np.nan)
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "acute_span_days": ACUTE_SPAN_DAYS,
+            "chronic_span_days": CHRONIC_SPAN_DAYS,
+            "load": np.round(load, 1).tolist(),
+            "tonnage_kg": np.round(tonnage, 1).tolist(),
+            "acute": np.round(acute, 1).tolist(),
+            "chronic": np.round(chronic, 1).tolist(),
+            "acwr": [None if np.isnan(value) else round(float(value), 2) for value in ratio],
+        }
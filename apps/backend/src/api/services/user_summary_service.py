@@ -0,0 +1,185 @@
+"""
+User summary service - per-user totals maintained at write time.
+"""
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from typing import Dict, Optional
+from datetime import datetime
+
+from ...database.models import BodyMeasurement, Goal, UserSummary
+
+COUNTER_COLUMNS = (
+    "measurement_count",
+    "workout_count",
+    "total_workout_minutes",
+    "meal_count",
+    "progress_photo_count",
+    "goal_count",
+    "active_goal_count",
+    "completed_goal_count",
+)
+
+
+class UserSummaryService:
+    """User summary service."""
+
+    @staticmethod
+    def adjust(db: Session, user_id: int, deltas: Dict[str, int], **fields) -> None:
+        """
+        Apply counter deltas and set fields with a single upsert. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            deltas: Counter column -> amount to add (counters never go below 0)
+            fields: Columns to overwrite
+        """
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if not deltas and not fields:
+            return
+
+        now = datetime.utcnow()
+        statement = insert(UserSummary).values(
+            user_id=user_id,
+            updated_at=now,
+            **{column: max(delta, 0) for column, delta in deltas.items()},
+            **fields
+        ).on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                **{
+                    column: func.greatest(getattr(UserSummary, column) + delta, 0)
+                    for column, delta in deltas.items()
+                },
+                **fields,
+                "updated_at": now,
+            }
+        )
+        db.execute(statement)
+
+    @staticmethod
+    def record_measurements(db: Session, user_id: int, count_delta: int = 0) -> None:
+        """
+        Update the measurement totals after a measurement write. Does not commit.
+
+        First and last weight are re-read with two lookups on the
+        (user_id, measurement_date) index, which also covers edits and
+        deletes of the boundary measurements. Pending changes must be flushed.
+        """
+        columns = (BodyMeasurement.measurement_date, BodyMeasurement.weight_kg)
+        query = db.query(*columns).filter(BodyMeasurement.user_id == user_id)
+        first = query.order_by(BodyMeasurement.measurement_date.asc(), BodyMeasurement.id.asc()).first()
+        last = query.order_by(BodyMeasurement.measurement_date.desc(), BodyMeasurement.id.desc()).first()
+
+        UserSummaryService.adjust(
+            db,
+            user_id,
+            {"measurement_count": count_delta},
+            first_measurement_date=first[0] if first else None,
+            first_weight_kg=first[1] if first else None,
+            last_measurement_date=last[0] if last else None,
+            last_weight_kg=last[1] if last else None,
+        )
+
+    @staticmethod
+    def goal_counters(goal: Optional[Goal]) -> Dict[str, int]:
+        """Counter contributions of one goal (all zero for None)."""
+        if goal is None:
+            return {"goal_count": 0, "active_goal_count": 0, "completed_goal_count": 0}
+        return {
+            "goal_count": 1,
+            "active_goal_count": int(bool(goal.is_active)),
+            "completed_goal_count": int(bool(goal.is_completed)),
+        }
+
+    @staticmethod
+    def record_goal_change(db: Session, user_id: int, before: Dict[str, int], after: Dict[str, int]) -> None:
+        """Apply the difference between two goal_counters results. Does not commit."""
+        UserSummaryService.adjust(db, user_id, {column: after[column] - before[column] for column in after})
+
+    @staticmethod
+    def get_summary(db: Session, user_id: int) -> dict:
+        """Get the user's totals (single primary-key lookup)."""
+        return UserSummaryService.to_dict(db.get(UserSummary, user_id))
+
+    @staticmethod
+    def to_dict(summary: Optional[UserSummary]) -> dict:
+        """Totals of a summary row (zeros for a user without one yet)."""
+        result = {column: getattr(summary, column) if summary else 0 for column in COUNTER_COLUMNS}
+        for column in ("first_measurement_date", "first_weight_kg", "last_measurement_date", "last_weight_kg"):
+            result[column] = getattr(summary, column) if summary else None
+        result["updated_at"] = summary.updated_at if summary else None
+        return result
+
+    @staticmethod
+    def rebuild(db: Session, user_id: Optional[int] = None) -> None:
+        """
+        Recompute summaries from the source tables with one set-based statement.
+
+        Used after the migration or to repair drift. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: Optional single user to rebuild (default: everyone)
+        """
+        user_filter = "WHERE user_id = :user_id" if user_id is not None else ""
+        db.execute(
+            text(
+                f"""
+                INSERT INTO user_summaries (
+                    user_id, measurement_count, first_measurement_date, first_weight_kg,
+                    last_measurement_date, last_weight_kg, workout_count, total_workout_minutes,
+                    meal_count, progress_photo_count, goal_count, active_goal_count,
+                    completed_goal_count, updated_at
+                )
+                SELECT u.id,
+                       coalesce(m.n, 0), m.first_date, m.first_weight, m.last_date, m.last_weight,
+                       coalesce(w.n, 0), coalesce(w.minutes, 0),
+                       coalesce(ml.n, 0), coalesce(p.n, 0),
+                       coalesce(g.n, 0), coalesce(g.active, 0), coalesce(g.completed, 0),
+                       now()
+                FROM users u
+                LEFT JOIN (
+                    SELECT user_id, count(*) AS n,
+                           (array_agg(measurement_date ORDER BY measurement_date, id))[1] AS first_date,
+                           (array_agg(weight_kg ORDER BY measurement_date, id))[1] AS first_weight,
+                           (array_agg(measurement_date ORDER BY measurement_date DESC, id DESC))[1] AS last_date,
+                           (array_agg(weight_kg ORDER BY measurement_date DESC, id DESC))[1] AS last_weight
+                    FROM body_measurements {user_filter} GROUP BY user_id
+                ) m ON m.user_id = u.id
+                LEFT JOIN (
+                    SELECT user_id, count(*) AS n, sum(coalesce(duration_minutes, 0)) AS minutes
+                    FROM workouts {user_filter} GROUP BY user_id
+                ) w ON w.user_id = u.id
+                LEFT JOIN (
+                    SELECT user_id, count(*) AS n FROM meals {user_filter} GROUP BY user_id
+                ) ml ON ml.user_id = u.id
+                LEFT JOIN (
+                    SELECT user_id, count(*) AS n FROM progress_photos {user_filter} GROUP BY user_id
+                ) p ON p.user_id = u.id
+                LEFT JOIN (
+                    SELECT user_id, count(*) AS n,
+                           count(*) FILTER (WHERE is_active) AS active,
+                           count(*) FILTER (WHERE is_completed) AS completed
+                    FROM goals {user_filter} GROUP BY user_id
+                ) g ON g.user_id = u.id
+                {"WHERE u.id = :user_id" if user_id is not None else ""}
+                ON CONFLICT (user_id) DO UPDATE SET
+                    measurement_count = excluded.measurement_count,
+                    first_measurement_date = excluded.first_measurement_date,
+                    first_weight_kg = excluded.first_weight_kg,
+                    last_measurement_date = excluded.last_measurement_date,
+                    last_weight_kg = excluded.last_weight_kg,
+                    workout_count = excluded.workout_count,
+                    total_workout_minutes = excluded.total_workout_minutes,
+                    meal_count = excluded.meal_count,
+                    progress_photo_count = excluded.progress_photo_count,
+                    goal_count = excluded.goal_count,
+                    active_goal_count = excluded.active_goal_count,
+                    completed_goal_count = excluded.completed_goal_count,
+                    updated_at = excluded.updated_at
+                """
+            ),
+            {"user_id": user_id},
+        )
@@ -8,6 +8,12 @@ from datetime import date
 
 from ...database.models import Workout, Exercise, User
 from ..schemas.workout import WorkoutCreate, WorkoutUpdate
+from .activity_calendar_service import ActivityCalendarService
+from .exercise_catalog_service import ExerciseCatalogService
+from .exercise_record_service import ExerciseRecordService
+from .streak_service import StreakService
+from .training_load_service import TrainingLoadService
+from .user_summary_service import UserSummaryService
 
 
 class WorkoutService:
@@ -44,12 +50,24 @@ class WorkoutService:
         db.flush()  # Get workout ID before creating exercises
 
         # Create exercises
+        exercises = []
         for exercise_data in exercises_data:
             exercise = Exercise(
                 workout_id=workout.id,
+                catalog_id=ExerciseCatalogService.resolve_catalog_id(db, exercise_data.exercise_name),
                 **exercise_data.model_dump()
             )
             db.add(exercise)
+            exercises.append(exercise)
+
+        # Update derived tables in the same transaction
+        ExerciseRecordService.record_workout(db, workout, exercises)
+        TrainingLoadService.record_workout(db, workout, exercises)
+        ActivityCalendarService.record_activity(db, user.id, workout.workout_date, "workout")
+        StreakService.record_workout(db, user.id, workout.workout_date)
+        UserSummaryService.adjust(
+            db, user.id, {"workout_count": 1, "total_workout_minutes": workout.duration_minutes or 0}
+        )
 
         db.commit()
         db.refresh(workout)
@@ -136,11 +154,18 @@ class WorkoutService:
     ) -> Workout:
         """Update workout."""
         workout = WorkoutService.get_workout_by_id(db, workout_id, user_id)
+        old_load = TrainingLoadService.workout_load(workout.duration_minutes, workout.intensity)
+        old_minutes = workout.duration_minutes or 0
 
         update_data = workout_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(workout, field, value)
 
+        load_delta = TrainingLoadService.workout_load(workout.duration_minutes, workout.intensity) - old_load
+        if load_delta:
+            TrainingLoadService.apply_delta(db, user_id, workout.workout_date, load_delta)
+        UserSummaryService.adjust(db, user_id, {"total_workout_minutes": (workout.duration_minutes or 0) - old_minutes})
+
         db.commit()
         db.refresh(workout)
 
@@ -150,8 +175,23 @@ class WorkoutService:
     def delete_workout(db: Session, workout_id: int, user_id: int) -> None:
         """Delete workout (cascade deletes exercises)."""
         workout = WorkoutService.get_workout_by_id(db, workout_id, user_id)
+        exercise_keys = {
+            ExerciseCatalogService.canonical_key(db, e.exercise_name, e.catalog_id)
+            for e in workout.exercises
+        }
+        TrainingLoadService.record_workout(db, workout, workout.exercises, sign=-1)
+        ActivityCalendarService.record_activity(db, user_id, workout.workout_date, "workout", -1)
+        UserSummaryService.adjust(
+            db, user_id, {"workout_count": -1, "total_workout_minutes": -(workout.duration_minutes or 0)}
+        )
 
         db.delete(workout)
+        db.flush()
+
+        # The deleted entries may have held a record, so rebuild the affected ones
+        ExerciseRecordService.rebuild_records(db, user_id, exercise_keys)
+        StreakService.rebuild(db, user_id)
+
         db.commit()
 
     @staticmethod
@@ -0,0 +1,159 @@
+"""
+Cache helpers backed by Redis.
+
+Values are stored as JSON. When Redis is unreachable every read is a miss
+and writes are skipped, so a cache outage never fails a request (and never
+serves data another worker has invalidated).
+
+Per-user data versions make invalidation cheap: services bump the version
+after every write, and cached results embed the version in their key, so
+stale entries are simply never read again and expire on their own. While
+Redis is down the version is unknown (None): nothing is cached and no ETag
+is derived from it. Versions are prefixed with a cache epoch, a random
+token stored in Redis that is replaced when a process failed to record a
+bump or Redis lost its data, so neither can bring back an old version.
+"""
+import json
+import time
+import uuid
+from typing import Any, Optional
+
+import redis
+from fastapi.encoders import jsonable_encoder
+
+from .config import get_settings
+from .metrics import record_cache_lookup
+
+settings = get_settings()
+
+# Seconds to skip Redis after a connection failure
+REDIS_RETRY_INTERVAL = 30
+
+EPOCH_KEY = "cache:epoch"
+
+_redis_client: Optional[redis.Redis] = None
+_redis_down_until = 0.0
+
+# Set when a version bump could not be recorded; the epoch is replaced
+# as soon as Redis is reachable again
+_bumps_lost = False
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Get the shared Redis client, or None while Redis is marked as down."""
+    global _redis_client
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.2,
+            socket_connect_timeout=0.2,
+        )
+    return _redis_client
+
+
+def _mark_redis_down() -> None:
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """Get a cached value, or None on miss (or while Redis is down)."""
+    raw = None
+    client = get_redis()
+    if client is not None:
+        try:
+            raw = client.get(key)
+        except redis.RedisError:
+            _mark_redis_down()
+
+    record_cache_lookup(key, raw is not None)
+    if raw is None:
+        return None
+    return json.loads(raw)
+
+
+def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> None:
+    """Store a JSON-serializable value (skipped while Redis is down)."""
+    client = get_redis()
+    if client is None:
+        return
+    ttl = ttl if ttl is not None else settings.CACHE_DEFAULT_TTL_SECONDS
+    try:
+        client.set(key, json.dumps(jsonable_encoder(value)), ex=ttl)
+    except redis.RedisError:
+        _mark_redis_down()
+
+
+def _version_key(user_id: int) -> str:
+    return f"user:{user_id}:data_version"
+
+
+def _current_epoch(client: redis.Redis, stored: Optional[bytes]) -> str:
+    """The cache epoch, replacing it after lost bumps or creating it if missing."""
+    global _bumps_lost
+    if _bumps_lost:
+        client.set(EPOCH_KEY, uuid.uuid4().hex[:8])
+        _bumps_lost = False
+    elif stored is not None:
+        return stored.decode()
+    else:
+        client.set(EPOCH_KEY, uuid.uuid4().hex[:8], nx=True)
+    return client.get(EPOCH_KEY).decode()
+
+
+def get_user_data_version(user_id: int) -> Optional[str]:
+    """
+    Current data version for a user, or None while Redis is unavailable.
+
+    Opaque: the cache epoch and the user's bump counter.
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        epoch, value = client.mget(EPOCH_KEY, _version_key(user_id))
+        epoch = _current_epoch(client, epoch)
+    except redis.RedisError:
+        _mark_redis_down()
+        return None
+    return f"{epoch}.{int(value) if value is not None else 0}"
+
+
+def bump_user_data_version(user_id: int) -> None:
+    """Invalidate every versioned cache entry for a user."""
+    global _bumps_lost
+    client = get_redis()
+    if client is not None:
+        try:
+            if _bumps_lost:
+                _current_epoch(client, None)
+            client.incr(_version_key(user_id))
+            return
+        except redis.RedisError:
+            _mark_redis_down()
+    _bumps_lost = True
+
+
+def user_cache_key(namespace: str, user_id: int, *parts: Any) -> Optional[str]:
+    """Build a cache key tied to the user's current data version (None if unknown)."""
+    version = get_user_data_version(user_id)
+    if version is None:
+        return None
+    suffix = ":".join(str(part) for part in parts)
+    key = f"{namespace}:{user_id}:v{version}"
+    return f"{key}:{suffix}" if suffix else key
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header value matches `etag`.
+
+    The header may list several ETags or be "*". Comparison is weak (a W/
+    prefix is ignored), as required for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
@@ -19,9 +19,23 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10  # Per process; gunicorn.conf.py sizes it from the connection budget
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PREWARM: int = 2  # Connections opened in the background at startup (0 disables)
+
+    # Query monitor (slow-query log and N+1 detection, togglable at runtime)
+    QUERY_MONITOR_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    N_PLUS_ONE_THRESHOLD: int = 5  # Repetitions of one statement shape within a request
+
+    # Meal partitioning (monthly partitions on meal_date)
+    MEAL_PARTITION_MONTHS_AHEAD: int = 3
+    MEAL_PARTITION_RETENTION_MONTHS: int = 0  # 0 keeps every partition attached
+    MEAL_PARTITION_ARCHIVE_SCHEMA: str = "archive"
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_DEFAULT_TTL_SECONDS: int = 3600
 
     # JWT
     JWT_SECRET_KEY: str
@@ -52,6 +66,32 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_LOGIN_PER_HOUR: int = 5
 
+    # Dashboard
+    DASHBOARD_LATENCY_BUDGET_MS: int = 800
+    DASHBOARD_MAX_WORKERS: int = 8
+
+    # Exercise catalog
+    EXERCISE_CATALOG_TTL_SECONDS: int = 300  # In-memory index refresh interval
+    EXERCISE_MATCH_THRESHOLD: float = 0.5  # Minimum pg_trgm similarity for fuzzy matches
+    EXERCISE_SEARCH_MAX_RESULTS: int = 20
+
+    # Sampling profiler
+    PROFILER_MAX_SECONDS: int = 60
+    PROFILER_INTERVAL_MS: float = 5
+    PROFILING_HEADER_TOKEN: str = ""  # Enables per-request profiling via the X-Profile header when set
+
+    # Memory profiling (tracemalloc; can also be started at runtime from the admin API)
+    MEMORY_TRACING_ENABLED: bool = False
+    MEMORY_TRACING_FRAMES: int = 1
+
+    # Traffic capture (sanitized request metadata for benchmarks/replay_traffic.py)
+    TRAFFIC_CAPTURE_DIR: str = ""  # Enables capture when set
+    TRAFFIC_CAPTURE_SAMPLE_RATE: float = 1.0
+    TRAFFIC_CAPTURE_USER_BUCKETS: int = 1000
+
+    # Account deletion
+    ACCOUNT_PURGE_BATCH_SIZE: int = 5000  # Rows removed per statement/transaction
+
     # Metrics
     ENABLE_METRICS: bool = True
 
@@ -1,35 +1,100 @@
 """
 Database configuration and session management.
+
+The engine is created on first use (get_engine(), or the first session),
+not at import: importing the app stays cheap, and a server that forks
+workers after loading the app gives each worker its own pool.
 """
+import threading
+from typing import Generator, Optional
+
+import structlog
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+
 from .config import get_settings
+from .query_monitor import install_query_monitor
 
 settings = get_settings()
+logger = structlog.get_logger()
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
 
-# Debug: Log DATABASE_URL (masking password)
-import re
-masked_url = re.sub(r'://([^:]+):([^@]+)@', r'://\1:***@', settings.DATABASE_URL)
-print(f"[DEBUG] DATABASE_URL: {masked_url}")
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that creates the engine before the first session."""
 
-# Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DB_ECHO,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+    def __call__(self, **local_kw) -> Session:
+        if self.kw.get("bind") is None:
+            get_engine()
+        return super().__call__(**local_kw)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Session factory (bound by get_engine)
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 
 # Base class for models
 Base = declarative_base()
 
 
+def get_engine() -> Engine:
+    """The process-wide engine, created on first call."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    settings.DATABASE_URL,
+                    echo=settings.DB_ECHO,
+                    pool_pre_ping=True,
+                    pool_size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_MAX_OVERFLOW
+                )
+
+                # Slow-query log and N+1 detection
+                install_query_monitor(
+                    engine,
+                    enabled=settings.QUERY_MONITOR_ENABLED,
+                    slow_query_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+                    n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD
+                )
+
+                SessionLocal.configure(bind=engine)
+                _engine = engine
+                logger.info("Database engine created", url=engine.url.render_as_string(hide_password=True))
+    return _engine
+
+
+def dispose_engine() -> None:
+    """Close the pool's connections (the engine is kept and reconnects on demand)."""
+    if _engine is not None:
+        _engine.dispose()
+
+
+def prewarm_pool(connections: int) -> None:
+    """
+    Open up to `connections` pooled connections ahead of the first requests.
+
+    Blocking; run it in a background thread. Failures are logged, not
+    raised: requests simply open their connections themselves.
+    """
+    engine = get_engine()
+    opened = []
+    try:
+        for _ in range(min(connections, engine.pool.size())):
+            opened.append(engine.connect())
+    except Exception as e:
+        logger.warning("Could not prewarm database pool", error=str(e))
+    finally:
+        for connection in opened:
+            connection.close()
+    if opened:
+        logger.info("Database pool prewarmed", connections=len(opened))
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides database session.
@@ -44,4 +109,14 @@ def get_db() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """Initialize database tables."""
+    from sqlalchemy import text
+    from ..database.exercise_catalog import seed_exercise_catalog
+    from ..database.partitions import ensure_meal_partitions
+
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        ensure_meal_partitions(conn, settings.MEAL_PARTITION_MONTHS_AHEAD)
+        seed_exercise_catalog(conn)
@@ -3,7 +3,7 @@ FastAPI dependencies for authentication, authorization, etc.
 """
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 
 from .database import get_db
@@ -13,13 +13,8 @@ from ..database.models import User
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Get current authenticated user from JWT token.
-    """
+def _authenticate(credentials: HTTPAuthorizationCredentials, db: Session, *options) -> User:
+    """Load the user of a JWT access token (with optional loader options) or raise."""
     token = credentials.credentials
     payload = decode_token(token)
 
@@ -38,7 +33,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).options(*options).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -55,8 +50,43 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+    """
+    return _authenticate(credentials, db)
+
+
+async def get_current_user_with_summary(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user with their summary and streak rows joined in.
+
+    One query: the user's primary-key lookup LEFT JOINs user_summaries and
+    workout_streaks on the same key.
+    """
+    return _authenticate(credentials, db, joinedload(User.summary), joinedload(User.streak))
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Get current active user."""
     return current_user
+
+
+def get_current_admin_user(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """Verify that current user is an admin."""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can access this resource"
+        )
+    return current_user
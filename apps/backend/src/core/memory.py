@@ -0,0 +1,137 @@
+"""
+Memory profiling with tracemalloc.
+
+Admins can start tracing on a worker, store a baseline snapshot and later
+diff the live heap against it to see which source lines kept memory.
+Tracing slows allocations down noticeably, so it is off until requested.
+
+MemoryProfilingMiddleware records the peak traced memory of every request
+into a Prometheus histogram by route. The peak is process-wide: a request
+overlapping with others reports the peak of all of them, so read the
+histogram as an upper bound and look for routes whose values stay high.
+"""
+import os
+import tracemalloc
+from typing import List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .metrics import REQUEST_PEAK_MEMORY, route_template
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size (Linux only)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def set_tracing(enabled: bool, frames: int = 1) -> None:
+    """Start (with `frames` frames per traceback) or stop tracemalloc."""
+    global _baseline
+    if enabled:
+        if tracemalloc.is_tracing() and tracemalloc.get_traceback_limit() != frames:
+            tracemalloc.stop()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+    else:
+        tracemalloc.stop()
+        _baseline = None
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+
+def _location(trace_key) -> str:
+    if isinstance(trace_key, tracemalloc.Traceback):
+        return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in trace_key)
+    if isinstance(trace_key, tracemalloc.Frame):
+        return f"{trace_key.filename}:{trace_key.lineno}"
+    return str(trace_key)
+
+
+def memory_status(allocations: List[dict]) -> dict:
+    """Tracing state and process totals around a list of allocations."""
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return {
+        "tracing": tracemalloc.is_tracing(),
+        "traceback_frames": tracemalloc.get_traceback_limit(),
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "rss_bytes": rss_bytes(),
+        "has_baseline": _baseline is not None,
+        "allocations": allocations,
+    }
+
+
+def take_baseline(group_by: str = "lineno", top: int = 20) -> dict:
+    """Store a snapshot as the diff baseline and return its largest allocations."""
+    global _baseline
+    _baseline = _snapshot()
+    allocations = [
+        {
+            "location": _location(stat.traceback if group_by == "traceback" else stat.traceback[0]),
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in _baseline.statistics(group_by)[:top]
+    ]
+    return memory_status(allocations)
+
+
+def diff_with_baseline(group_by: str = "lineno", top: int = 20) -> dict:
+    """Compare a new snapshot with the baseline, largest growth first."""
+    stats = _snapshot().compare_to(_baseline, group_by)
+    allocations = [
+        {
+            "location": _location(stat.traceback if group_by == "traceback" else stat.traceback[0]),
+            "size_bytes": stat.size,
+            "count": stat.count,
+            "size_diff_bytes": stat.size_diff,
+            "count_diff": stat.count_diff,
+        }
+        for stat in stats[:top]
+    ]
+    return memory_status(allocations)
+
+
+def has_baseline() -> bool:
+    return _baseline is not None
+
+
+class MemoryProfilingMiddleware:
+    """ASGI middleware recording each request's peak traced memory by route."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.in_flight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        # Resetting the peak while other requests run would hide theirs
+        if self.in_flight == 0:
+            tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            if tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                REQUEST_PEAK_MEMORY.labels(route_template(scope)).observe(max(peak - start, 0))
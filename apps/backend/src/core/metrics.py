@@ -0,0 +1,193 @@
+"""
+Prometheus metrics.
+
+Request latency is recorded by route template (not raw path) and status,
+database queries through SQLAlchemy engine events, and cache lookups by
+the cache helpers. Each request also reports how many queries it ran and
+how long they took in total.
+
+Multi-process servers: set PROMETHEUS_MULTIPROC_DIR to an empty, writable
+directory before the workers start. Every worker then writes its samples
+there and /metrics aggregates all of them; gauges sum the live processes.
+"""
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    REGISTRY,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# Paths that are not recorded (scrapes would otherwise dominate the histograms)
+EXCLUDED_PATHS = {"/metrics"}
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REQUEST_PEAK_MEMORY = Histogram(
+    "http_request_peak_traced_memory_bytes",
+    "Peak memory traced by tracemalloc during a request (only while tracing)",
+    ["route"],
+    buckets=(2**16, 2**18, 2**20, 2**22, 2**24, 2**26, 2**28, 2**30),
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "Database query latency by statement type",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Database queries executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_query_seconds_per_request",
+    "Total database query time per HTTP request",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size",
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by key namespace and result (hit ratio = hit / total)",
+    ["namespace", "result"],
+)
+
+
+class _RequestStats:
+    """Database work done on behalf of the current request."""
+
+    __slots__ = ("queries", "query_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+# A mutable holder is shared with the threadpool contexts the request's
+# sync dependencies and handlers run in, so their queries are counted too.
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar("request_db_stats", default=None)
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route path template (e.g. /v1/workouts/{workout_id}), or "unmatched"."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, in-flight requests and per-request query stats."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            _request_stats.reset(token)
+
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route).observe(stats.queries)
+            DB_TIME_PER_REQUEST.labels(route).observe(stats.query_seconds)
+
+
+def _operation(statement: str) -> str:
+    """Statement type (SELECT, INSERT, ...) used as a low-cardinality label."""
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach query timing and pool gauges to an engine."""
+    pool = engine.pool
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        DB_QUERY_LATENCY.labels(_operation(statement)).observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.query_seconds += elapsed
+
+    def _update_pool_gauges(*args) -> None:
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    event.listen(pool, "checkout", _update_pool_gauges)
+    event.listen(pool, "checkin", _update_pool_gauges)
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    """Count a cache lookup under the key's namespace (the part before the first ':')."""
+    CACHE_REQUESTS.labels(key.split(":", 1)[0], "hit" if hit else "miss").inc()
+
+
+def metrics_response() -> Response:
+    """Render all metrics, aggregated across worker processes when multi-process."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
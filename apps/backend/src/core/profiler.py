@@ -0,0 +1,162 @@
+"""
+Sampling CPU profiler for live workers.
+
+A background thread snapshots every thread's stack with
+sys._current_frames() at a fixed interval and counts identical stacks.
+Nothing is installed in the profiled code, so overhead is limited to the
+sampling itself and disappears when the profiler stops.
+
+Output uses the collapsed-stack format ("root;caller;callee count" per
+line) read by flamegraph.pl, speedscope and most flame graph viewers.
+
+Only one profile runs per process at a time.
+"""
+import hmac
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Leaf frames that mean "waiting", dropped unless idle samples are requested
+IDLE_LEAVES = {
+    ("selectors", "select"),
+    ("threading", "wait"),
+    ("queue", "get"),
+    ("concurrent.futures.thread", "_worker"),
+}
+
+PROFILE_HEADER = "x-profile"
+
+_busy = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    """Collects collapsed stacks of all other threads until stopped."""
+
+    def __init__(self, interval: float, include_idle: bool = False) -> None:
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.monotonic() - self.started_at
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                leaf = (frame.f_globals.get("__name__"), frame.f_code.co_name)
+                if not self.include_idle and leaf in IDLE_LEAVES:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Stacks in collapsed format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def try_start_sampler(interval: float, include_idle: bool = False) -> Optional[StackSampler]:
+    """Start a sampler, or return None if this process is already being profiled."""
+    if not _busy.acquire(blocking=False):
+        return None
+    sampler = StackSampler(interval, include_idle)
+    sampler.start()
+    return sampler
+
+
+def stop_sampler(sampler: StackSampler) -> None:
+    """Stop a sampler started by try_start_sampler."""
+    try:
+        sampler.stop()
+    finally:
+        _busy.release()
+
+
+def profile_filename() -> str:
+    return f"profile-{os.getpid()}-{time.strftime('%Y%m%dT%H%M%S')}.folded"
+
+
+class ProfilingMiddleware:
+    """
+    Per-request opt-in profiling.
+
+    A request carrying `X-Profile: <token>` (PROFILING_HEADER_TOKEN) is run
+    normally while the worker is sampled, and the collapsed stacks are
+    returned instead of its response body; the original status is kept in
+    `X-Profiled-Status`. All threads of the worker are sampled, so profile
+    on a quiet worker. Requests arriving while another profile runs are
+    served unprofiled.
+    """
+
+    def __init__(self, app: ASGIApp, token: str, interval: float) -> None:
+        self.app = app
+        self.token = token.encode()
+        self.interval = interval
+
+    def _opted_in(self, scope: Scope) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER.encode():
+                return hmac.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._opted_in(scope):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = try_start_sampler(self.interval)
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            stop_sampler(sampler)
+
+        body = sampler.collapsed().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"content-disposition", f'attachment; filename="{profile_filename()}"'.encode()),
+                (b"x-profiled-status", str(status_code).encode()),
+                (b"x-profile-samples", str(sampler.samples).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,206 @@
+"""
+Query monitor: slow-query log and N+1 detection.
+
+When enabled, engine event listeners time every statement and count the
+statement shapes (SQL text with bound parameters left as placeholders)
+executed during each request. Statements slower than the threshold are
+logged right away; shapes repeated at least `n_plus_one_threshold` times
+within one request are logged as a likely N+1 pattern when the request
+finishes. Entries carry a statement fingerprint (slow queries also one of
+their bound parameters; values themselves are never logged) and the
+application frame (service, route or dependency) that issued the query.
+
+The listeners are attached and removed at runtime, so a disabled monitor
+costs nothing per query. Settings are per process: with several workers,
+each worker has to be toggled (or configured through the environment).
+"""
+import hashlib
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = structlog.get_logger()
+
+# Frames inside these packages are reported as the query origin
+APPLICATION_PACKAGES = ("/src/api/services/", "/src/api/routes/", "/src/core/dependencies.py")
+
+
+@dataclass
+class _RequestQueries:
+    """Statements seen during one request."""
+
+    scope: Scope
+    statements: int = 0
+    shapes: Counter = field(default_factory=Counter)
+    origins: Dict[str, str] = field(default_factory=dict)
+
+
+_current: ContextVar[Optional[_RequestQueries]] = ContextVar("query_monitor_request", default=None)
+
+
+def fingerprint(value: str) -> str:
+    """Short stable hash used to group log entries."""
+    return hashlib.blake2b(value.encode(), digest_size=6).hexdigest()
+
+
+def parameters_fingerprint(parameters) -> str:
+    """Fingerprint of bound parameter values, without revealing them."""
+    return fingerprint(repr(parameters))
+
+
+def query_origin(request: Optional[_RequestQueries] = None) -> str:
+    """
+    module:function:line of the innermost application frame on the stack.
+
+    Queries issued outside application code (e.g. lazy loads while the
+    response is serialized) are attributed to the request's endpoint.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        if any(package in filename for package in APPLICATION_PACKAGES):
+            module = frame.f_globals.get("__name__", filename)
+            return f"{module}:{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+
+    endpoint = request.scope.get("endpoint") if request else None
+    if endpoint is not None:
+        return f"{endpoint.__module__}:{endpoint.__name__} (outside application code)"
+    return "unknown"
+
+
+class QueryMonitor:
+    """Engine listeners for one engine, attachable at runtime."""
+
+    def __init__(self, engine: Engine, slow_query_ms: float, n_plus_one_threshold: int) -> None:
+        self.engine = engine
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.enabled = False
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        slow_query_ms: Optional[float] = None,
+        n_plus_one_threshold: Optional[int] = None
+    ) -> None:
+        """Change thresholds and attach or remove the listeners."""
+        if slow_query_ms is not None:
+            self.slow_query_ms = slow_query_ms
+        if n_plus_one_threshold is not None:
+            self.n_plus_one_threshold = n_plus_one_threshold
+        if enabled is True and not self.enabled:
+            event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+            self.enabled = True
+        elif enabled is False and self.enabled:
+            event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+            self.enabled = False
+        logger.info(
+            "Query monitor configured",
+            enabled=self.enabled,
+            slow_query_ms=self.slow_query_ms,
+            n_plus_one_threshold=self.n_plus_one_threshold,
+        )
+
+    def settings(self) -> dict:
+        """Current settings."""
+        return {
+            "enabled": self.enabled,
+            "slow_query_ms": self.slow_query_ms,
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+        }
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_monitor_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_monitor_start")
+        if not starts:
+            # Listeners were attached while this statement was running
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+
+        request = _current.get()
+        if request is not None:
+            request.statements += 1
+            request.shapes[statement] += 1
+            if request.shapes[statement] == self.n_plus_one_threshold:
+                request.origins[statement] = query_origin(request)
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                "Slow query",
+                duration_ms=round(elapsed_ms, 1),
+                statement_fingerprint=fingerprint(statement),
+                parameters_fingerprint=parameters_fingerprint(parameters),
+                origin=query_origin(request),
+                path=request.scope["path"] if request else None,
+                statement=" ".join(statement.split())[:500],
+            )
+
+    def report(self, request: _RequestQueries) -> None:
+        """Log the N+1 patterns found in a finished request."""
+        for statement, count in request.shapes.items():
+            if count >= self.n_plus_one_threshold:
+                logger.warning(
+                    "Possible N+1 query",
+                    path=request.scope["path"],
+                    repetitions=count,
+                    request_statements=request.statements,
+                    statement_fingerprint=fingerprint(statement),
+                    origin=request.origins.get(statement, "unknown"),
+                    statement=" ".join(statement.split())[:500],
+                )
+
+
+_monitor: Optional[QueryMonitor] = None
+
+
+def install_query_monitor(
+    engine: Engine,
+    enabled: bool,
+    slow_query_ms: float,
+    n_plus_one_threshold: int
+) -> QueryMonitor:
+    """Create the process-wide monitor for an engine."""
+    global _monitor
+    _monitor = QueryMonitor(engine, slow_query_ms, n_plus_one_threshold)
+    if enabled:
+        _monitor.configure(enabled=True)
+    return _monitor
+
+
+def get_query_monitor() -> Optional[QueryMonitor]:
+    """The process-wide monitor (None if not installed)."""
+    return _monitor
+
+
+class QueryMonitorMiddleware:
+    """ASGI middleware scoping statement counts to requests while the monitor is enabled."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        monitor = _monitor
+        if scope["type"] != "http" or monitor is None or not monitor.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = _RequestQueries(scope=scope)
+        token = _current.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            monitor.report(request)
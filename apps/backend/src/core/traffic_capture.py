@@ -0,0 +1,141 @@
+"""
+Traffic capture for replay benchmarks.
+
+TrafficCaptureMiddleware appends one JSON line per finished request to
+`<directory>/traffic-<pid>.jsonl` (one file per worker, so no locking):
+
+    {"ts": 1760870400.123, "method": "GET", "route": "/v1/meals/daily/{target_date}",
+     "path_params": {"target_date": "2026-10-19"}, "query": {"limit": "20"},
+     "body_bytes": 0, "content_type": null, "user": 417, "status": 200, "duration_ms": 12.4}
+
+Only metadata is kept, never bodies, headers or tokens. `user` is a keyed
+hash of the user id reduced to a bucket, so requests of one user stay
+together without identifying them. Query values are kept only for the
+parameters in SAFE_QUERY_PARAMS (limits, dates, flags and enum-like
+filters), and only when they look like numbers, dates, booleans or short
+words; every other value (free text such as search terms or exercise
+names, opaque cursors) becomes "*". Resource ids in the path are
+dropped: the route template already says which resource is addressed, and
+ids mean nothing on another database.
+
+benchmarks/replay_traffic.py re-issues a capture against another stack.
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import route_template
+from .security import decode_token
+
+EXCLUDED_PREFIXES = ("/metrics", "/v1/admin", "/docs", "/redoc", "/openapi.json")
+
+# Query parameters whose values are replayable and carry no user text
+SAFE_QUERY_PARAMS = frozenset({
+    "limit", "days", "stats_days", "window_days", "points", "year",
+    "start_date", "end_date", "from_date", "to_date", "target_date",
+    "is_active", "is_completed",
+    "type", "meal_type", "workout_type", "goal_type", "photo_type", "metric", "method",
+})
+
+SAFE_VALUE = re.compile(r"^(-?\d+(\.\d+)?|\d{4}-\d{2}-\d{2}|true|false|[a-z_]{1,32})$", re.IGNORECASE)
+
+
+def sanitize_value(value: str) -> str:
+    return value if SAFE_VALUE.match(value) else "*"
+
+
+def user_bucket(user_id: str, key: bytes, buckets: int) -> int:
+    """Stable pseudonymous bucket of a user id."""
+    digest = hashlib.blake2b(user_id.encode(), key=key[:64], digest_size=8).digest()
+    return int.from_bytes(digest, "big") % buckets
+
+
+class TrafficCaptureMiddleware:
+    """ASGI middleware writing sanitized request metadata to a per-process JSONL log."""
+
+    def __init__(self, app: ASGIApp, directory: str, sample_rate: float, user_buckets: int, key: str) -> None:
+        self.app = app
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.user_buckets = user_buckets
+        self.key = key.encode()
+        self._file = None
+        self._pid: Optional[int] = None
+
+    def _log(self):
+        # Reopen after a fork so every worker writes its own file
+        if self._pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            self._pid = os.getpid()
+            self._file = open(os.path.join(self.directory, f"traffic-{self._pid}.jsonl"), "a", buffering=1)
+        return self._file
+
+    def _user(self, scope: Scope) -> Optional[int]:
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                subject = decode_token(token).get("sub") if scheme.lower() == "bearer" else None
+                return user_bucket(str(subject), self.key, self.user_buckets) if subject else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(EXCLUDED_PREFIXES)
+            or random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        timestamp = time.time()
+        start = time.perf_counter()
+        body_bytes = 0
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                body_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            content_type = next(
+                (value.decode("latin-1").split(";")[0] for name, value in scope["headers"] if name == b"content-type"),
+                None,
+            )
+            record = {
+                "ts": round(timestamp, 3),
+                "method": scope["method"],
+                "route": route_template(scope),
+                "path_params": {
+                    name: sanitize_value(str(value))
+                    for name, value in scope.get("path_params", {}).items()
+                    if not name.endswith("_id")
+                },
+                "query": {
+                    name: sanitize_value(value) if name in SAFE_QUERY_PARAMS else "*"
+                    for name, value in parse_qsl(scope.get("query_string", b"").decode("latin-1"))
+                },
+                "body_bytes": body_bytes,
+                "content_type": content_type,
+                "user": self._user(scope),
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            }
+            self._log().write(json.dumps(record, separators=(",", ":")) + "\n")
@@ -0,0 +1,127 @@
+"""
+Exercise catalog seed data and maintenance helpers.
+
+Helpers take a SQLAlchemy Connection so they can be used both from
+init_db() and from Alembic migrations.
+"""
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..shared.text import normalize_exercise_name
+
+# (canonical name, exercise type, muscle group, aliases)
+CATALOG_SEED: List[Tuple[str, str, str, Tuple[str, ...]]] = [
+    ("Bench Press", "compound", "chest", ("Supino Reto", "Supino", "Barbell Bench Press", "Supino com Barra")),
+    ("Incline Bench Press", "compound", "chest", ("Supino Inclinado", "Incline Press")),
+    ("Decline Bench Press", "compound", "chest", ("Supino Declinado",)),
+    ("Dumbbell Bench Press", "compound", "chest", ("Supino com Halteres", "DB Bench Press")),
+    ("Chest Fly", "isolation", "chest", ("Crucifixo", "Dumbbell Fly", "Pec Deck", "Voador")),
+    ("Cable Crossover", "isolation", "chest", ("Crossover", "Cross Over")),
+    ("Push-up", "compound", "chest", ("Flexão", "Flexao de Braco", "Pushup")),
+    ("Dips", "compound", "chest", ("Paralelas", "Mergulho")),
+    ("Squat", "compound", "legs", ("Agachamento", "Back Squat", "Agachamento Livre")),
+    ("Front Squat", "compound", "legs", ("Agachamento Frontal",)),
+    ("Leg Press", "compound", "legs", ("Leg Press 45", "Prensa")),
+    ("Lunge", "compound", "legs", ("Avanço", "Afundo", "Passada")),
+    ("Bulgarian Split Squat", "compound", "legs", ("Agachamento Búlgaro",)),
+    ("Leg Extension", "isolation", "legs", ("Cadeira Extensora", "Extensora")),
+    ("Leg Curl", "isolation", "legs", ("Mesa Flexora", "Cadeira Flexora", "Flexora")),
+    ("Romanian Deadlift", "compound", "legs", ("Stiff", "Levantamento Terra Romeno", "RDL")),
+    ("Hip Thrust", "compound", "glutes", ("Elevação Pélvica", "Elevacao Pelvica")),
+    ("Calf Raise", "isolation", "legs", ("Panturrilha", "Elevação de Panturrilha", "Gêmeos")),
+    ("Hip Abduction", "isolation", "glutes", ("Cadeira Abdutora", "Abdutora")),
+    ("Hip Adduction", "isolation", "legs", ("Cadeira Adutora", "Adutora")),
+    ("Deadlift", "compound", "back", ("Levantamento Terra", "Terra")),
+    ("Pull-up", "compound", "back", ("Barra Fixa", "Pullup", "Chin-up")),
+    ("Lat Pulldown", "compound", "back", ("Puxada Frontal", "Puxada Alta", "Pulldown")),
+    ("Barbell Row", "compound", "back", ("Remada Curvada", "Bent Over Row")),
+    ("Seated Cable Row", "compound", "back", ("Remada Baixa", "Remada Sentada", "Cable Row")),
+    ("Dumbbell Row", "compound", "back", ("Remada Unilateral", "Serrote", "One Arm Row")),
+    ("Overhead Press", "compound", "shoulders", ("Desenvolvimento", "Military Press", "Shoulder Press")),
+    ("Dumbbell Shoulder Press", "compound", "shoulders", ("Desenvolvimento com Halteres",)),
+    ("Lateral Raise", "isolation", "shoulders", ("Elevação Lateral", "Elevacao Lateral")),
+    ("Front Raise", "isolation", "shoulders", ("Elevação Frontal",)),
+    ("Face Pull", "isolation", "shoulders", ("Puxada para o Rosto",)),
+    ("Shrug", "isolation", "back", ("Encolhimento",)),
+    ("Biceps Curl", "isolation", "arms", ("Rosca Direta", "Barbell Curl", "Rosca")),
+    ("Hammer Curl", "isolation", "arms", ("Rosca Martelo",)),
+    ("Triceps Pushdown", "isolation", "arms", ("Tríceps Pulley", "Triceps Pulley", "Tricep Pushdown")),
+    ("Skull Crusher", "isolation", "arms", ("Tríceps Testa", "Triceps Testa")),
+    ("Overhead Triceps Extension", "isolation", "arms", ("Tríceps Francês", "Triceps Frances")),
+    ("Plank", "isolation", "core", ("Prancha",)),
+    ("Crunch", "isolation", "core", ("Abdominal", "Abdominal Supra")),
+    ("Running", "cardio", "full_body", ("Corrida", "Run", "Esteira")),
+    ("Cycling", "cardio", "full_body", ("Bicicleta", "Bike", "Ciclismo")),
+    ("Rowing Machine", "cardio", "full_body", ("Remo Ergômetro", "Remo")),
+    ("Jump Rope", "cardio", "full_body", ("Pular Corda",)),
+]
+
+
+def seed_exercise_catalog(conn: Connection) -> None:
+    """
+    Insert the built-in catalog entries and aliases.
+
+    Idempotent: existing keys are left untouched. The canonical name is
+    stored as an alias as well.
+    """
+    for name, exercise_type, muscle_group, aliases in CATALOG_SEED:
+        key = normalize_exercise_name(name)
+        conn.execute(
+            text(
+                "INSERT INTO exercise_catalog (name, exercise_key, exercise_type, muscle_group, created_at) "
+                "VALUES (:name, :key, :exercise_type, :muscle_group, now()) "
+                "ON CONFLICT (exercise_key) DO NOTHING"
+            ),
+            {"name": name, "key": key, "exercise_type": exercise_type, "muscle_group": muscle_group},
+        )
+        for alias in (name,) + aliases:
+            conn.execute(
+                text(
+                    "INSERT INTO exercise_aliases (catalog_id, alias, alias_key) "
+                    "SELECT id, :alias, :alias_key FROM exercise_catalog WHERE exercise_key = :key "
+                    "ON CONFLICT (alias_key) DO NOTHING"
+                ),
+                {"alias": alias, "alias_key": normalize_exercise_name(alias), "key": key},
+            )
+
+
+def link_exercises_to_catalog(conn: Connection, threshold: float) -> int:
+    """
+    Set exercises.catalog_id for unlinked rows.
+
+    Each distinct normalized name is matched once: exact alias hits win,
+    otherwise the most trigram-similar alias scoring at least `threshold`.
+    Requires pg_trgm.
+
+    Returns:
+        Number of exercises linked
+    """
+    result = conn.execute(
+        text(
+            """
+            WITH names AS (
+                SELECT DISTINCT lower(regexp_replace(btrim(exercise_name), '\\s+', ' ', 'g')) AS name_key
+                FROM exercises
+                WHERE catalog_id IS NULL
+            ),
+            matches AS (
+                SELECT DISTINCT ON (n.name_key) n.name_key, a.catalog_id
+                FROM names n
+                JOIN exercise_aliases a
+                  ON a.alias_key = n.name_key
+                  OR (a.alias_key % n.name_key AND similarity(a.alias_key, n.name_key) >= :threshold)
+                ORDER BY n.name_key, (a.alias_key = n.name_key) DESC,
+                         similarity(a.alias_key, n.name_key) DESC, a.id
+            )
+            UPDATE exercises e
+            SET catalog_id = m.catalog_id
+            FROM matches m
+            WHERE e.catalog_id IS NULL
+              AND lower(regexp_replace(btrim(e.exercise_name), '\\s+', ' ', 'g')) = m.name_key
+            """
+        ),
+        {"threshold": threshold},
+    )
+    return result.rowcount
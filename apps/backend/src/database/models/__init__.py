@@ -5,6 +5,12 @@ from .progress_photo import ProgressPhoto
 from .workout import Workout, Exercise
 from .meal import Meal
 from .goal import Goal
+from .exercise_record import ExerciseRecord
+from .exercise_catalog import ExerciseCatalog, ExerciseAlias
+from .training_load import TrainingLoad
+from .activity_calendar import ActivityCalendar
+from .workout_streak import WorkoutStreak
+from .user_summary import UserSummary
 
 __all__ = [
     "User",
@@ -14,4 +20,11 @@ __all__ = [
     "Exercise",
     "Meal",
     "Goal",
+    "ExerciseRecord",
+    "ExerciseCatalog",
+    "ExerciseAlias",
+    "TrainingLoad",
+    "ActivityCalendar",
+    "WorkoutStreak",
+    "UserSummary",
 ]
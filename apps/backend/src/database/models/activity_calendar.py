@@ -0,0 +1,43 @@
+"""
+Activity calendar model - per-user, per-year daily activity counters.
+"""
+from sqlalchemy import Column, Integer, SmallInteger, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
+from datetime import datetime
+
+from ...core.database import Base
+
+# Array slots per year (index = day of year, 1-based; slot 366 unused in common years)
+CALENDAR_DAYS = 366
+
+
+class ActivityCalendar(Base):
+    """
+    Daily counts of workouts, meals and measurements for one user and year.
+
+    Maintained on writes by the respective services so the yearly heatmap
+    is a single-row read. `version` increases on every change and backs
+    the endpoint's ETag.
+    """
+
+    __tablename__ = "activity_calendars"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", name="uq_activity_calendars_user_year"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    year = Column(Integer, nullable=False)
+
+    # One counter per day of year
+    workout_counts = Column(ARRAY(SmallInteger), nullable=False)
+    meal_counts = Column(ARRAY(SmallInteger), nullable=False)
+    measurement_counts = Column(ARRAY(SmallInteger), nullable=False)
+
+    version = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ActivityCalendar(user_id={self.user_id}, year={self.year}, version={self.version})>"
@@ -1,20 +1,41 @@
 """
 Body Measurement model - tracks physical measurements over time.
 """
-from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, Date
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from ...core.database import Base
+from ..search import search_vector_column
 
 
 class BodyMeasurement(Base):
     """Body measurement tracking."""
 
     __tablename__ = "body_measurements"
+    __table_args__ = (
+        # Covering index: "nearest measurement on or before a date" lookups
+        # are answered by an index-only scan
+        Index(
+            "ix_body_measurements_user_id_measurement_date",
+            "user_id",
+            "measurement_date",
+            postgresql_include=[
+                "id", "weight_kg", "body_fat_percentage", "muscle_mass_kg", "bmi",
+                "neck_cm", "chest_cm", "waist_cm", "abdomen_cm", "hips_cm",
+                "right_bicep_cm", "left_bicep_cm", "right_forearm_cm", "left_forearm_cm",
+                "right_thigh_cm", "left_thigh_cm", "right_calf_cm", "left_calf_cm",
+                "bicep_skinfold_mm", "tricep_skinfold_mm", "subscapular_skinfold_mm",
+                "suprailiac_skinfold_mm", "abdominal_skinfold_mm", "thigh_skinfold_mm",
+                "chest_skinfold_mm", "midaxillary_skinfold_mm",
+                "body_fat_jp3", "body_fat_jp7", "body_fat_dw",
+            ],
+        ),
+        Index("ix_body_measurements_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     measurement_date = Column(Date, nullable=False, index=True)
 
     # Basic metrics
@@ -49,10 +70,20 @@ class BodyMeasurement(Base):
     suprailiac_skinfold_mm = Column(Float, nullable=True)
     abdominal_skinfold_mm = Column(Float, nullable=True)
     thigh_skinfold_mm = Column(Float, nullable=True)
+    chest_skinfold_mm = Column(Float, nullable=True)
+    midaxillary_skinfold_mm = Column(Float, nullable=True)
+
+    # Body fat (%) estimated from skin folds - calculated, see src/shared/body_composition.py
+    body_fat_jp3 = Column(Float, nullable=True)  # Jackson-Pollock 3-site
+    body_fat_jp7 = Column(Float, nullable=True)  # Jackson-Pollock 7-site
+    body_fat_dw = Column(Float, nullable=True)  # Durnin-Womersley 4-site
 
     # Additional info
     notes = Column(Text, nullable=True)
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("notes", "B"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
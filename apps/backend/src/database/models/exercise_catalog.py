@@ -0,0 +1,61 @@
+"""
+Exercise catalog models - canonical exercises and their aliases.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from ...core.database import Base
+
+
+class ExerciseCatalog(Base):
+    """Canonical exercise."""
+
+    __tablename__ = "exercise_catalog"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(200), nullable=False)
+    exercise_key = Column(String(200), unique=True, nullable=False)  # Normalized name
+    exercise_type = Column(String(50), nullable=True)  # compound, isolation, cardio
+    muscle_group = Column(String(50), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    aliases = relationship(
+        "ExerciseAlias", back_populates="exercise", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    def __repr__(self):
+        return f"<ExerciseCatalog(id={self.id}, name='{self.name}')>"
+
+
+class ExerciseAlias(Base):
+    """
+    Alternative name of a catalog exercise (other languages, abbreviations).
+
+    The canonical name is stored as an alias too, so lookups only need
+    this table. alias_key carries a pg_trgm GIN index for fuzzy matching.
+    """
+
+    __tablename__ = "exercise_aliases"
+    __table_args__ = (
+        Index(
+            "ix_exercise_aliases_alias_key_trgm",
+            "alias_key",
+            postgresql_using="gin",
+            postgresql_ops={"alias_key": "gin_trgm_ops"},
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    catalog_id = Column(Integer, ForeignKey("exercise_catalog.id", ondelete="CASCADE"), nullable=False, index=True)
+    alias = Column(String(200), nullable=False)
+    alias_key = Column(String(200), unique=True, nullable=False)  # Normalized alias
+
+    # Relationships
+    exercise = relationship("ExerciseCatalog", back_populates="aliases")
+
+    def __repr__(self):
+        return f"<ExerciseAlias(catalog_id={self.catalog_id}, alias='{self.alias}')>"
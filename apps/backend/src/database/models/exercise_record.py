@@ -0,0 +1,49 @@
+"""
+Exercise record model - per-user personal records for each exercise.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, UniqueConstraint
+from datetime import datetime
+
+from ...core.database import Base
+
+
+class ExerciseRecord(Base):
+    """
+    Personal bests for one exercise, maintained incrementally on workout writes.
+
+    One row per (user, normalized exercise name), so PR checks are a single
+    unique-key lookup instead of a scan over every workout.
+    """
+
+    __tablename__ = "exercise_records"
+    __table_args__ = (
+        UniqueConstraint("user_id", "exercise_key", name="uq_exercise_records_user_exercise"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    exercise_key = Column(String(200), nullable=False)  # Normalized name
+    exercise_name = Column(String(200), nullable=False)  # Display name (last used)
+
+    # Bests
+    max_weight_kg = Column(Float, nullable=True)
+    max_weight_date = Column(Date, nullable=True)
+    best_e1rm_kg = Column(Float, nullable=True)  # Epley
+    best_e1rm_date = Column(Date, nullable=True)
+    best_e1rm_brzycki_kg = Column(Float, nullable=True)
+    best_volume_kg = Column(Float, nullable=True)  # sets x reps x weight in one entry
+    best_volume_date = Column(Date, nullable=True)
+
+    # Totals
+    total_volume_kg = Column(Float, default=0, nullable=False)
+    total_sets = Column(Integer, default=0, nullable=False)
+    session_count = Column(Integer, default=0, nullable=False)
+    first_performed = Column(Date, nullable=True)
+    last_performed = Column(Date, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ExerciseRecord(user_id={self.user_id}, exercise='{self.exercise_key}', e1rm={self.best_e1rm_kg}kg)>"
@@ -1,20 +1,24 @@
 """
 Goal model - track user fitness goals.
 """
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date, Boolean
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from ...core.database import Base
+from ..search import search_vector_column
 
 
 class Goal(Base):
     """User fitness goal."""
 
     __tablename__ = "goals"
+    __table_args__ = (
+        Index("ix_goals_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Goal info
     goal_type = Column(String(50), nullable=False)  # weight_loss, muscle_gain, endurance, strength, etc.
@@ -41,6 +45,9 @@ class Goal(Base):
     current_progress = Column(Float, nullable=True)  # Percentage or value
     notes = Column(Text, nullable=True)
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("title", "A"), ("description", "B"), ("notes", "C"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,21 +1,30 @@
 """
 Meal model - track nutrition and meals.
+
+The meals table is range-partitioned by month on meal_date (see
+src/database/partitions.py), so meal_date is part of the primary key.
 """
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date, Time
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date, Time, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from ...core.database import Base
+from ..search import search_vector_column
 
 
 class Meal(Base):
     """Meal tracking."""
 
     __tablename__ = "meals"
-
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    meal_date = Column(Date, nullable=False, index=True)
+    __table_args__ = (
+        Index("ix_meals_user_id_meal_date", "user_id", "meal_date"),
+        Index("ix_meals_search_vector", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (meal_date)"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    meal_date = Column(Date, primary_key=True, nullable=False, index=True)
     meal_time = Column(Time, nullable=True)
 
     # Meal info
@@ -36,6 +45,9 @@ class Meal(Base):
     # Notes
     notes = Column(Text, nullable=True)
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("meal_name", "A"), ("description", "B"), ("notes", "C"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,20 +1,24 @@
 """
 Progress Photo model - stores progress photos for visual tracking.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from ...core.database import Base
+from ..search import search_vector_column
 
 
 class ProgressPhoto(Base):
     """Progress photo tracking."""
 
     __tablename__ = "progress_photos"
+    __table_args__ = (
+        Index("ix_progress_photos_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     photo_date = Column(Date, nullable=False, index=True)
 
     # Photo info
@@ -26,6 +30,9 @@ class ProgressPhoto(Base):
     weight_at_photo_kg = Column(Integer, nullable=True)
     notes = Column(Text, nullable=True)
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("notes", "B"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
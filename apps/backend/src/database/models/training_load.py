@@ -0,0 +1,41 @@
+"""
+Training load model - daily load with acute/chronic moving averages.
+"""
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Date, UniqueConstraint
+from datetime import datetime
+
+from ...core.database import Base
+
+
+class TrainingLoad(Base):
+    """
+    Training load of one user on one day, maintained incrementally on workout writes.
+
+    Rows exist only for days with workouts. acute_load and chronic_load are
+    the exponentially weighted averages (7 and 28 day spans) as of the end
+    of that day; values for later days without rows decay geometrically.
+    """
+
+    __tablename__ = "training_loads"
+    __table_args__ = (
+        UniqueConstraint("user_id", "load_date", name="uq_training_loads_user_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    load_date = Column(Date, nullable=False)
+
+    # Day totals
+    load = Column(Float, nullable=False, default=0)  # Duration x intensity factor (arbitrary units)
+    tonnage_kg = Column(Float, nullable=False, default=0)  # Sets x reps x weight
+    workout_count = Column(Integer, nullable=False, default=0)
+
+    # Exponentially weighted averages of load
+    acute_load = Column(Float, nullable=False, default=0)
+    chronic_load = Column(Float, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<TrainingLoad(user_id={self.user_id}, date='{self.load_date}', load={self.load})>"
@@ -35,11 +35,23 @@ class User(Base):
     last_login = Column(DateTime, nullable=True)
 
     # Relationships
-    body_measurements = relationship("BodyMeasurement", back_populates="user", cascade="all, delete-orphan")
-    progress_photos = relationship("ProgressPhoto", back_populates="user", cascade="all, delete-orphan")
-    workouts = relationship("Workout", back_populates="user", cascade="all, delete-orphan")
-    meals = relationship("Meal", back_populates="user", cascade="all, delete-orphan")
-    goals = relationship("Goal", back_populates="user", cascade="all, delete-orphan")
+    body_measurements = relationship(
+        "BodyMeasurement", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    progress_photos = relationship(
+        "ProgressPhoto", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    workouts = relationship(
+        "Workout", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    meals = relationship(
+        "Meal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    goals = relationship(
+        "Goal", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    summary = relationship("UserSummary", uselist=False, viewonly=True)  # Maintained by UserSummaryService
+    streak = relationship("WorkoutStreak", uselist=False, viewonly=True)  # Maintained by StreakService
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', name='{self.full_name}')>"
@@ -0,0 +1,42 @@
+"""
+User summary model - per-user totals maintained at write time.
+"""
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Date
+from datetime import datetime
+
+from ...core.database import Base
+
+
+class UserSummary(Base):
+    """
+    Totals across a user's data, updated in the same transaction as every
+    service write so reading them is a primary-key lookup.
+    """
+
+    __tablename__ = "user_summaries"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # Body measurements
+    measurement_count = Column(Integer, nullable=False, default=0)
+    first_measurement_date = Column(Date, nullable=True)
+    first_weight_kg = Column(Float, nullable=True)
+    last_measurement_date = Column(Date, nullable=True)
+    last_weight_kg = Column(Float, nullable=True)
+
+    # Training and nutrition
+    workout_count = Column(Integer, nullable=False, default=0)
+    total_workout_minutes = Column(Integer, nullable=False, default=0)
+    meal_count = Column(Integer, nullable=False, default=0)
+    progress_photo_count = Column(Integer, nullable=False, default=0)
+
+    # Goals
+    goal_count = Column(Integer, nullable=False, default=0)
+    active_goal_count = Column(Integer, nullable=False, default=0)
+    completed_goal_count = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<UserSummary(user_id={self.user_id}, workouts={self.workout_count}, meals={self.meal_count})>"
@@ -1,20 +1,24 @@
 """
 Workout and Exercise models - track training sessions.
 """
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from ...core.database import Base
+from ..search import search_vector_column
 
 
 class Workout(Base):
     """Workout session."""
 
     __tablename__ = "workouts"
+    __table_args__ = (
+        Index("ix_workouts_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     workout_date = Column(Date, nullable=False, index=True)
 
     # Workout info
@@ -27,13 +31,16 @@ class Workout(Base):
     intensity = Column(String(20), nullable=True)  # low, medium, high
     feeling = Column(String(20), nullable=True)  # great, good, ok, tired, exhausted
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("workout_type", "A"), ("notes", "B"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="workouts")
-    exercises = relationship("Exercise", back_populates="workout", cascade="all, delete-orphan")
+    exercises = relationship("Exercise", back_populates="workout", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Workout(id={self.id}, user_id={self.user_id}, date='{self.workout_date}', type='{self.workout_type}')>"
@@ -43,9 +50,13 @@ class Exercise(Base):
     """Exercise within a workout."""
 
     __tablename__ = "exercises"
+    __table_args__ = (
+        Index("ix_exercises_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=False, index=True)
+    workout_id = Column(Integer, ForeignKey("workouts.id", ondelete="CASCADE"), nullable=False, index=True)
+    catalog_id = Column(Integer, ForeignKey("exercise_catalog.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Exercise details
     exercise_name = Column(String(200), nullable=False)
@@ -67,11 +78,15 @@ class Exercise(Base):
     # Notes
     notes = Column(Text, nullable=True)
 
+    # Full-text search (generated)
+    search_vector = search_vector_column(("exercise_name", "A"), ("notes", "B"))
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     workout = relationship("Workout", back_populates="exercises")
+    catalog_exercise = relationship("ExerciseCatalog")
 
     def __repr__(self):
         return f"<Exercise(id={self.id}, name='{self.exercise_name}', sets={self.sets}, reps={self.reps}, weight={self.weight_kg}kg)>"
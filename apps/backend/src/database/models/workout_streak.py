@@ -0,0 +1,40 @@
+"""
+Workout streak model - denormalized consistency counters per user.
+"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Date
+from datetime import datetime
+
+from ...core.database import Base
+
+
+class WorkoutStreak(Base):
+    """
+    Streak state of one user, maintained on workout writes.
+
+    Streaks count consecutive calendar days with at least one workout.
+    Values are as of last_workout_date; readers decide whether the current
+    streak is still alive and which week the counts belong to.
+    """
+
+    __tablename__ = "workout_streaks"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # Streaks (days)
+    current_streak = Column(Integer, nullable=False, default=0)
+    current_streak_start = Column(Date, nullable=True)
+    longest_streak = Column(Integer, nullable=False, default=0)
+    longest_streak_start = Column(Date, nullable=True)
+    last_workout_date = Column(Date, nullable=True)
+    total_workout_days = Column(Integer, nullable=False, default=0)
+
+    # Workouts in the week (Monday-based) of last_workout_date and the week before
+    week_start = Column(Date, nullable=True)
+    week_count = Column(Integer, nullable=False, default=0)
+    previous_week_count = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<WorkoutStreak(user_id={self.user_id}, current={self.current_streak}, longest={self.longest_streak})>"
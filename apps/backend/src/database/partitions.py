@@ -0,0 +1,182 @@
+"""
+Partition management for time-range partitioned tables.
+
+The meals table is declaratively partitioned by month on meal_date.
+Each month lives in its own partition named ``meals_pYYYYMM`` and a
+``meals_default`` partition catches rows outside every defined range,
+so inserts never fail while future partitions are still missing.
+"""
+import re
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+MEALS_TABLE = "meals"
+MEALS_DEFAULT_PARTITION = "meals_default"
+
+# Arbitrary constant used to serialize partition DDL across workers
+PARTITION_LOCK_KEY = 7_311_026
+
+_PARTITION_NAME_RE = re.compile(r"^meals_p(\d{4})(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    """Return the first day of the month containing value."""
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Return the first day of the month `months` after value's month."""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def meal_partition_name(month: date) -> str:
+    """Partition name for the month containing `month`."""
+    return f"{MEALS_TABLE}_p{month.year:04d}{month.month:02d}"
+
+
+def _lock(conn: Connection) -> None:
+    """Take a transaction-scoped advisory lock for partition DDL."""
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+
+def ensure_default_meal_partition(conn: Connection) -> None:
+    """Create the default partition if it does not exist."""
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {MEALS_DEFAULT_PARTITION} "
+        f"PARTITION OF {MEALS_TABLE} DEFAULT"
+    ))
+
+
+def list_meal_partitions(conn: Connection) -> List[date]:
+    """Return the months that currently have an attached partition, oldest first."""
+    rows = conn.execute(text(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = :parent
+        """
+    ), {"parent": MEALS_TABLE}).scalars().all()
+
+    months = []
+    for name in rows:
+        match = _PARTITION_NAME_RE.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def create_meal_partition(conn: Connection, month: date) -> bool:
+    """
+    Create the partition for a single month.
+
+    Rows for that month already sitting in the default partition are moved
+    into the new partition before it is attached, otherwise PostgreSQL would
+    refuse to create it.
+
+    Returns:
+        True if a partition was created, False if it already existed
+    """
+    month = month_start(month)
+    name = meal_partition_name(month)
+    exists = conn.execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ).scalar()
+    if exists:
+        return False
+
+    bounds = {"start": month, "end": add_months(month, 1)}
+    conn.execute(text(
+        f"CREATE TABLE {name} (LIKE {MEALS_TABLE} "
+        "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)"
+    ))
+    # Generated columns (search_vector) are recomputed on insert
+    columns = ", ".join(conn.execute(text(
+        """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = :table AND is_generated = 'NEVER'
+        ORDER BY ordinal_position
+        """
+    ), {"table": MEALS_TABLE}).scalars().all())
+    conn.execute(text(
+        f"""
+        WITH moved AS (
+            DELETE FROM {MEALS_DEFAULT_PARTITION}
+            WHERE meal_date >= :start AND meal_date < :end
+            RETURNING *
+        )
+        INSERT INTO {name} ({columns}) SELECT {columns} FROM moved
+        """
+    ), bounds)
+    conn.execute(text(
+        f"ALTER TABLE {MEALS_TABLE} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+    ))
+    return True
+
+
+def ensure_meal_partitions(
+    conn: Connection,
+    months_ahead: int = 3,
+    start: Optional[date] = None,
+) -> List[str]:
+    """
+    Make sure partitions exist from `start` (default: current month)
+    through `months_ahead` months in the future.
+
+    Safe to call concurrently from several workers.
+
+    Returns:
+        Names of partitions that were created
+    """
+    _lock(conn)
+    ensure_default_meal_partition(conn)
+
+    first = month_start(start or date.today())
+    last = add_months(month_start(date.today()), months_ahead)
+
+    created = []
+    month = first
+    while month <= last:
+        if create_meal_partition(conn, month):
+            created.append(meal_partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def detach_old_meal_partitions(
+    conn: Connection,
+    retain_months: int,
+    archive_schema: Optional[str] = "archive",
+) -> List[str]:
+    """
+    Detach partitions that end before the retention window.
+
+    Detached partitions become plain tables; when archive_schema is given
+    they are moved into that schema so they can be dumped or dropped later
+    without touching the live table.
+
+    Returns:
+        Names of partitions that were detached
+    """
+    _lock(conn)
+    cutoff = add_months(month_start(date.today()), -retain_months)
+
+    if archive_schema:
+        conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+
+    detached = []
+    for month in list_meal_partitions(conn):
+        if add_months(month, 1) > cutoff:
+            continue
+        name = meal_partition_name(month)
+        conn.execute(text(f"ALTER TABLE {MEALS_TABLE} DETACH PARTITION {name}"))
+        if archive_schema:
+            conn.execute(text(f'ALTER TABLE {name} SET SCHEMA "{archive_schema}"'))
+        detached.append(name)
+    return detached
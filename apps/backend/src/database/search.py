@@ -0,0 +1,41 @@
+"""
+Full-text search column helpers.
+
+Searchable tables carry a stored generated `search_vector` tsvector column
+with a GIN index. Each document is indexed with both the Portuguese and the
+English configuration, so a query matches whichever stemming the user's
+wording needs.
+"""
+from typing import Tuple
+
+from sqlalchemy import Column, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+
+SEARCH_CONFIGS = ("portuguese", "english")
+
+
+def search_vector_sql(*weighted_columns: Tuple[str, str]) -> str:
+    """
+    Build the generated column expression.
+
+    Args:
+        weighted_columns: (column name, weight A-D) pairs
+
+    Returns:
+        SQL expression producing the combined tsvector
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({column}, '')), '{weight}')"
+        for config in SEARCH_CONFIGS
+        for column, weight in weighted_columns
+    )
+
+
+def search_vector_column(*weighted_columns: Tuple[str, str]):
+    """
+    Deferred generated tsvector column.
+
+    Deferred so regular ORM loads do not fetch the vector.
+    """
+    return deferred(Column(TSVECTOR, Computed(search_vector_sql(*weighted_columns), persisted=True)))
@@ -1,13 +1,22 @@
 """
 EvolucaoFit API - Main application file.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import structlog
 
 from .core.config import get_settings
-from .core.database import init_db
+from .core.database import dispose_engine, get_engine, prewarm_pool
+from .core.memory import MemoryProfilingMiddleware, set_tracing
+from .core.metrics import MetricsMiddleware, instrument_engine, metrics_response
+from .core.profiler import ProfilingMiddleware
+from .core.query_monitor import QueryMonitorMiddleware
+from .core.traffic_capture import TrafficCaptureMiddleware
+from .database.partitions import ensure_meal_partitions
 from .api.routes import (
     auth_router,
     body_measurements_router,
@@ -16,12 +25,55 @@ from .api.routes import (
     meals_router,
     goals_router,
     progress_photos_router,
-    admin_router
+    admin_router,
+    analytics_router,
+    dashboard_router,
+    exercises_router,
+    search_router,
+    activity_router
 )
 
 settings = get_settings()
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the database engine and warm up on startup; release it on shutdown."""
+    logger.info("Starting EvolucaoFit API", version=settings.APP_VERSION)
+
+    if settings.MEMORY_TRACING_ENABLED:
+        set_tracing(True, settings.MEMORY_TRACING_FRAMES)
+
+    engine = get_engine()
+    if settings.ENABLE_METRICS:
+        instrument_engine(engine)
+
+    # Database tables will be created manually or via migrations
+    # (init_db() is not run to avoid permission issues on managed PostgreSQL)
+
+    # Keep future meal partitions ahead of incoming writes
+    try:
+        with engine.begin() as conn:
+            created = ensure_meal_partitions(conn, settings.MEAL_PARTITION_MONTHS_AHEAD)
+        if created:
+            logger.info("Created meal partitions", partitions=created)
+    except Exception as e:
+        logger.warning("Could not ensure meal partitions", error=str(e))
+
+    # Open pooled connections in the background; startup does not wait for them
+    prewarm = None
+    if settings.DB_POOL_PREWARM:
+        prewarm = asyncio.get_running_loop().run_in_executor(None, prewarm_pool, settings.DB_POOL_PREWARM)
+
+    yield
+
+    logger.info("Shutting down EvolucaoFit API")
+    if prewarm is not None:
+        await prewarm
+    dispose_engine()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -29,6 +81,7 @@ app = FastAPI(
     description="API for tracking fitness progress",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -40,6 +93,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request query tracking (no-op while the query monitor is disabled)
+app.add_middleware(QueryMonitorMiddleware)
+
+# Per-request opt-in profiling (X-Profile header)
+if settings.PROFILING_HEADER_TOKEN:
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.PROFILING_HEADER_TOKEN,
+        interval=settings.PROFILER_INTERVAL_MS / 1000
+    )
+
+# Request metadata capture for replay benchmarks
+if settings.TRAFFIC_CAPTURE_DIR:
+    app.add_middleware(
+        TrafficCaptureMiddleware,
+        directory=settings.TRAFFIC_CAPTURE_DIR,
+        sample_rate=settings.TRAFFIC_CAPTURE_SAMPLE_RATE,
+        user_buckets=settings.TRAFFIC_CAPTURE_USER_BUCKETS,
+        key=settings.JWT_SECRET_KEY
+    )
+
+# Prometheus metrics
+if settings.ENABLE_METRICS:
+    app.add_middleware(MemoryProfilingMiddleware)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", tags=["Health"], include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics endpoint."""
+        return metrics_response()
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -73,25 +157,11 @@ app.include_router(meals_router, prefix="/v1")
 app.include_router(goals_router, prefix="/v1")
 app.include_router(progress_photos_router, prefix="/v1")
 app.include_router(admin_router, prefix="/v1")
-
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    logger.info("Starting EvolucaoFit API", version=settings.APP_VERSION)
-
-    # Database tables will be created manually or via migrations
-    # Commented out to avoid permission issues on managed PostgreSQL
-    # logger.info("Initializing database tables...")
-    # init_db()
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    logger.info("Shutting down EvolucaoFit API")
+app.include_router(analytics_router, prefix="/v1")
+app.include_router(dashboard_router, prefix="/v1")
+app.include_router(exercises_router, prefix="/v1")
+app.include_router(search_router, prefix="/v1")
+app.include_router(activity_router, prefix="/v1")
 
 
 # Global exception handler
@@ -0,0 +1,80 @@
+"""
+Time-series downsampling helpers.
+
+Both algorithms take x (e.g. date ordinals) and y as 1-D NumPy arrays
+sorted by x and return at most `threshold` points, so chart payloads stay
+bounded no matter how long the history is.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously selected point
+    and the average of the next bucket. This preserves peaks and dips that
+    plain averaging would flatten.
+
+    The selection is inherently sequential across buckets, but all work
+    inside a bucket and the bucket averages are vectorized, so the Python
+    loop runs `threshold` times regardless of the input size.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # threshold - 2 buckets covering points 1..n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    # Average of the bucket following each bucket (the last one looks at the final point)
+    next_lo = np.append(edges[1:-1], n - 1)
+    next_hi = np.append(edges[2:], n)
+    cum_x = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+    counts = next_hi - next_lo
+    avg_x = (cum_x[next_hi] - cum_x[next_lo]) / counts
+    avg_y = (cum_y[next_hi] - cum_y[next_lo]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for bucket in range(threshold - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        ax, ay = x[anchor], y[anchor]
+        areas = np.abs(
+            (ax - avg_x[bucket]) * (y[lo:hi] - ay)
+            - (ax - x[lo:hi]) * (avg_y[bucket] - ay)
+        )
+        anchor = lo + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    return x[selected], y[selected]
+
+
+def bucket_average(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample by averaging points into `threshold` equal-width x buckets.
+
+    Empty buckets are dropped, so the result can be shorter than threshold.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 1:
+        return x, y
+
+    span = x[-1] - x[0]
+    if span == 0:
+        return x[:1].astype(np.float64), np.array([y.mean()])
+
+    buckets = np.minimum(((x - x[0]) / span * threshold).astype(np.int64), threshold - 1)
+    counts = np.bincount(buckets, minlength=threshold)
+    sum_x = np.bincount(buckets, weights=x, minlength=threshold)
+    sum_y = np.bincount(buckets, weights=y, minlength=threshold)
+
+    filled = counts > 0
+    return sum_x[filled] / counts[filled], sum_y[filled] / counts[filled]
@@ -0,0 +1,13 @@
+"""
+Text normalization helpers.
+"""
+
+
+def normalize_exercise_name(name: str) -> str:
+    """
+    Normalize an exercise name into a lookup key.
+
+    Lowercases and collapses whitespace, so "Supino  Reto" and "supino reto"
+    share a key.
+    """
+    return " ".join(name.lower().split())
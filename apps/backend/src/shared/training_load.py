@@ -0,0 +1,70 @@
+"""
+Exponentially weighted training load averages.
+
+Loads are aggregated per calendar day and smoothed with
+E[d] = alpha * L[d] + (1 - alpha) * E[d - 1], alpha = 2 / (span + 1).
+Days without training have L = 0, so across a gap of g empty days an
+average simply decays by (1 - alpha) ** g. Because the recurrence is
+linear, changing one day's load by delta changes every later average by
+alpha * delta * (1 - alpha) ** (days later), which is what lets the
+service update averages incrementally.
+
+NumPy is imported by the functions that need it, so the services can use
+the constants below without paying for it at startup.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ACUTE_SPAN_DAYS = 7
+CHRONIC_SPAN_DAYS = 28
+
+
+def ewma_alpha(span_days: int) -> float:
+    """Smoothing factor for a span in days."""
+    return 2.0 / (span_days + 1)
+
+
+def daily_ewma(loads: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    EWMA along the last axis of a dense (series x days) load matrix.
+
+    The loop runs once per day; each step updates every series at once.
+    """
+    import numpy as np
+
+    loads = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+    result = np.empty_like(loads)
+    state = np.zeros(loads.shape[0])
+    decay = 1.0 - alpha
+    for day in range(loads.shape[1]):
+        state = alpha * loads[:, day] + decay * state
+        result[:, day] = state
+    return result
+
+
+def decay_fill(row_days: np.ndarray, row_values: np.ndarray, days: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Averages on every day in `days` from values stored on sparse days.
+
+    Args:
+        row_days: Sorted day ordinals that have a stored average
+        row_values: Stored averages on those days
+        days: Day ordinals to evaluate
+        alpha: Smoothing factor the averages were computed with
+
+    Returns:
+        The latest stored average on or before each day, decayed to that
+        day (0 before the first stored day)
+    """
+    import numpy as np
+
+    idx = np.searchsorted(row_days, days, side="right") - 1
+    has = idx >= 0
+    safe = np.where(has, idx, 0)
+    gap = days - row_days[safe] if len(row_days) else np.zeros(len(days))
+    values = row_values[safe] if len(row_values) else np.zeros(len(days))
+    return np.where(has, values * np.power(1.0 - alpha, gap), 0.0)
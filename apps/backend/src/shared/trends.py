@@ -0,0 +1,100 @@
+"""
+Vectorized trend statistics for irregularly sampled measurements.
+
+Every function works on a whole matrix at once: `days` is a 1-D array of
+day ordinals (sorted ascending, length n) and `values` is an (n, m) float
+array holding one column per metric, with NaN where a metric was not
+recorded. Results are 1-D arrays of length m, NaN when a metric has too
+little data.
+"""
+import numpy as np
+
+# Cap on observations used by the O(n^2) Theil-Sen estimator
+MAX_ROBUST_POINTS = 200
+
+
+def last_valid(days: np.ndarray, values: np.ndarray):
+    """Return (last value, last day) per column, ignoring NaN."""
+    valid = ~np.isnan(values)
+    n = len(days)
+    # Index of the last valid row per column (-1 when a column is empty)
+    idx = np.where(valid.any(axis=0), n - 1 - np.argmax(valid[::-1], axis=0), -1)
+    has = idx >= 0
+    safe = np.where(has, idx, 0)
+    cols = np.arange(values.shape[1])
+    latest = np.where(has, values[safe, cols], np.nan)
+    latest_day = np.where(has, days[safe], np.nan)
+    return latest, latest_day
+
+
+def trailing_mean(days: np.ndarray, values: np.ndarray, window_days: int) -> np.ndarray:
+    """
+    Mean of the observations within `window_days` calendar days up to and
+    including each column's last observation.
+    """
+    _, latest_day = last_valid(days, values)
+    in_window = (days[:, None] > latest_day[None, :] - window_days) & ~np.isnan(values)
+    counts = in_window.sum(axis=0)
+    sums = np.where(in_window, values, 0.0).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def ewma(days: np.ndarray, values: np.ndarray, halflife_days: float) -> np.ndarray:
+    """
+    Exponentially weighted trend value at each column's last observation.
+
+    Weights decay with calendar time rather than observation count, so
+    irregular logging does not distort the trend.
+    """
+    _, latest_day = last_valid(days, values)
+    valid = ~np.isnan(values)
+    age = latest_day[None, :] - days[:, None]
+    weights = np.where(valid, np.power(0.5, age / halflife_days), 0.0)
+    total = weights.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, (weights * np.where(valid, values, 0.0)).sum(axis=0) / total, np.nan)
+
+
+def linear_slope(days: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Least-squares slope per column, in units per day."""
+    valid = ~np.isnan(values)
+    x = np.where(valid, days[:, None].astype(np.float64), 0.0)
+    y = np.where(valid, values, 0.0)
+    n = valid.sum(axis=0)
+    sum_x = x.sum(axis=0)
+    sum_y = y.sum(axis=0)
+    sum_xy = (x * y).sum(axis=0)
+    sum_xx = (x * x).sum(axis=0)
+    denominator = n * sum_xx - sum_x ** 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = (n * sum_xy - sum_x * sum_y) / denominator
+    return np.where((n >= 2) & (denominator != 0), slope, np.nan)
+
+
+def theil_sen_slope(days: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Theil-Sen slope per column: the median of all pairwise slopes.
+
+    Robust to outliers such as a mistyped weigh-in. Uses at most the last
+    MAX_ROBUST_POINTS observations.
+    """
+    days = days[-MAX_ROBUST_POINTS:].astype(np.float64)
+    values = values[-MAX_ROBUST_POINTS:]
+
+    n = len(days)
+    if n < 2:
+        return np.full(values.shape[1], np.nan)
+
+    i, j = np.triu_indices(n, k=1)
+    dx = days[j] - days[i]
+    dy = values[j] - values[i]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slopes = dy / dx[:, None]
+    slopes[dx == 0] = np.nan
+
+    result = np.full(values.shape[1], np.nan)
+    has_pairs = ~np.isnan(slopes).all(axis=0)
+    if has_pairs.any():
+        result[has_pairs] = np.nanmedian(slopes[:, has_pairs], axis=0)
+    return result
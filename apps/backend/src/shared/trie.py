@@ -0,0 +1,38 @@
+"""
+Prefix trie for in-memory autocomplete.
+"""
+from typing import Any, Dict, List
+
+
+class PrefixTrie:
+    """
+    Prefix trie where every node keeps its first `max_results` values.
+
+    Lookups walk the prefix and return the precomputed list, so a query
+    costs O(len(prefix)) regardless of how many keys share the prefix.
+    Values keep insertion order, so insert the most relevant keys first.
+    """
+
+    __slots__ = ("_root", "max_results")
+
+    def __init__(self, max_results: int = 20):
+        self._root: Dict[str, Any] = {"values": []}
+        self.max_results = max_results
+
+    def insert(self, key: str, value: Any) -> None:
+        """Add value under key and every prefix of key."""
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {"values": []})
+            values = node["values"]
+            if len(values) < self.max_results and value not in values:
+                values.append(value)
+
+    def search(self, prefix: str, limit: int = 10) -> List[Any]:
+        """Return up to `limit` values whose key starts with prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node["values"][:limit]
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for API tests.
+
+Tests run against the database in DATABASE_URL (the backend container's
+database under `make test-backend`); each test registers its own user and
+deletes it afterwards.
+"""
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from src.core.database import SessionLocal, init_db
+from src.database.models import User
+from src.main import app
+
+TEST_PASSWORD = "Test12345!"
+
+
+@pytest.fixture(scope="session")
+def client():
+    try:
+        init_db()
+    except OperationalError as e:
+        pytest.skip(f"Database not available: {e}")
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Authorization headers of a freshly registered user."""
+    email = f"test-{uuid.uuid4().hex[:12]}@example.com"
+    response = client.post("/v1/auth/register", json={
+        "email": email, "password": TEST_PASSWORD, "full_name": "Test User", "height_cm": 180,
+    })
+    assert response.status_code == 201, response.text
+    response = client.post("/v1/auth/login", json={"email": email, "password": TEST_PASSWORD})
+    yield {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.email == email).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
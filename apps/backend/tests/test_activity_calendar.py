@@ -0,0 +1,38 @@
+"""Activity calendar rebuild."""
+from sqlalchemy import text
+
+from src.core.database import SessionLocal
+from src.database.models import ActivityCalendar
+from src.api.services.activity_calendar_service import ActivityCalendarService
+
+
+def test_rebuild_clears_years_without_activity(client, auth_headers):
+    response = client.post("/v1/workouts/", headers=auth_headers, json={
+        "workout_date": "2025-03-10", "workout_type": "cardio", "duration_minutes": 30, "exercises": [],
+    })
+    assert response.status_code == 201, response.text
+    user_id = client.get("/v1/users/me", headers=auth_headers).json()["id"]
+
+    db = SessionLocal()
+    try:
+        # Drift: the workout disappears without the calendar being updated
+        db.execute(text("DELETE FROM workouts WHERE user_id = :user_id"), {"user_id": user_id})
+        db.commit()
+        before = db.query(ActivityCalendar).filter_by(user_id=user_id, year=2025).one()
+        assert sum(before.workout_counts) == 1
+        version = before.version
+
+        ActivityCalendarService.rebuild(db, user_id)
+        db.commit()
+        db.expire_all()
+        after = db.query(ActivityCalendar).filter_by(user_id=user_id, year=2025).one()
+        assert sum(after.workout_counts) == 0
+        assert after.version == version + 1
+
+        # Already cleared: a second rebuild leaves it alone
+        ActivityCalendarService.rebuild(db, user_id)
+        db.commit()
+        db.expire_all()
+        assert db.get(ActivityCalendar, after.id).version == version + 1
+    finally:
+        db.close()
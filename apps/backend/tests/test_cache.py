@@ -0,0 +1,88 @@
+"""Data versions must never be reused across Redis outages."""
+import pytest
+import redis
+
+from src.core import cache
+
+
+class FakeRedis:
+    """The subset of redis.Redis used by the cache helpers."""
+
+    def __init__(self) -> None:
+        self.data = {}
+        self.down = False
+
+    def _check(self) -> None:
+        if self.down:
+            raise redis.ConnectionError("down")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def mget(self, *keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    def incr(self, key):
+        self._check()
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+    monkeypatch.setattr(cache, "_redis_down_until", 0.0)
+    monkeypatch.setattr(cache, "_bumps_lost", False)
+    return client
+
+
+def recover(monkeypatch, client: FakeRedis) -> None:
+    client.down = False
+    monkeypatch.setattr(cache, "_redis_down_until", 0.0)
+
+
+def test_version_changes_on_bump(fake_redis):
+    before = cache.get_user_data_version(1)
+    cache.bump_user_data_version(1)
+    assert cache.get_user_data_version(1) != before
+
+
+def test_outage_is_a_miss_with_unknown_version(fake_redis):
+    key = cache.user_cache_key("test", 1)
+    cache.cache_set(key, {"value": 1})
+    fake_redis.down = True
+
+    assert cache.cache_get(key) is None
+    assert cache.get_user_data_version(1) is None
+    assert cache.user_cache_key("test", 1) is None
+
+
+def test_bump_lost_in_outage_invalidates_old_versions(fake_redis, monkeypatch):
+    before = cache.get_user_data_version(1)
+    key = cache.user_cache_key("test", 1)
+    cache.cache_set(key, {"value": 1})
+
+    fake_redis.down = True
+    cache.bump_user_data_version(1)
+    recover(monkeypatch, fake_redis)
+
+    assert cache.get_user_data_version(1) != before
+    assert cache.cache_get(cache.user_cache_key("test", 1)) is None
+
+
+def test_redis_data_loss_does_not_reuse_versions(fake_redis):
+    cache.bump_user_data_version(1)
+    before = cache.get_user_data_version(1)
+    fake_redis.data.clear()
+    cache.bump_user_data_version(1)
+    assert cache.get_user_data_version(1) != before
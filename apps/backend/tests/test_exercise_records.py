@@ -0,0 +1,45 @@
+"""Exercise record lookups by names resolved through the catalog."""
+from datetime import date
+
+from src.core.database import SessionLocal
+from src.api.services.exercise_catalog_service import ExerciseCatalogService
+
+# Not an alias of "Bench Press", but trigram-similar to "Supino Reto"
+FUZZY_NAME = "Supino retto"
+
+
+def test_lookup_by_fuzzy_matched_name(client, auth_headers):
+    db = SessionLocal()
+    try:
+        index = ExerciseCatalogService.get_index(db)
+        assert "supino retto" not in index.aliases
+        catalog_id = ExerciseCatalogService.resolve_catalog_id(db, FUZZY_NAME)
+        assert catalog_id is not None
+    finally:
+        db.close()
+
+    response = client.post("/v1/workouts/", headers=auth_headers, json={
+        "workout_date": str(date.today()),
+        "workout_type": "strength",
+        "duration_minutes": 45,
+        "exercises": [{"exercise_name": FUZZY_NAME, "sets": 3, "reps": 5, "weight_kg": 100}],
+    })
+    assert response.status_code == 201, response.text
+
+    response = client.get("/v1/exercises/records/lookup", headers=auth_headers, params={"name": FUZZY_NAME})
+    assert response.status_code == 200, response.text
+    record = response.json()
+    assert record["exercise_key"] == index.entries[catalog_id]["exercise_key"]
+    assert record["max_weight_kg"] == 100
+
+    response = client.get("/v1/exercises/progression", headers=auth_headers, params={"name": FUZZY_NAME})
+    assert response.status_code == 200, response.text
+    assert len(response.json()["points"]) == 1
+
+    response = client.post("/v1/exercises/records/check", headers=auth_headers, json={
+        "exercise_name": FUZZY_NAME, "weight_kg": 90, "reps": 5, "sets": 1,
+    })
+    assert response.status_code == 200, response.text
+    check = response.json()
+    assert check["record"] is not None
+    assert not check["is_weight_pr"]
@@ -0,0 +1,32 @@
+"""Current user profile."""
+from datetime import date
+
+from sqlalchemy import event
+
+from src.core.database import get_engine
+
+
+def test_profile_includes_summary_and_streak_in_one_query(client, auth_headers):
+    response = client.post("/v1/workouts/", headers=auth_headers, json={
+        "workout_date": str(date.today()), "workout_type": "cardio", "duration_minutes": 30, "exercises": [],
+    })
+    assert response.status_code == 201, response.text
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(get_engine(), "before_cursor_execute", record)
+    try:
+        response = client.get("/v1/users/me", headers=auth_headers)
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", record)
+
+    assert response.status_code == 200, response.text
+    profile = response.json()
+    assert profile["summary"]["workout_count"] == 1
+    assert profile["summary"]["total_workout_minutes"] == 30
+    assert profile["streak"]["current_streak"] == 1
+    assert profile["streak"]["workouts_this_week"] == 1
+    assert len(statements) == 1